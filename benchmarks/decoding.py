@@ -0,0 +1,86 @@
+"""
+Compares the JSON backends of `goji.decoding` on a recorded search page of
+1000 issues, both decoding the page alone and decoding it into
+`SearchResults`, along with the typed msgspec path of `goji.structs`.
+
+    $ poetry run python benchmarks/decoding.py [--page PATH] [--repeat 20]
+
+A page recorded from another JIRA instance may be given with `--page`, for
+example the response of `/rest/api/2/search?maxResults=1000` saved with
+curl. Pages ending in `.gz` are decompressed.
+"""
+
+import argparse
+import gzip
+import sys
+import timeit
+from pathlib import Path
+
+# Allows running the benchmark from a checkout without installing goji
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from goji import decoding  # noqa: E402
+from goji.models import SearchResults  # noqa: E402
+from goji.structs import typed_search_decoder  # noqa: E402
+
+PAGE = Path(__file__).parent / 'search-page.json.gz'
+FIELDS = ['summary', 'creator', 'assignee', 'status', 'created', 'customfield_10000']
+
+
+def read_page(path: Path) -> bytes:
+    content = path.read_bytes()
+
+    if path.suffix == '.gz':
+        return gzip.decompress(content)
+
+    return content
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--page', type=Path, default=PAGE)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    page = read_page(args.page)
+    issues = len(decoding.json_loads()(page)['issues'])
+    print(f'Search page of {issues} issues, {len(page) / 1e6:.1f} MB')
+
+    for name in decoding.BACKENDS:
+        try:
+            decoding.load_backend(name)
+        except ImportError:
+            print(f'{name:>8}: not installed')
+            continue
+
+        loads = decoding.decode_json
+        decode = min(timeit.repeat(lambda: loads(page), number=1, repeat=args.repeat))
+        results = min(
+            timeit.repeat(
+                lambda: SearchResults.from_json(loads(page)),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        print(
+            f'{name:>8}: decode {decode * 1000:7.1f} ms, '
+            f'SearchResults {results * 1000:7.1f} ms'
+        )
+
+    try:
+        decoding.load_backend('msgspec')
+    except ImportError:
+        return
+
+    typed = typed_search_decoder(FIELDS)
+    if typed:
+        results = min(
+            timeit.repeat(lambda: typed(page, None), number=1, repeat=args.repeat)
+        )
+        print(
+            f'   typed: SearchResults {results * 1000:7.1f} ms ({len(FIELDS)} fields)'
+        )
+
+
+if __name__ == '__main__':
+    main()
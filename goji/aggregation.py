@@ -0,0 +1,173 @@
+"""
+Single pass aggregation of issues.
+
+A report commonly breaks down the same issues in several ways, by status
+and assignee, by label or by component. Rather than iterating the issues
+for every breakdown, an `Aggregation` is fed one issue at a time and
+`aggregate` feeds every aggregation from a single pass over the issues, so
+the issues of a search can be aggregated as they are fetched without being
+held in memory.
+
+Each group holds a count of its issues along with a running total and count
+of each measured numeric field, such as story points, so the memory used by
+an aggregation depends upon the amount of groups rather than issues.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+
+from goji.formatting import flatten
+from goji.models import ISSUE_FIELD_DECODERS, Issue, UserDetails
+
+# Fields holding a list of values, an issue is grouped under each value and
+# under none when the list is empty
+MULTI_VALUE_FIELDS = ('labels', 'components')
+
+GroupKey = Tuple[str, ...]
+
+
+class Accumulator(Protocol):
+    """
+    Consumes issues one at a time, such as an `Aggregation`.
+    """
+
+    @property
+    def fields(self) -> List[str]: ...
+
+    def add(self, issue: Issue) -> None: ...
+
+
+def field_value(issue: Issue, name: str) -> Any:
+    if name == 'key' or name in ISSUE_FIELD_DECODERS:
+        return getattr(issue, name)
+
+    return issue.customfields.get(name)
+
+
+def group_value(value: Any) -> str:
+    if isinstance(value, UserDetails):
+        return value.name
+
+    if isinstance(value, dict):
+        return flatten(value)
+
+    return str(value)
+
+
+def group_values(name: str, value: Any) -> List[str]:
+    """
+    Returns the groups of the given field value.
+    """
+
+    if value is None:
+        if name in MULTI_VALUE_FIELDS:
+            return []
+
+        if name == 'assignee':
+            return ['Unassigned']
+
+    if isinstance(value, list):
+        return [group_value(item) for item in value]
+
+    return [group_value(value)]
+
+
+def numeric_value(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+
+    return float(value)
+
+
+@dataclass(slots=True)
+class Measure:
+    total: float = 0
+    count: int = 0
+
+    def add(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+
+    @property
+    def average(self) -> Optional[float]:
+        if self.count == 0:
+            return None
+
+        return self.total / self.count
+
+
+@dataclass(slots=True)
+class Group:
+    count: int = 0
+    measures: List[Measure] = field(default_factory=list)
+
+
+class Aggregation:
+    """
+    Groups issues by the values of one or more fields, counting the issues
+    of each group and measuring the sum and average of numeric fields.
+    Grouping by several fields groups issues by each combination of their
+    values, an issue with several labels belongs to a group per label.
+    """
+
+    def __init__(self, group_by: Sequence[str], measures: Sequence[str] = ()):
+        self.group_by = tuple(group_by)
+        self.measures = tuple(measures)
+        self.groups: Dict[GroupKey, Group] = {}
+
+    @property
+    def fields(self) -> List[str]:
+        """
+        The issue fields read by the aggregation.
+        """
+
+        return list(dict.fromkeys(self.group_by + self.measures))
+
+    @property
+    def total(self) -> int:
+        return sum(group.count for group in self.groups.values())
+
+    def add(self, issue: Issue) -> None:
+        keys = product(
+            *(group_values(name, field_value(issue, name)) for name in self.group_by)
+        )
+        values = [numeric_value(field_value(issue, name)) for name in self.measures]
+
+        for key in keys:
+            group = self.groups.get(key)
+            if group is None:
+                group = Group(measures=[Measure() for _ in self.measures])
+                self.groups[key] = group
+
+            group.count += 1
+
+            for measure, value in zip(group.measures, values):
+                if value is not None:
+                    measure.add(value)
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[GroupKey, Group]]:
+        """
+        Returns the groups with the most issues, in order of their count and
+        then the order in which they were encountered.
+        """
+
+        count = lambda item: item[1].count
+
+        if n is None:
+            return sorted(self.groups.items(), key=count, reverse=True)
+
+        return heapq.nlargest(n, self.groups.items(), key=count)
+
+
+def aggregate(issues: Iterable[Issue], accumulators: Sequence[Accumulator]) -> None:
+    """
+    Feeds each issue to every accumulator in a single pass over the issues.
+    """
+
+    adders = [accumulator.add for accumulator in accumulators]
+
+    for issue in issues:
+        for add in adders:
+            add(issue)
@@ -0,0 +1,289 @@
+import asyncio
+import datetime
+from collections import deque
+from typing import AsyncGenerator, List, Optional
+from urllib.parse import urljoin
+
+from goji.client import check_response, decode_search_results, search_body
+from goji.decoding import response_json
+from goji.models import (
+    Attachment,
+    Comment,
+    Comments,
+    Issue,
+    IssueLinkType,
+    InternPool,
+    SearchResults,
+    Sprint,
+    Transition,
+    UserDetails,
+)
+from goji.ratelimit import RetryPolicy, TokenBucket, rate_limit_reset
+
+
+class AsyncJIRAClient(object):
+    """
+    An asyncio counterpart to `JIRAClient` built upon httpx, which is an
+    optional dependency and must be installed separately.
+
+        async with AsyncJIRAClient(base_url, auth=(email, password)) as client:
+            issue = await client.get_issue('GOJI-1')
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth=None,
+        max_connections: int = 10,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                'AsyncJIRAClient requires httpx to be installed'
+            ) from None
+
+        self.base_url = base_url
+        self.rest_base_url = urljoin(self.base_url, 'rest/api/2/')
+        self.auth = auth
+        self.retry = retry or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.session = httpx.AsyncClient(
+            auth=tuple(auth) if auth else None,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def __aenter__(self) -> 'AsyncJIRAClient':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
+
+    # Methods
+
+    def validate_response(self, response) -> None:
+        check_response(response)
+
+    async def request(self, method: str, url: str, idempotent: bool = True, **kwargs):
+        """
+        Performs a request, see `JIRAClient.request`. Waiting upon the rate
+        limiter and between retries does not block the event loop.
+        """
+
+        attempt = 0
+
+        while True:
+            if self.rate_limiter:
+                delay = self.rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            response = await self.session.request(method, url, **kwargs)
+
+            if (
+                self.rate_limiter
+                and response.headers.get('X-RateLimit-Remaining') == '0'
+            ):
+                reset = rate_limit_reset(response)
+                if reset:
+                    self.rate_limiter.pause(reset)
+
+            if not idempotent or not self.retry.should_retry(response, attempt):
+                return response
+
+            await response.aclose()
+            await asyncio.sleep(self.retry.delay(response, attempt))
+            attempt += 1
+
+    async def get(self, path: str, **kwargs):
+        url = urljoin(self.rest_base_url, path)
+        response = await self.request('GET', url, **kwargs)
+        self.validate_response(response)
+        return response
+
+    async def post(self, path: str, json):
+        url = urljoin(self.rest_base_url, path)
+
+        # Searching does not modify any state and is safe to retry
+        response = await self.request(
+            'POST', url, idempotent=path == 'search', json=json
+        )
+        self.validate_response(response)
+        return response
+
+    async def put(self, path: str, json):
+        url = urljoin(self.rest_base_url, path)
+        response = await self.request('PUT', url, json=json)
+        self.validate_response(response)
+        return response
+
+    @property
+    def username(self) -> Optional[str]:
+        if self.auth:
+            return self.auth[0]
+
+        return None
+
+    async def get_user(self) -> Optional[UserDetails]:
+        response = await self.get('myself', follow_redirects=False)
+        return UserDetails.from_json(response_json(response))
+
+    async def get_issue(self, issue_key: str) -> Issue:
+        response = await self.get('issue/%s' % issue_key)
+        return Issue.from_json(response_json(response))
+
+    async def get_issue_transitions(self, issue_key: str) -> List[Transition]:
+        response = await self.get(
+            'issue/%s/transitions' % issue_key, params={'expand': 'transitions.fields'}
+        )
+        return list(map(Transition.from_json, response_json(response)['transitions']))
+
+    async def change_status(self, issue_key: str, transition_id: str) -> None:
+        data = {'transition': {'id': transition_id}}
+        await self.post('issue/%s/transitions' % issue_key, data)
+
+    async def edit_issue(self, issue_key: str, updated_fields) -> None:
+        data = {'fields': updated_fields}
+        await self.put('issue/%s' % issue_key, data)
+
+    async def attach(self, issue_key: str, attachment) -> List[Attachment]:
+        import mimetypes
+
+        media_type = mimetypes.guess_type(attachment.name)
+        files = {
+            'file': (attachment.name, attachment, media_type[0]),
+        }
+        url = urljoin(self.rest_base_url, f'issue/{issue_key}/attachments')
+        response = await self.request(
+            'POST',
+            url,
+            idempotent=False,
+            headers={'X-Atlassian-Token': 'no-check'},
+            files=files,
+        )
+        self.validate_response(response)
+        return list(map(Attachment.from_json, response_json(response)))
+
+    async def get_issue_link_types(self) -> List[IssueLinkType]:
+        response = await self.get('issueLinkType')
+        return list(
+            map(IssueLinkType.from_json, response_json(response)['issueLinkTypes'])
+        )
+
+    async def link_issue(self, outward_issue: str, inward_issue: str, type: str):
+        data = {
+            'type': {
+                'name': type,
+            },
+            'inwardIssue': {
+                'key': inward_issue,
+            },
+            'outwardIssue': {
+                'key': outward_issue,
+            },
+        }
+        await self.post('issueLink', data)
+
+    async def create_issue(self, fields) -> Issue:
+        response = await self.post('issue', {'fields': fields})
+        return Issue.from_json(response_json(response))
+
+    async def assign(self, issue_key: str, name: Optional[str]) -> None:
+        await self.put('issue/%s/assignee' % issue_key, {'name': name})
+
+    async def comment(self, issue_key: str, comment: str) -> Comment:
+        response = await self.post('issue/%s/comment' % issue_key, {'body': comment})
+        return Comment.from_json(response_json(response))
+
+    async def comments(self, issue_key: str) -> Comments:
+        response = await self.get('issue/%s/comment' % issue_key)
+        return Comments.from_json(response_json(response))
+
+    async def search(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        start_at: Optional[int] = None,
+        pool: Optional[InternPool] = None,
+        lazy: bool = False,
+    ) -> SearchResults:
+        body = search_body(query, fields, max_results, start_at)
+        response = await self.post('search', body)
+        return decode_search_results(response, fields, pool, lazy)
+
+    async def search_all(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        concurrency: int = 1,
+        lazy: bool = False,
+    ) -> AsyncGenerator[Issue, None]:
+        """
+        Yields every issue matching the query, see `JIRAClient.search_all`.
+        """
+
+        pool = InternPool()
+        results = await self.search(
+            query, fields, max_results=max_results, pool=pool, lazy=lazy
+        )
+        for issue in results.issues:
+            yield issue
+
+        page_size = len(results.issues)
+        if page_size == 0:
+            return
+
+        offsets = iter(range(page_size, results.total, page_size))
+        pending: deque = deque()
+
+        def submit_next() -> None:
+            start_at = next(offsets, None)
+            if start_at is not None:
+                pending.append(
+                    asyncio.ensure_future(
+                        self.search(query, fields, page_size, start_at, pool, lazy)
+                    )
+                )
+
+        try:
+            for _ in range(max(concurrency, 1)):
+                submit_next()
+
+            while pending:
+                results = await pending.popleft()
+                submit_next()
+                for issue in results.issues:
+                    yield issue
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def create_sprint(
+        self,
+        board_id: int,
+        name: str,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None,
+    ) -> Sprint:
+        payload = {
+            'originBoardId': board_id,
+            'name': name,
+        }
+
+        if start_date:
+            payload['startDate'] = start_date.isoformat()
+
+        if end_date:
+            payload['endDate'] = end_date.isoformat()
+
+        url = urljoin(self.base_url, 'rest/agile/1.0/sprint')
+        response = await self.request('POST', url, idempotent=False, json=payload)
+        self.validate_response(response)
+        return Sprint.from_json(response_json(response))
@@ -4,8 +4,7 @@ from os import chmod, path
 from stat import S_IRUSR, S_IWUSR
 from textwrap import dedent
 from typing import Optional, Tuple
-
-from requests.compat import urlparse
+from urllib.parse import urlparse
 
 
 def get_credentials(base_url: str) -> Tuple[Optional[str], Optional[str]]:
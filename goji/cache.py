@@ -0,0 +1,281 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+DEFAULT_TTL = 300
+DEFAULT_MAX_SIZE = 50 * 1024 * 1024
+
+# Once the cache grows beyond its maximum size, entries are evicted until it
+# is within this fraction of the maximum so that following writes do not
+# each need to evict again
+EVICTION_RATIO = 0.9
+
+# Response headers persisted alongside the body, the validators are replayed
+# as conditional request headers once an entry expires.
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+# The issue a REST URL reads, such as `issue/GOJI-1/transitions`
+ISSUE_URL_PATTERN = re.compile(r'/issue/([^/]+)')
+
+
+def scope(url: str) -> str:
+    """
+    Returns the scope of the responses of a URL, the key of the issue read
+    or `search`, so that the entries which a write may change can be removed
+    without clearing the cache.
+    """
+
+    path = urlparse(url).path
+    if path.endswith('/search'):
+        return 'search'
+
+    match = ISSUE_URL_PATTERN.search(path)
+    if match:
+        return match.group(1).upper()
+
+    return 'other'
+
+
+def cache_directory() -> Path:
+    base = os.environ.get('XDG_CACHE_HOME')
+    if base:
+        return Path(base) / 'goji'
+
+    return Path.home() / '.cache' / 'goji'
+
+
+class CacheEntry:
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        headers: Dict[str, str],
+        content: str,
+        stored_at: float,
+    ):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.stored_at = stored_at
+
+    @classmethod
+    def from_response(cls, response) -> 'CacheEntry':
+        headers = {
+            name: response.headers[name]
+            for name in STORED_HEADERS
+            if name in response.headers
+        }
+        return cls(
+            response.url,
+            response.status_code,
+            headers,
+            response.content.decode('utf-8'),
+            time.time(),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CacheEntry':
+        return cls(
+            data['url'],
+            data['status_code'],
+            data['headers'],
+            data['content'],
+            data['stored_at'],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'url': self.url,
+            'status_code': self.status_code,
+            'headers': self.headers,
+            'content': self.content,
+            'stored_at': self.stored_at,
+        }
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+
+        if 'ETag' in self.headers:
+            headers['If-None-Match'] = self.headers['ETag']
+
+        if 'Last-Modified' in self.headers:
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+
+        return headers
+
+    def to_response(self):
+        from requests import Response
+        from requests.structures import CaseInsensitiveDict
+
+        response = Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = 'utf-8'
+        response._content = self.content.encode('utf-8')
+        return response
+
+
+class ResponseCache:
+    """
+    An on-disk cache of JIRA responses for a profile.
+
+    Entries are stored as a file per request. Fresh entries (younger than
+    `ttl` seconds) are served without contacting the server, expired entries
+    carrying an ETag or Last-Modified validator are revalidated with a
+    conditional request. The file modification time records the last access
+    and the least recently used entries are evicted once the cache grows
+    beyond `max_size` bytes.
+
+    Entries are keyed by the user making the request along with the
+    request, so that the responses of one account are never served to
+    another.
+    """
+
+    def __init__(
+        self,
+        profile: str,
+        ttl: int = DEFAULT_TTL,
+        max_size: int = DEFAULT_MAX_SIZE,
+        directory: Optional[Path] = None,
+    ):
+        self.profile = profile
+        self.ttl = ttl
+        self.max_size = max_size
+        self.directory = (directory or cache_directory() / 'http') / profile
+        # The size of the entries, measured on the first write and then
+        # tracked as entries are written
+        self.size: Optional[int] = None
+
+    def key(
+        self,
+        method: str,
+        url: str,
+        params=None,
+        body=None,
+        user: Optional[str] = None,
+    ) -> str:
+        material = json.dumps(
+            [self.profile, user, method, url, params, body], sort_keys=True
+        )
+        digest = hashlib.sha256(material.encode('utf-8')).hexdigest()
+        return f'{scope(url)}-{digest}'
+
+    def path(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self.path(key)
+
+        try:
+            with open(path) as fp:
+                entry = CacheEntry.from_dict(json.load(fp))
+        except (OSError, ValueError, KeyError):
+            return None
+
+        os.utime(path)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        content = json.dumps(entry.to_dict())
+
+        # An entry which would not fit in the cache is not stored, rather
+        # than evicting every other entry
+        if len(content) > self.max_size:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        temporary_path = path.with_suffix('.tmp')
+
+        with open(temporary_path, 'w') as fp:
+            fp.write(content)
+
+        try:
+            previous_size = path.stat().st_size
+        except OSError:
+            previous_size = 0
+
+        os.replace(temporary_path, path)
+
+        if self.size is None:
+            self.size = self.measure()
+        else:
+            self.size += path.stat().st_size - previous_size
+
+        if self.size > self.max_size:
+            self.evict(keep=path)
+
+    def revalidated(self, key: str, entry: CacheEntry) -> CacheEntry:
+        entry.stored_at = time.time()
+        self.set(key, entry)
+        return entry
+
+    def entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+
+        for path in self.directory.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        return entries
+
+    def measure(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: Optional[Path] = None) -> None:
+        """
+        Evicts the least recently used entries, other than `keep`, until the
+        cache is within `EVICTION_RATIO` of its maximum size.
+        """
+
+        entries = sorted(self.entries())
+        size = sum(entry_size for _, entry_size, _ in entries)
+        target = self.max_size * EVICTION_RATIO
+
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+
+            if path == keep:
+                continue
+
+            path.unlink(missing_ok=True)
+            size -= entry_size
+
+        self.size = size
+
+    def invalidate(self, issue_key: Optional[str] = None) -> None:
+        """
+        Removes the entries of the given issue along with every search, any
+        search may include the issue.
+        """
+
+        patterns = ['search-*.json']
+        if issue_key:
+            patterns.append(f'{issue_key.upper()}-*.json')
+
+        for pattern in patterns:
+            for path in self.directory.glob(pattern):
+                path.unlink(missing_ok=True)
+
+        self.size = None
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.size = None
@@ -1,24 +1,38 @@
 import datetime
-import mimetypes
-from typing import Any, Dict, Generator, List, Optional
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple
+from urllib.parse import urljoin
 
 import click
-import requests
-from requests.auth import AuthBase, HTTPBasicAuth
-from requests.compat import urljoin
 
+from goji.cache import CacheEntry, ResponseCache
+from goji.decoding import response_json
 from goji.models import (
     Attachment,
     Comment,
     Comments,
     Issue,
     IssueLinkType,
+    InternPool,
+    LazyIssue,
     SearchResults,
     Sprint,
     Transition,
     UserDetails,
+    server_fields,
 )
 
+if TYPE_CHECKING:
+    import requests
+
+    from goji.paging import PageSizer
+    from goji.ratelimit import RetryPolicy, TokenBucket
+
+# Size of the chunks read from streamed responses
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class JIRAException(click.ClickException):
     def __init__(self, status_code: int, error_messages: List[str], errors):
@@ -34,7 +48,72 @@ class JIRAException(click.ClickException):
             click.echo('- {}: {}'.format(key, error))
 
 
-class NoneAuth(AuthBase):
+def check_response(response) -> None:
+    """
+    Raises a JIRAException for an unsuccessful response, accepts any response
+    object exposing `status_code`, `headers` and `json()`.
+    """
+
+    if response.status_code < 400:
+        return
+
+    if 'application/json' in response.headers.get('Content-Type', ''):
+        error = response.json()
+        raise JIRAException(
+            response.status_code,
+            error.get('errorMessages', []),
+            error.get('errors', {}),
+        )
+
+    raise JIRAException(
+        response.status_code, [f'JIRA returned {response.status_code}'], {}
+    )
+
+
+def decode_search_results(
+    response, fields: Optional[List[str]], pool: Optional[InternPool], lazy: bool
+) -> SearchResults:
+    from goji.structs import typed_search_decoder
+
+    # Lazy issues only parse the fields which are read, which the typed
+    # decoder cannot do as it decodes every requested field up front
+    decode = None if lazy else typed_search_decoder(fields)
+    if decode:
+        return decode(response.content, pool)
+
+    return SearchResults.from_json(response_json(response), pool, lazy)
+
+
+def search_body(
+    query: str,
+    fields: Optional[List[str]] = None,
+    max_results: Optional[int] = None,
+    start_at: Optional[int] = None,
+) -> Dict[str, Any]:
+    body: Dict[str, Any] = {'jql': query}
+
+    if start_at:
+        body['startAt'] = start_at
+
+    if max_results is not None:
+        body['maxResults'] = max_results
+
+    # Fields may be given as the issue attributes the caller reads
+    if fields:
+        body['fields'] = server_fields(fields)
+
+    return body
+
+
+def shard_sizer(adaptive: bool) -> Optional['PageSizer']:
+    # The shards of a search are fetched from separate threads, each shard
+    # sizes its own pages rather than sharing the client's page sizers
+    from goji.paging import PageSizer
+
+    return PageSizer() if adaptive else None
+
+
+class NoneAuth(object):
     """
     Creates a "None" auth type as if actual None is set as auth and a netrc
     credentials are found, python-requests will use them instead.
@@ -45,72 +124,208 @@ class NoneAuth(AuthBase):
 
 
 class JIRAClient(object):
-    def __init__(self, base_url: str, auth=None):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        base_url: str,
+        auth=None,
+        cache: Optional[ResponseCache] = None,
+        retry: Optional['RetryPolicy'] = None,
+        rate_limiter: Optional['TokenBucket'] = None,
+    ):
         self.base_url = base_url
+        self.auth = auth
+        self.cache = cache
+        if retry is None:
+            from goji.ratelimit import RetryPolicy
+
+            retry = RetryPolicy()
+
+        self.retry = retry
+        self.rate_limiter = rate_limiter
         self.rest_base_url = urljoin(self.base_url, 'rest/api/2/')
+        self.page_sizers: Dict[Tuple[str, ...], 'PageSizer'] = {}
+        self.page_sizers_lock = threading.Lock()
+        self._session: Optional['requests.Session'] = None
 
-        if auth:
-            self.session.auth = HTTPBasicAuth(auth[0], auth[1])
-        else:
-            self.session.auth = NoneAuth()
+    @property
+    def session(self) -> 'requests.Session':
+        # requests is imported on first use as it is comparatively slow to
+        # import, and not every command talks to JIRA.
+        if self._session is None:
+            import requests
+            from requests.auth import HTTPBasicAuth
+
+            session = requests.Session()
+
+            if self.auth:
+                session.auth = HTTPBasicAuth(self.auth[0], self.auth[1])
+            else:
+                session.auth = NoneAuth()
+
+            self._session = session
+
+        return self._session
 
     # Methods
 
-    def validate_response(self, response: requests.Response) -> None:
-        if response.status_code < 400:
-            return
+    def validate_response(self, response: 'requests.Response') -> None:
+        check_response(response)
 
-        if 'application/json' in response.headers.get('Content-Type', ''):
-            error = response.json()
-            raise JIRAException(
-                response.status_code,
-                error.get('errorMessages', []),
-                error.get('errors', {}),
-            )
+    def request(
+        self, method: str, url: str, idempotent: bool = True, **kwargs
+    ) -> 'requests.Response':
+        """
+        Performs a request, waiting upon the rate limiter beforehand. Rate
+        limited or temporarily unavailable idempotent requests are retried
+        according to the retry policy.
+        """
 
-        raise JIRAException(
-            response.status_code, [f'JIRA returned {response.status_code}'], {}
-        )
+        attempt = 0
+
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            response = self.session.request(method, url, **kwargs)
+
+            if (
+                self.rate_limiter
+                and response.headers.get('X-RateLimit-Remaining') == '0'
+            ):
+                from goji.ratelimit import rate_limit_reset
+
+                reset = rate_limit_reset(response)
+                if reset:
+                    self.rate_limiter.pause(reset)
+
+            if not idempotent or not self.retry.should_retry(response, attempt):
+                return response
+
+            response.close()
+            self.retry.sleep(self.retry.delay(response, attempt))
+            attempt += 1
+
+    def get(self, path: str, cache: bool = True, **kwargs) -> 'requests.Response':
+        """
+        Performs a GET request, served from the cache unless `cache` is
+        false. Reads which are modified and written back bypass the cache so
+        that changes made by others are not overwritten.
+        """
 
-    def get(self, path: str, **kwargs) -> requests.Response:
         url = urljoin(self.rest_base_url, path)
-        response = self.session.get(url, **kwargs)
+
+        if self.cache and cache:
+            return self.cached_request('GET', url, **kwargs)
+
+        response = self.request('GET', url, **kwargs)
         self.validate_response(response)
         return response
 
-    def post(self, path: str, json) -> requests.Response:
+    def post(self, path: str, json, cache: bool = True) -> 'requests.Response':
+        """
+        Performs a POST request. Searches are cached unless `cache` is false,
+        any other request invalidates the cached responses it may change.
+        """
+
         url = urljoin(self.rest_base_url, path)
-        response = self.session.post(url, json=json)
+
+        # Searching does not modify any state and is safe to retry or cache
+        is_search = path == 'search'
+
+        if self.cache and is_search and cache:
+            return self.cached_request('POST', url, json=json)
+
+        if not is_search:
+            self.invalidate_cache(path)
+
+        response = self.request('POST', url, idempotent=is_search, json=json)
         self.validate_response(response)
         return response
 
-    def put(self, path: str, json) -> requests.Response:
+    def put(self, path: str, json) -> 'requests.Response':
         url = urljoin(self.rest_base_url, path)
-        response = self.session.put(url, json=json)
+        self.invalidate_cache(path)
+
+        response = self.request('PUT', url, json=json)
+        self.validate_response(response)
+        return response
+
+    def invalidate_cache(self, path: str) -> None:
+        """
+        Removes the cached responses which a write to the path may change.
+        Writing to an issue removes the responses of the issue and every
+        search, creating an issue removes every search, and any other write
+        clears the cache.
+        """
+
+        if not self.cache:
+            return
+
+        if path == 'issue':
+            self.cache.invalidate()
+        elif path.startswith('issue/'):
+            self.cache.invalidate(path.split('/')[1])
+        else:
+            self.cache.clear()
+
+    def cached_request(self, method: str, url: str, **kwargs) -> 'requests.Response':
+        assert self.cache
+        key = self.cache.key(
+            method, url, kwargs.get('params'), kwargs.get('json'), self.username
+        )
+        entry = self.cache.get(key)
+
+        if entry:
+            if entry.is_fresh(self.cache.ttl):
+                return entry.to_response()
+
+            kwargs['headers'] = entry.conditional_headers()
+
+        response = self.request(method, url, **kwargs)
+
+        if entry and response.status_code == 304:
+            return self.cache.revalidated(key, entry).to_response()
+
         self.validate_response(response)
+
+        if response.status_code == 200:
+            self.cache.set(key, CacheEntry.from_response(response))
+
         return response
 
     @property
     def username(self) -> Optional[str]:
-        if self.session.auth and isinstance(self.session.auth, HTTPBasicAuth):
-            return self.session.auth.username
+        if self.auth:
+            return self.auth[0]
 
         return None
 
     def get_user(self) -> Optional[UserDetails]:
         response = self.get('myself', allow_redirects=False)
-        return UserDetails.from_json(response.json())
+        return UserDetails.from_json(response_json(response))
 
-    def get_issue(self, issue_key: str) -> Issue:
-        response = self.get('issue/%s' % issue_key)
-        return Issue.from_json(response.json())
+    def get_time_zone(self) -> Optional[str]:
+        """
+        Returns the time zone of the user's profile, such as
+        `Australia/Sydney`.
+        """
+
+        response = self.get('myself', allow_redirects=False)
+        return response_json(response).get('timeZone')
 
-    def get_issue_transitions(self, issue_key: str) -> List[Transition]:
+    def get_issue(self, issue_key: str, cache: bool = True) -> Issue:
+        response = self.get('issue/%s' % issue_key, cache=cache)
+        return Issue.from_json(response_json(response))
+
+    def get_issue_transitions(
+        self, issue_key: str, cache: bool = True
+    ) -> List[Transition]:
         response = self.get(
-            'issue/%s/transitions' % issue_key, params={'expand': 'transitions.fields'}
+            'issue/%s/transitions' % issue_key,
+            cache=cache,
+            params={'expand': 'transitions.fields'},
         )
-        return list(map(Transition.from_json, response.json()['transitions']))
+        return list(map(Transition.from_json, response_json(response)['transitions']))
 
     def change_status(self, issue_key: str, transition_id: str) -> None:
         data = {'transition': {'id': transition_id}}
@@ -121,22 +336,30 @@ class JIRAClient(object):
         self.put('issue/%s' % issue_key, data)
 
     def attach(self, issue_key: str, attachment) -> List[Attachment]:
+        import mimetypes
+
         media_type = mimetypes.guess_type(attachment.name)
         files = {
             'file': (attachment.name, attachment, media_type[0]),
         }
         url = urljoin(self.rest_base_url, f'issue/{issue_key}/attachments')
-        response = self.session.post(
+        self.invalidate_cache(f'issue/{issue_key}/attachments')
+
+        response = self.request(
+            'POST',
             url,
+            idempotent=False,
             headers={'X-Atlassian-Token': 'no-check'},
             files=files,
         )
         self.validate_response(response)
-        return list(map(Attachment.from_json, response.json()))
+        return list(map(Attachment.from_json, response_json(response)))
 
     def get_issue_link_types(self) -> List[IssueLinkType]:
         response = self.get('issueLinkType')
-        return list(map(IssueLinkType.from_json, response.json()['issueLinkTypes']))
+        return list(
+            map(IssueLinkType.from_json, response_json(response)['issueLinkTypes'])
+        )
 
     def link_issue(self, outward_issue: str, inward_issue: str, type: str):
         data = {
@@ -154,18 +377,18 @@ class JIRAClient(object):
 
     def create_issue(self, fields) -> Issue:
         response = self.post('issue', {'fields': fields})
-        return Issue.from_json(response.json())
+        return Issue.from_json(response_json(response))
 
     def assign(self, issue_key: str, name: Optional[str]) -> None:
         self.put('issue/%s/assignee' % issue_key, {'name': name})
 
     def comment(self, issue_key: str, comment: str) -> Comment:
         response = self.post('issue/%s/comment' % issue_key, {'body': comment})
-        return Comment.from_json(response.json())
+        return Comment.from_json(response_json(response))
 
     def comments(self, issue_key: str) -> Comments:
         response = self.get('issue/%s/comment' % issue_key)
-        return Comments.from_json(response.json())
+        return Comments.from_json(response_json(response))
 
     def search(
         self,
@@ -173,41 +396,432 @@ class JIRAClient(object):
         fields: Optional[List[str]] = None,
         max_results: Optional[int] = None,
         start_at: Optional[int] = None,
+        pool: Optional[InternPool] = None,
+        lazy: bool = False,
+        cache: bool = True,
     ) -> SearchResults:
-        body: Dict[str, Any] = {'jql': query}
+        body = search_body(query, fields, max_results, start_at)
+        response = self.post('search', body, cache=cache)
+        return decode_search_results(response, fields, pool, lazy)
 
-        if start_at:
-            body['startAt'] = start_at
+    def page_sizer(self, fields: Optional[List[str]]) -> 'PageSizer':
+        """
+        Returns the page sizer for searches of the given fields, the sizes
+        learnt by one search are used by following searches of the fields.
+        """
 
-        if max_results is not None:
-            body['maxResults'] = max_results
+        from goji.paging import PageSizer
 
-        if fields:
-            body['fields'] = fields
+        key = tuple(sorted(fields or []))
 
-        response = self.post('search', body)
-        return SearchResults.from_json(response.json())
+        # Concurrent searches, such as those of `SharedSearch.load`, share
+        # the sizer of their fields
+        with self.page_sizers_lock:
+            if key not in self.page_sizers:
+                self.page_sizers[key] = PageSizer()
+
+            return self.page_sizers[key]
+
+    def search_pages(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        adaptive: bool = False,
+        keyset: bool = False,
+        shard_size: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yields the JSON of each page of search results, for consumers which
+        store or forward the issues as returned by JIRA. See `search_all`
+        regarding adaptive, keyset and sharded paging and caching. The pages
+        of a sharded search only hold the issues not yielded by a previous
+        shard. Only shards are fetched concurrently, a ValueError is raised
+        for a `concurrency` greater than one without a `shard_size`.
+        """
+
+        if concurrency > 1 and not shard_size:
+            raise ValueError('concurrency requires a shard_size')
+
+        if shard_size:
+            from goji.sharding import plan_shards
+            from goji.utils import prefetch_each
+
+            shards = plan_shards(self, query, shard_size)
+            pages = prefetch_each(
+                (
+                    self._search_json_pages(
+                        shard.query, fields, None, shard_sizer(adaptive), keyset
+                    )
+                    for shard in shards
+                ),
+                concurrency,
+            )
+            seen = set()
+
+            for page in pages:
+                issues = [issue for issue in page['issues'] if issue['key'] not in seen]
+                seen.update(issue['key'] for issue in issues)
+                yield dict(page, issues=issues)
+
+            return
+
+        sizer = self.page_sizer(fields) if adaptive and not max_results else None
+        yield from self._search_json_pages(query, fields, max_results, sizer, keyset)
+
+    def _search_json_pages(
+        self,
+        query: str,
+        fields: Optional[List[str]],
+        max_results: Optional[int],
+        sizer: Optional['PageSizer'],
+        keyset: bool,
+    ) -> Generator[Dict[str, Any], None, None]:
+        from goji.paging import Keyset
+
+        position = Keyset(query) if keyset else None
+        start_at = 0
+
+        while True:
+            page_size = sizer.size if sizer else max_results
+            if position:
+                body = search_body(position.query(), fields, page_size)
+            else:
+                body = search_body(query, fields, page_size, start_at)
+
+            started = time.monotonic()
+            response = self.post('search', body, cache=False)
+            elapsed = time.monotonic() - started
+            page = response_json(response)
+
+            if position:
+                # The total of a keyset page is the amount of issues remaining
+                position.advance(issue['key'] for issue in page['issues'])
+                start_at = len(page['issues'])
+            else:
+                start_at += len(page['issues'])
+
+            if sizer and page_size:
+                sizer.record(
+                    page_size,
+                    len(page['issues']),
+                    page.get('maxResults'),
+                    elapsed,
+                    len(response.content),
+                )
+
+            yield page
+
+            if len(page['issues']) == 0 or start_at >= page['total']:
+                break
 
     def search_all(
         self,
         query: str,
         fields: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        concurrency: int = 1,
+        lazy: bool = False,
+        stream: bool = False,
+        adaptive: bool = False,
+        shard_size: Optional[int] = None,
+        keyset: bool = False,
     ) -> Generator[Issue, None, None]:
+        """
+        Yields every issue matching the query, paginating through each page.
+
+        When concurrency is greater than one, the first page is used to learn
+        the total and page size, the remaining pages are then fetched over a
+        pool of up to `concurrency` workers sharing the client session.
+        Issues are always yielded in order.
+
+        When streaming, each page is parsed as it is received and its issues
+        are yielded before the page has been downloaded in full, so that
+        memory use is bounded regardless of the page size. Streamed pages
+        are fetched sequentially.
+
+        The pages of a search are not cached, a following search of every
+        issue would rarely request the same pages again.
+
+        When adaptive and `max_results` is not given, the page size is tuned
+        from the latency and size of each response by a `PageSizer`,
+        starting from a large page. With concurrency, only the first page is
+        sized adaptively as it determines the size of the remaining pages.
+
+        When a `shard_size` is given, the query is partitioned into ranges of
+        creation dates holding at most `shard_size` issues (see
+        `goji.sharding`), and up to `concurrency` shards are fetched at once.
+        Issues are yielded shard by shard in order of creation, each shard
+        in the order of the query, and an issue is only yielded once. The
+        issues of a page are yielded as soon as the page and the shards
+        before it have been fetched, and a shard sizes its own pages when
+        adaptive.
+
+        With keyset paging, the results are ordered by key and each page is
+        requested as the issues following the last key of the previous page
+        (see `goji.paging.Keyset`) rather than by offset. Pages have the
+        same cost however deep the search is, and issues are neither skipped
+        nor repeated when the results change during the search. Any
+        `ORDER BY` of the query is replaced, and pages are fetched
+        sequentially.
+
+        Streamed pages and keyset pages are fetched one after another, a
+        ValueError is raised when `stream` is combined with `keyset`,
+        `shard_size` or a `concurrency` greater than one, or when `keyset`
+        is combined with a `concurrency` greater than one without a
+        `shard_size` to fetch shards concurrently.
+        """
+
+        if stream and (keyset or shard_size or concurrency > 1):
+            raise ValueError(
+                'stream cannot be combined with keyset, shard_size or concurrency'
+            )
+
+        if keyset and concurrency > 1 and not shard_size:
+            raise ValueError('keyset with concurrency requires a shard_size')
+
+        pool = InternPool()
+
+        if shard_size:
+            yield from self._search_all_sharded(
+                query, fields, shard_size, concurrency, pool, lazy, adaptive, keyset
+            )
+            return
+
+        sizer = self.page_sizer(fields) if adaptive and not max_results else None
+
+        if stream:
+            yield from self._search_all_streaming(
+                query, fields, max_results, pool, lazy, sizer
+            )
+            return
+
+        if concurrency > 1 and not keyset:
+            yield from self._search_all_concurrently(
+                query,
+                fields,
+                sizer.size if sizer else max_results,
+                concurrency,
+                pool,
+                lazy,
+            )
+            return
+
+        for results in self._search_results(
+            query, fields, max_results, pool, lazy, sizer, keyset
+        ):
+            yield from results.issues
+
+    def _search_results(
+        self,
+        query: str,
+        fields: Optional[List[str]],
+        max_results: Optional[int],
+        pool: InternPool,
+        lazy: bool,
+        sizer: Optional['PageSizer'],
+        keyset: bool,
+    ) -> Generator[SearchResults, None, None]:
+        """
+        Yields each page of search results, fetching pages sequentially.
+        """
+
+        from goji.paging import Keyset
+
+        position = Keyset(query) if keyset else None
         issues = 0
 
         while True:
-            results = self.search(query, fields, start_at=issues)
-            issues += len(results.issues)
-
-            for issue in results.issues:
-                yield issue
+            page_size = sizer.size if sizer else max_results
+            if position:
+                results = self._search_page(
+                    position.query(), fields, page_size, None, pool, lazy, sizer
+                )
+            else:
+                results = self._search_page(
+                    query, fields, page_size, issues, pool, lazy, sizer
+                )
+
+            yield results
 
             if len(results.issues) == 0:
                 break
 
-            if issues >= results.total:
+            if position:
+                # The total of a keyset page is the amount of issues remaining
+                if len(results.issues) >= results.total:
+                    break
+
+                position.advance(issue.key for issue in results.issues)
+            else:
+                issues += len(results.issues)
+
+                if issues >= results.total:
+                    break
+
+    def _search_page(
+        self,
+        query: str,
+        fields: Optional[List[str]],
+        page_size: Optional[int],
+        start_at: Optional[int],
+        pool: InternPool,
+        lazy: bool,
+        sizer: Optional['PageSizer'],
+    ) -> SearchResults:
+        body = search_body(query, fields, page_size, start_at)
+        started = time.monotonic()
+        response = self.post('search', body, cache=False)
+        elapsed = time.monotonic() - started
+        results = decode_search_results(response, fields, pool, lazy)
+
+        if sizer and page_size:
+            sizer.record(
+                page_size,
+                len(results.issues),
+                results.max_results,
+                elapsed,
+                len(response.content),
+            )
+
+        return results
+
+    def _search_all_sharded(
+        self,
+        query: str,
+        fields: Optional[List[str]],
+        shard_size: int,
+        concurrency: int,
+        pool: InternPool,
+        lazy: bool,
+        adaptive: bool,
+        keyset: bool,
+    ) -> Generator[Issue, None, None]:
+        from goji.sharding import plan_shards
+        from goji.utils import prefetch_each
+
+        shards = plan_shards(self, query, shard_size)
+        pages = prefetch_each(
+            (
+                self._search_results(
+                    shard.query, fields, None, pool, lazy, shard_sizer(adaptive), keyset
+                )
+                for shard in shards
+            ),
+            concurrency,
+        )
+        seen = set()
+
+        for results in pages:
+            for issue in results.issues:
+                if issue.key not in seen:
+                    seen.add(issue.key)
+                    yield issue
+
+    def _search_all_streaming(
+        self,
+        query: str,
+        fields: Optional[List[str]],
+        max_results: Optional[int],
+        pool: InternPool,
+        lazy: bool,
+        sizer: Optional['PageSizer'],
+    ) -> Generator[Issue, None, None]:
+        from goji.streaming import StreamingObject
+
+        issue_class = LazyIssue if lazy else Issue
+        url = urljoin(self.rest_base_url, 'search')
+        start_at = 0
+
+        while True:
+            page_size = sizer.size if sizer else max_results
+            body = search_body(query, fields, page_size, start_at)
+            response = self.request('POST', url, json=body, stream=True)
+            received = 0
+
+            def chunks() -> Generator[bytes, None, None]:
+                nonlocal received
+
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    received += len(chunk)
+                    yield chunk
+
+            with response:
+                self.validate_response(response)
+
+                page = StreamingObject(chunks(), 'issues')
+                issues = 0
+
+                for issue in page:
+                    issues += 1
+                    yield issue_class.from_json(issue, pool)
+
+            start_at += issues
+
+            # The time taken by a streamed page includes the time taken by
+            # the consumer, so streamed pages are only sized by their payload
+            if sizer and page_size:
+                sizer.record(
+                    page_size, issues, page.members.get('maxResults'), 0, received
+                )
+
+            if issues == 0 or start_at >= page.members['total']:
                 break
 
+    def _search_all_concurrently(
+        self,
+        query: str,
+        fields: Optional[List[str]],
+        max_results: Optional[int],
+        concurrency: int,
+        pool: InternPool,
+        lazy: bool,
+    ) -> Generator[Issue, None, None]:
+        results = self.search(
+            query, fields, max_results=max_results, pool=pool, lazy=lazy, cache=False
+        )
+        yield from results.issues
+
+        # The server may cap the page size below what was requested, the
+        # first page tells us the size it will actually honour.
+        page_size = len(results.issues)
+        if page_size == 0:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        offsets = iter(range(page_size, results.total, page_size))
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending: deque = deque()
+
+        def submit_next() -> None:
+            start_at = next(offsets, None)
+            if start_at is not None:
+                pending.append(
+                    executor.submit(
+                        self.search,
+                        query,
+                        fields,
+                        page_size,
+                        start_at,
+                        pool,
+                        lazy,
+                        cache=False,
+                    )
+                )
+
+        try:
+            for _ in range(concurrency):
+                submit_next()
+
+            while pending:
+                results = pending.popleft().result()
+                submit_next()
+                yield from results.issues
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def create_sprint(
         self,
         board_id: int,
@@ -227,6 +841,6 @@ class JIRAClient(object):
             payload['endDate'] = end_date.isoformat()
 
         url = urljoin(self.base_url, 'rest/agile/1.0/sprint')
-        response = self.session.post(url, json=payload)
+        response = self.request('POST', url, idempotent=False, json=payload)
         self.validate_response(response)
-        return Sprint.from_json(response.json())
+        return Sprint.from_json(response_json(response))
@@ -1,20 +1,20 @@
-import importlib
 import io
-import pkgutil
+import os
 import sys
-from functools import partial
+from itertools import islice
 from os import isatty
-from string import Formatter
-from typing import Optional
+from typing import Optional, Tuple
+from urllib.parse import urljoin
 
 import click
-from requests.compat import urljoin
 
 from goji.auth import get_credentials, set_credentials
+from goji.cache import DEFAULT_TTL, ResponseCache
 from goji.client import JIRAClient, JIRAException
 from goji.config import Configuration
-from goji.report import generate_report
-from goji.utils import Datetime
+from goji.formatting import OUTPUT_FORMATS, Exporter, IssueTemplate, echo_lines
+from goji.plugins import PluginGroup
+from goji.utils import Datetime, prefetch
 
 
 def check_login(client) -> None:
@@ -26,14 +26,52 @@ def check_login(client) -> None:
         raise
 
 
-@click.group()
+@click.group(cls=PluginGroup)
 @click.option('--profile', envvar='GOJI_PROFILE', default='default')
 @click.option('--base-url', envvar='GOJI_BASE_URL')
 @click.option('--email', envvar='GOJI_EMAIL', default=None)
 @click.option('--password', envvar='GOJI_PASSWORD', default=None)
+@click.option(
+    '--no-cache',
+    envvar='GOJI_NO_CACHE',
+    is_flag=True,
+    help='Do not read or store cached JIRA responses',
+)
+@click.option(
+    '--cache-ttl',
+    envvar='GOJI_CACHE_TTL',
+    type=click.IntRange(min=0),
+    default=DEFAULT_TTL,
+    show_default=True,
+    help='Seconds a cached JIRA response is used without revalidation',
+)
+@click.option(
+    '--rate-limit',
+    envvar='GOJI_RATE_LIMIT',
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help='Maximum amount of requests per second made to JIRA',
+)
+@click.option(
+    '--offline',
+    envvar='GOJI_OFFLINE',
+    is_flag=True,
+    help=(
+        'Answer searches and issues from issues synced with `goji sync`, as '
+        'they were at the last sync'
+    ),
+)
 @click.pass_context
 def cli(
-    ctx, profile: str, base_url: str, email: Optional[str], password: Optional[str]
+    ctx,
+    profile: str,
+    base_url: str,
+    email: Optional[str],
+    password: Optional[str],
+    no_cache: bool,
+    cache_ttl: int,
+    rate_limit: Optional[float],
+    offline: bool,
 ) -> None:
     config = Configuration.load()
     p = config.profiles.get(profile.lower())
@@ -51,11 +89,47 @@ def cli(
     if not base_url:
         raise click.ClickException('JIRA base URL is not configured')
 
+    cache = None
+    if not no_cache:
+        cache = ResponseCache(profile.lower(), ttl=cache_ttl)
+
+    rate_limiter = None
+    if rate_limit:
+        from goji.ratelimit import TokenBucket
+
+        rate_limiter = TokenBucket.for_profile(profile.lower(), rate_limit)
+
+    # A chosen JSON backend is checked up front rather than by the first
+    # response which is decoded
+    if os.environ.get('GOJI_JSON_BACKEND'):
+        from goji.decoding import current_backend
+
+        try:
+            current_backend()
+        except ValueError as e:
+            raise click.UsageError(str(e))
+
     if not ctx.obj:
         if ctx.invoked_subcommand == 'login':
             ctx.obj = base_url
+            ctx.meta['goji.profile'] = profile.lower()
+        elif offline:
+            from goji.store import IssueStore, OfflineClient
+
+            # The configured user answers currentUser() in offline searches
+            if not email:
+                email, _ = get_credentials(base_url)
+
+            ctx.obj = OfflineClient(
+                base_url, IssueStore.for_url(base_url), username=email
+            )
         elif email and password:
-            ctx.obj = JIRAClient(base_url, auth=(email, password))
+            ctx.obj = JIRAClient(
+                base_url,
+                auth=(email, password),
+                cache=cache,
+                rate_limiter=rate_limiter,
+            )
         elif email and not password:
             raise click.ClickException('Password is not configured.')
         elif not email and password:
@@ -68,7 +142,12 @@ def cli(
                     'Authentication not configured. Run `goji login`.'
                 )
 
-            ctx.obj = JIRAClient(base_url, auth=(email, password))
+            ctx.obj = JIRAClient(
+                base_url,
+                auth=(email, password),
+                cache=cache,
+                rate_limiter=rate_limiter,
+            )
 
 
 @cli.command('whoami')
@@ -148,7 +227,8 @@ def unassign(client: JIRAClient, issue_key: str) -> None:
 def change_status(client: JIRAClient, issue_key: str, status: Optional[str]) -> None:
     """Change the status of an issue"""
     click.echo('Fetching possible transitions...')
-    transitions = client.get_issue_transitions(issue_key)
+    # The transitions depend on the current status, which may have changed
+    transitions = client.get_issue_transitions(issue_key, cache=False)
     if len(transitions) == 0:
         click.echo('No transitions found for {}'.format(issue_key))
         return
@@ -228,7 +308,8 @@ def edit(
 ) -> None:
     """Edit issue description"""
 
-    issue = client.get_issue(issue_key)
+    # The issue is edited and written back, a cached issue may be out of date
+    issue = client.get_issue(issue_key, cache=False)
     update = {}
 
     if summary and summary != issue.summary:
@@ -347,6 +428,10 @@ def login(base_url: str) -> None:
     check_login(client)
     set_credentials(base_url, email, password)
 
+    # Responses cached for the previous credentials are no longer valid
+    profile = click.get_current_context().meta.get('goji.profile', 'default')
+    ResponseCache(profile).clear()
+
 
 @click.argument('type')
 @click.argument('outward-issue')
@@ -376,14 +461,45 @@ def link(
 @click.option('--format', default='{key} {summary}')
 @click.option('--count', is_flag=True, help='Return the count of matched issues')
 @click.option('--all', is_flag=True, help='Return all pages of issues')
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    default=1,
+    help='Amount of pages to fetch concurrently with --all',
+)
+@click.option(
+    '--output',
+    type=click.Choice(OUTPUT_FORMATS),
+    help='Stream the key and the fields of issues as NDJSON, CSV or TSV',
+)
+@click.option(
+    '--field',
+    multiple=True,
+    help='Exports the field with --output, may be repeated, every field by default',
+)
+@click.option(
+    '--shard-size',
+    type=click.IntRange(min=1),
+    help='Partition --all into ranges of creation dates of at most this many issues',
+)
+@click.option(
+    '--keyset',
+    is_flag=True,
+    help='Paginate --all by key rather than by offset, ordering issues by key',
+)
 @cli.command()
 @click.pass_obj
 def search(
     client: JIRAClient,
     all: bool,
+    concurrency: int,
     count: bool,
+    field: Tuple[str, ...],
     format: str,
     limit: Optional[int],
+    output: Optional[str],
+    shard_size: Optional[int],
+    keyset: bool,
     query: str,
 ) -> None:
     """Search issues using JQL"""
@@ -393,44 +509,101 @@ def search(
         print(results.total)
         return
 
-    formatter = Formatter()
-    fields = [v[1] for v in formatter.parse(format) if v[1]]
+    link_base_url = None
+    if not isinstance(sys.stdout, io.TextIOWrapper) and isatty(sys.stdout.fileno()):
+        link_base_url = client.base_url
 
+    if output:
+        exporter = Exporter(output, list(field) if field else None)
+
+        if all and concurrency > 1 and not shard_size:
+            raise click.UsageError('--concurrency with --output requires --shard-size')
+
+        pages = client.search_pages(
+            query,
+            fields=list(field) if field else ['*all'],
+            max_results=limit,
+            adaptive=all,
+            keyset=all and keyset,
+            shard_size=shard_size if all else None,
+            concurrency=concurrency if all else 1,
+        )
+
+        if not all:
+            pages = islice(pages, 1)
+
+        for page in prefetch(pages):
+            click.echo(exporter.export(page['issues']), nl=False)
+
+        return
+
+    template = IssueTemplate(format, link_base_url)
+    fields = template.fields
+
+    # Issues are decoded lazily, only the fields rendered are parsed
     if all:
-        issues = client.search_all(query, fields=fields)
-    else:
-        issues = client.search(query, fields=fields, max_results=limit).issues
-
-    for issue in issues:
-        format_kwargs = dict(
-            key=issue.key,
-            summary=issue.summary,
-            description=issue.description,
-            creator=issue.creator,
-            assignee=issue.assignee,
-            status=issue.status,
-            resolution=issue.resolution,
+        if keyset and concurrency > 1 and not shard_size:
+            raise click.UsageError('--concurrency with --keyset requires --shard-size')
+
+        issues = client.search_all(
+            query,
+            fields=fields,
+            concurrency=concurrency,
+            lazy=True,
+            adaptive=True,
+            shard_size=shard_size,
+            keyset=keyset,
         )
+    else:
+        issues = client.search(
+            query, fields=fields, max_results=limit, lazy=True
+        ).issues
+
+    echo_lines(map(template.render, issues))
+
+
+@cli.command()
+@click.argument('query')
+@click.pass_obj
+def sync(client: JIRAClient, query: str) -> None:
+    """
+    Sync issues matching a JQL query into a local store
+
+    The first sync of a query fetches every matching issue, subsequent syncs
+    only fetch issues which have been updated since and remove issues which
+    no longer match. Synced issues may be viewed without contacting JIRA
+    using `goji --offline`.
+    """
 
-        if (
-            'key' in fields
-            and not isinstance(sys.stdout, io.TextIOWrapper)
-            and isatty(sys.stdout.fileno())
-        ):
-            url = urljoin(client.base_url, 'browse/%s' % issue.key)
-            format_kwargs['key'] = f'\033]8;;{url}\a{issue.key}\033]8;;\a'
+    from goji.store import IssueStore, sync
 
-        format_kwargs.update(issue.customfields)
+    store = IssueStore.for_url(client.base_url)
+    try:
+        count = sync(client, store, query)
+    finally:
+        store.close()
 
-        click.echo(format.replace('\\n', '\n').format(**format_kwargs))
+    click.echo(f'Synced {count} issues.')
 
 
 @cli.command()
 @click.argument('input', type=click.File('r'))
 @click.option('-o', '--output', type=click.File('w'), default='-')
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    help='Amount of widgets to load concurrently, overriding the report',
+)
 @click.pass_obj
-def report(client: JIRAClient, input, output) -> None:
-    generate_report(client, input).render(output)
+def report(client: JIRAClient, input, output, concurrency: Optional[int]) -> None:
+    from goji.report import generate_report
+
+    try:
+        widget = generate_report(client, input, concurrency)
+    except ValueError as e:
+        raise click.ClickException(f'Invalid report. {e}')
+
+    widget.render(output)
 
 
 @cli.group('sprint')
@@ -449,29 +622,3 @@ def sprint_create(client: JIRAClient, board_id: int, name: str, start, end) -> N
 
     client.create_sprint(board_id, name, start_date=start, end_date=end)
     click.echo('Sprint created')
-
-
-# Support for plugins, this API is somewhat unstable, it may change between versions.
-def add_plugin_command(plugin, main):
-    @cli.command(
-        name=getattr(plugin, '__name__'),
-        help=getattr(plugin, '__doc__'),
-        context_settings=dict(
-            ignore_unknown_options=True,
-        ),
-    )
-    @click.pass_obj
-    @click.argument('args', nargs=-1, type=click.UNPROCESSED)
-    def func(client: JIRAClient, args):
-        main(client, args)
-
-
-plugins = [name for _, name, _ in pkgutil.iter_modules() if name.startswith('goji_')]
-for module in plugins:
-    try:
-        plugin = importlib.import_module(module)
-        main = partial(getattr(plugin, '__main__'))
-        add_plugin_command(plugin, main)
-    except Exception as e:
-        print(f'Failed to load plugin {module}: {repr(e)}', file=sys.stderr)
-        continue
@@ -1,9 +1,11 @@
+import marshal
+import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import click
-import toml
-from jsonschema import ValidationError, validate
+
+from goji.cache import cache_directory
 
 SCHEMA = {
     'type': 'object',
@@ -33,6 +35,40 @@ SCHEMA = {
 }
 
 
+# Bump when the schema changes to invalidate previously validated configs
+CACHE_VERSION = 1
+
+
+def config_cache_path() -> Path:
+    return cache_directory() / 'config.cache'
+
+
+def read_config_cache(key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    try:
+        with open(config_cache_path(), 'rb') as fp:
+            cached_key, data = marshal.load(fp)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if cached_key != key:
+        return None
+
+    return data
+
+
+def write_config_cache(key: Tuple[Any, ...], data: Dict[str, Any]) -> None:
+    path = config_cache_path()
+    temporary_path = path.with_suffix('.tmp')
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(temporary_path, 'wb') as fp:
+            marshal.dump((key, data), fp)
+        os.replace(temporary_path, path)
+    except (OSError, ValueError):
+        pass
+
+
 class Profile:
     @classmethod
     def from_dict(cls, data) -> 'Profile':
@@ -54,6 +90,34 @@ class Configuration:
 
     @classmethod
     def fromfile(cls, path: Path) -> 'Configuration':
+        """
+        Loads the configuration file. The validated configuration is cached
+        against the file's path, modification time and size, so the file is
+        only parsed and validated again once it changes.
+        """
+
+        stat = path.stat()
+        key = (CACHE_VERSION, str(path.absolute()), stat.st_mtime_ns, stat.st_size)
+        data = read_config_cache(key)
+
+        if data is None:
+            data = cls.parse(path)
+            write_config_cache(key, data)
+
+        profiles: Dict[str, Profile] = {}
+        for profile, data in data.get('profile', {}).items():
+            if profile.lower() in profiles:
+                raise click.ClickException(f'Profile {profile} defined more than once')
+
+            profiles[profile] = Profile.from_dict(data)
+
+        return cls(profiles=profiles)
+
+    @classmethod
+    def parse(cls, path: Path) -> Dict[str, Any]:
+        import toml
+        from jsonschema import ValidationError, validate
+
         with open(path) as fp:
             data = toml.load(fp)
 
@@ -65,14 +129,7 @@ class Configuration:
             )
             raise click.ClickException(message)
 
-        profiles: Dict[str, Profile] = {}
-        for profile, data in data.get('profile', {}).items():
-            if profile.lower() in profiles:
-                raise click.ClickException(f'Profile {profile} defined more than once')
-
-            profiles[profile] = Profile.from_dict(data)
-
-        return cls(profiles=profiles)
+        return data
 
     def __init__(self, profiles: Dict[str, Profile]):
         self.profiles = profiles
@@ -0,0 +1,116 @@
+"""
+Decoding of JSON responses, using msgspec or orjson when either is installed
+and falling back to the standard library otherwise.
+
+The backend may be chosen with the `GOJI_JSON_BACKEND` environment variable,
+set to `msgspec`, `orjson` or `json`. `benchmarks/decoding.py` compares the
+backends on a large search page.
+"""
+
+import os
+from typing import Any, Callable, Dict, Optional
+
+Loads = Callable[[bytes], Any]
+
+BACKEND_PREFERENCE = ('msgspec', 'orjson', 'json')
+
+
+def msgspec_loads() -> Loads:
+    import msgspec
+
+    return msgspec.json.Decoder().decode
+
+
+def orjson_loads() -> Loads:
+    import orjson
+
+    return orjson.loads
+
+
+def json_loads() -> Loads:
+    import json
+
+    return json.loads
+
+
+BACKENDS: Dict[str, Callable[[], Loads]] = {
+    'msgspec': msgspec_loads,
+    'orjson': orjson_loads,
+    'json': json_loads,
+}
+
+backend: Optional[str] = None
+loads: Optional[Loads] = None
+
+
+def load_backend(name: Optional[str] = None) -> str:
+    """
+    Selects the JSON backend, either the named backend or the first of the
+    available backends in order of preference. Returns the name of the
+    selected backend.
+    """
+
+    global backend, loads
+
+    if name:
+        if name not in BACKENDS:
+            names = ', '.join(BACKENDS)
+            raise ValueError(f'Unknown JSON backend {name}, expected one of {names}')
+
+        names = (name,)
+    else:
+        names = BACKEND_PREFERENCE
+
+    for candidate in names:
+        try:
+            loads = BACKENDS[candidate]()
+        except ImportError:
+            if name:
+                raise
+
+            continue
+
+        backend = candidate
+        break
+
+    assert backend
+    return backend
+
+
+def current_backend() -> str:
+    """
+    Returns the name of the selected JSON backend, selecting the backend
+    named by `GOJI_JSON_BACKEND` on first use. Raises a ValueError when the
+    named backend is unknown or is not installed.
+    """
+
+    if backend is None:
+        name = os.environ.get('GOJI_JSON_BACKEND') or None
+
+        try:
+            return load_backend(name)
+        except ValueError as e:
+            raise ValueError(f'Invalid GOJI_JSON_BACKEND. {e}')
+        except ImportError:
+            raise ValueError(
+                f'GOJI_JSON_BACKEND is {name} which is not installed, '
+                f'install goji with the {name} extra'
+            )
+
+    return backend
+
+
+def decode_json(content: bytes) -> Any:
+    if loads is None:
+        current_backend()
+
+    assert loads
+    return loads(content)
+
+
+def response_json(response) -> Any:
+    """
+    Decodes the JSON body of a requests or httpx response.
+    """
+
+    return decode_json(response.content)
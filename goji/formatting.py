@@ -0,0 +1,196 @@
+import csv
+import io
+import json
+import re
+from operator import attrgetter
+from string import Formatter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+import click
+
+from goji.models import ISSUE_SERVER_FIELDS, Issue
+
+# Issue attributes available to templates, other names refer to custom fields
+ISSUE_ATTRIBUTES = (
+    'key',
+    'summary',
+    'description',
+    'creator',
+    'assignee',
+    'status',
+    'resolution',
+)
+
+FIELD_NAME_PATTERN = re.compile(r'^[^.\[]*')
+
+# Amount of lines buffered before being written out
+CHUNK_SIZE = 512
+
+OUTPUT_FORMATS = ('ndjson', 'csv', 'tsv')
+
+# Keys used to represent a nested JIRA object, such as a user or status, as a
+# single value in order of preference
+FLATTEN_KEYS = ('displayName', 'name', 'value', 'key')
+
+
+def hyperlink(url: str, text: str) -> str:
+    return f'\033]8;;{url}\a{text}\033]8;;\a'
+
+
+class IssueTemplate:
+    """
+    A `str.format` template for rendering issues, parsed once so that only
+    the fields referenced by the template are looked up for each issue.
+    """
+
+    def __init__(self, format: str, link_base_url: Optional[str] = None):
+        self.format = format.replace('\\n', '\n')
+
+        names: List[str] = []
+        for _, field_name, _, _ in Formatter().parse(self.format):
+            if field_name:
+                match = FIELD_NAME_PATTERN.match(field_name)
+                assert match
+                name = match.group()
+                if name not in names:
+                    names.append(name)
+
+        self.fields = names
+        self.accessors = [(name, self.accessor(name, link_base_url)) for name in names]
+
+    def accessor(
+        self, name: str, link_base_url: Optional[str]
+    ) -> Callable[[Issue], Any]:
+        if name == 'key' and link_base_url:
+            browse_url = urljoin(link_base_url, 'browse/')
+            return lambda issue: hyperlink(browse_url + issue.key, issue.key)
+
+        if name in ISSUE_ATTRIBUTES:
+            return attrgetter(name)
+
+        return lambda issue: issue.customfields[name]
+
+    def render(self, issue: Issue) -> str:
+        values: Dict[str, Any] = {
+            name: accessor(issue) for name, accessor in self.accessors
+        }
+        return self.format.format_map(values)
+
+
+def echo_lines(lines: Iterable[str], chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Writes lines to stdout in chunks, rather than flushing every line.
+    """
+
+    chunk: List[str] = []
+
+    for line in lines:
+        chunk.append(line)
+
+        if len(chunk) >= chunk_size:
+            click.echo('\n'.join(chunk))
+            chunk.clear()
+
+    if chunk:
+        click.echo('\n'.join(chunk))
+
+
+def flatten(value: Any) -> str:
+    """
+    Flattens a field value from JIRA into a single CSV cell.
+    """
+
+    if value is None:
+        return ''
+
+    if isinstance(value, dict):
+        for key in FLATTEN_KEYS:
+            if key in value:
+                return flatten(value[key])
+
+        return json.dumps(value)
+
+    if isinstance(value, list):
+        return ', '.join(map(flatten, value))
+
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+
+    return str(value)
+
+
+class Exporter:
+    """
+    Exports issues as returned by JIRA in a machine readable format, one
+    page of issues at a time. Every issue is exported with its key followed
+    by the given fields, or by every field of the issues when no fields are
+    given. CSV and TSV exports of every field have the columns of the
+    first page of issues.
+    """
+
+    def __init__(self, output: str, fields: Optional[List[str]] = None):
+        self.output = output
+        self.fields: Optional[List[str]] = None
+        self.server_fields: List[str] = []
+        self.started = False
+
+        if fields is not None:
+            self.set_fields([field for field in fields if field != 'key'])
+
+    def set_fields(self, fields: List[str]) -> None:
+        self.fields = fields
+        self.server_fields = [ISSUE_SERVER_FIELDS.get(f, f) for f in fields]
+
+    def writer(self, buffer: io.StringIO):
+        if self.output == 'tsv':
+            return csv.writer(buffer, dialect='excel-tab', lineterminator='\n')
+
+        return csv.writer(buffer, lineterminator='\n')
+
+    def header(self) -> str:
+        if self.output == 'ndjson':
+            return ''
+
+        buffer = io.StringIO()
+        self.writer(buffer).writerow(['key'] + (self.fields or []))
+        return buffer.getvalue()
+
+    def export(self, issues: List[Dict[str, Any]]) -> str:
+        """
+        Exports a page of issues, preceded by the header on the first page.
+        """
+
+        buffer = io.StringIO()
+
+        if self.fields is None and self.output != 'ndjson':
+            names = {name for issue in issues for name in issue.get('fields', {})}
+            self.set_fields(sorted(names))
+
+        if not self.started:
+            buffer.write(self.header())
+            self.started = True
+
+        if self.output == 'ndjson':
+            for issue in issues:
+                fields = issue.get('fields', {})
+                row = {'key': issue['key']}
+                if self.fields is None:
+                    row.update(fields)
+                else:
+                    row.update(
+                        (field, fields.get(server_field))
+                        for field, server_field in zip(self.fields, self.server_fields)
+                    )
+                buffer.write(json.dumps(row, separators=(',', ':')))
+                buffer.write('\n')
+        else:
+            writer = self.writer(buffer)
+            for issue in issues:
+                fields = issue.get('fields', {})
+                writer.writerow(
+                    [issue['key']]
+                    + [flatten(fields.get(field)) for field in self.server_fields]
+                )
+
+        return buffer.getvalue()
@@ -0,0 +1,611 @@
+"""
+A parser for a subset of JQL, compiled to SQL against the local issue store.
+
+Supported are the `AND`, `OR` and `NOT` operators with parentheses, clauses
+using `=`, `!=`, `~`, `!~`, `>`, `>=`, `<`, `<=`, `IN`, `NOT IN`, `IS EMPTY` and
+`IS NOT EMPTY`, and an `ORDER BY` clause. Fields are limited to those
+indexed by the store (key, project, summary, description, status, assignee,
+resolution, labels, created, updated and resolved) and custom fields.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional, Tuple, Union
+
+import click
+
+
+class JQLError(click.ClickException):
+    pass
+
+
+TOKEN_PATTERN = re.compile(
+    r'''
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<operator>!=|!~|>=|<=|=|~|>|<)
+      | (?P<punctuation>[(),])
+      | (?P<word>[^\s"'()=!~<>,]+)
+    )
+    ''',
+    re.VERBOSE,
+)
+
+RELATIVE_DATE_PATTERN = re.compile(r'^([-+]?)(\d+)([wdhm])$')
+RELATIVE_DATE_UNITS = {'w': 'weeks', 'd': 'days', 'h': 'hours', 'm': 'minutes'}
+
+DATE_FORMATS = ('%Y-%m-%d %H:%M', '%Y/%m/%d %H:%M', '%Y-%m-%d', '%Y/%m/%d')
+
+KEY_ORDER = (
+    "substr(key, 1, instr(key, '-'))",
+    "CAST(substr(key, instr(key, '-') + 1) AS INTEGER)",
+)
+
+COLUMNS = {
+    'summary': 'summary',
+    'status': 'status',
+    'resolution': 'resolution',
+    'created': 'created',
+    'createddate': 'created',
+    'updated': 'updated',
+    'updateddate': 'updated',
+    'resolved': 'resolutiondate',
+    'resolutiondate': 'resolutiondate',
+}
+
+DATE_COLUMNS = {'created', 'updated', 'resolutiondate'}
+
+
+@dataclass
+class Token:
+    kind: str
+    value: str
+
+    def is_keyword(self, *keywords: str) -> bool:
+        return self.kind == 'word' and self.value.lower() in keywords
+
+
+@dataclass
+class Function:
+    name: str
+
+
+@dataclass
+class Clause:
+    field: str
+    operator: str
+    value: Union[None, str, Function, List[Union[str, Function]]]
+
+
+@dataclass
+class Not:
+    expression: 'Expression'
+
+
+@dataclass
+class And:
+    expressions: List['Expression']
+
+
+@dataclass
+class Or:
+    expressions: List['Expression']
+
+
+Expression = Union[Clause, Not, And, Or]
+
+
+@dataclass
+class Query:
+    where: Optional[Expression]
+    order_by: List[Tuple[str, bool]]
+
+
+def split_order_by(query: str) -> Tuple[str, str]:
+    """
+    Splits a JQL query into its conditions and its `ORDER BY` clause.
+    """
+
+    position = 0
+    previous: Optional[Tuple[str, int]] = None
+
+    # Tokenized so that `order by` within a string is not mistaken for the
+    # clause, the query may use JQL beyond the subset parsed by goji
+    while position < len(query):
+        match = TOKEN_PATTERN.match(query, position)
+        if not match or match.end() == position:
+            break
+
+        kind = match.lastgroup
+        assert kind
+        value = match.group(kind).lower()
+
+        if previous and previous[0] == 'order' and kind == 'word' and value == 'by':
+            return (query[: previous[1]].rstrip(), query[previous[1] :].strip())
+
+        previous = (value, match.start(kind)) if kind == 'word' else None
+        position = match.end()
+
+    return (query, '')
+
+
+def tokenize(query: str) -> List[Token]:
+    tokens = []
+    position = 0
+    query = query.rstrip()
+
+    while position < len(query):
+        match = TOKEN_PATTERN.match(query, position)
+        if not match or match.end() == position:
+            raise JQLError(f'Unable to parse JQL at "{query[position:]}"')
+
+        kind = match.lastgroup
+        assert kind
+        value = match.group(kind)
+
+        if kind == 'string':
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+
+        tokens.append(Token(kind, value))
+        position = match.end()
+
+    return tokens
+
+
+class Parser:
+    def __init__(self, query: str):
+        self.tokens = tokenize(query)
+        self.position = 0
+
+    def peek(self) -> Optional[Token]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+
+        return None
+
+    def next(self) -> Token:
+        token = self.peek()
+        if token is None:
+            raise JQLError('Unexpected end of JQL query')
+
+        self.position += 1
+        return token
+
+    def accept(self, *keywords: str) -> bool:
+        token = self.peek()
+        if token and token.is_keyword(*keywords):
+            self.position += 1
+            return True
+
+        return False
+
+    def expect_punctuation(self, value: str) -> None:
+        token = self.next()
+        if token.kind != 'punctuation' or token.value != value:
+            raise JQLError(f'Expected "{value}" but found "{token.value}"')
+
+    def parse(self) -> Query:
+        where = None
+        token = self.peek()
+
+        if token and not token.is_keyword('order'):
+            where = self.parse_or()
+
+        order_by = []
+        if self.accept('order'):
+            if not self.accept('by'):
+                raise JQLError('Expected BY after ORDER')
+
+            while True:
+                field = self.parse_field()
+                descending = False
+
+                if self.accept('desc'):
+                    descending = True
+                else:
+                    self.accept('asc')
+
+                order_by.append((field, descending))
+
+                token = self.peek()
+                if token and token.kind == 'punctuation' and token.value == ',':
+                    self.position += 1
+                else:
+                    break
+
+        token = self.peek()
+        if token:
+            raise JQLError(f'Unexpected "{token.value}" in JQL query')
+
+        return Query(where, order_by)
+
+    def parse_or(self) -> Expression:
+        expressions = [self.parse_and()]
+        while self.accept('or'):
+            expressions.append(self.parse_and())
+
+        if len(expressions) == 1:
+            return expressions[0]
+
+        return Or(expressions)
+
+    def parse_and(self) -> Expression:
+        expressions = [self.parse_not()]
+        while self.accept('and'):
+            expressions.append(self.parse_not())
+
+        if len(expressions) == 1:
+            return expressions[0]
+
+        return And(expressions)
+
+    def parse_not(self) -> Expression:
+        if self.accept('not'):
+            return Not(self.parse_not())
+
+        token = self.peek()
+        if token and token.kind == 'punctuation' and token.value == '(':
+            self.position += 1
+            expression = self.parse_or()
+            self.expect_punctuation(')')
+            return expression
+
+        return self.parse_clause()
+
+    def parse_field(self) -> str:
+        token = self.next()
+        if token.kind not in ('word', 'string'):
+            raise JQLError(f'Expected a field but found "{token.value}"')
+
+        return token.value
+
+    def parse_clause(self) -> Clause:
+        field = self.parse_field()
+        token = self.next()
+
+        if token.kind == 'operator':
+            return Clause(field, token.value, self.parse_value())
+
+        if token.is_keyword('in'):
+            return Clause(field, 'in', self.parse_list())
+
+        if token.is_keyword('not'):
+            if not self.accept('in'):
+                raise JQLError('Expected IN after NOT')
+
+            return Clause(field, 'not in', self.parse_list())
+
+        if token.is_keyword('is'):
+            operator = 'is not' if self.accept('not') else 'is'
+            if not self.accept('empty', 'null'):
+                raise JQLError(f'Expected EMPTY after {operator.upper()}')
+
+            return Clause(field, operator, None)
+
+        raise JQLError(f'Unsupported operator "{token.value}" for {field}')
+
+    def parse_value(self) -> Union[None, str, Function]:
+        token = self.next()
+
+        if token.kind == 'string':
+            return token.value
+
+        if token.kind != 'word':
+            raise JQLError(f'Expected a value but found "{token.value}"')
+
+        if token.is_keyword('empty', 'null'):
+            return None
+
+        following = self.peek()
+        if following and following.kind == 'punctuation' and following.value == '(':
+            self.position += 1
+            self.expect_punctuation(')')
+            return Function(token.value.lower())
+
+        return token.value
+
+    def parse_list(self) -> List[Union[str, Function]]:
+        self.expect_punctuation('(')
+        values = []
+
+        while True:
+            value = self.parse_value()
+            if value is not None:
+                values.append(value)
+
+            token = self.next()
+            if token.kind == 'punctuation' and token.value == ')':
+                return values
+
+            if token.kind != 'punctuation' or token.value != ',':
+                raise JQLError(f'Expected "," or ")" but found "{token.value}"')
+
+
+def parse(query: str) -> Query:
+    return Parser(query).parse()
+
+
+class Compiler:
+    """
+    Compiles a parsed JQL query into an SQL condition and ordering against
+    the `issues` and `labels` tables of the issue store.
+    """
+
+    def __init__(self, current_user: Optional[str] = None, now=None):
+        self.current_user = current_user
+        self.now = now or datetime.now(timezone.utc)
+        self.parameters: List[Any] = []
+
+    def compile(self, query: Query) -> Tuple[str, str, List[Any]]:
+        where = '1'
+        if query.where is not None:
+            where = self.expression(query.where)
+
+        order_by = []
+        for field, descending in query.order_by:
+            direction = ' DESC' if descending else ''
+            order_by.extend(
+                f'{column}{direction}' for column in self.order_columns(field)
+            )
+
+        if not order_by:
+            order_by = list(KEY_ORDER)
+
+        return (where, ', '.join(order_by), self.parameters)
+
+    def order_columns(self, field: str) -> Tuple[str, ...]:
+        name = field.lower()
+
+        if name in ('key', 'issuekey', 'issue', 'id'):
+            return KEY_ORDER
+
+        if name == 'project':
+            return KEY_ORDER[:1]
+
+        if name == 'assignee':
+            return ('assignee_name',)
+
+        if name == 'labels':
+            # Issues are ordered by their first label alphabetically
+            return ('(SELECT min(label) FROM labels WHERE labels.key = issues.key)',)
+
+        if name == 'description':
+            return ("json_extract(json, '$.fields.description')",)
+
+        if name in COLUMNS:
+            return (COLUMNS[name],)
+
+        expression = self.customfield(name)
+        if expression:
+            return (expression,)
+
+        raise JQLError(f'Ordering by {field} is not supported offline')
+
+    def expression(self, expression: Expression) -> str:
+        if isinstance(expression, And):
+            return (
+                '(' + ' AND '.join(map(self.expression, expression.expressions)) + ')'
+            )
+
+        if isinstance(expression, Or):
+            return '(' + ' OR '.join(map(self.expression, expression.expressions)) + ')'
+
+        if isinstance(expression, Not):
+            return f'NOT {self.expression(expression.expression)}'
+
+        return self.clause(expression)
+
+    def parameter(self, value: Any) -> str:
+        self.parameters.append(value)
+        return '?'
+
+    def resolve(self, value: Union[str, Function]) -> Optional[str]:
+        if isinstance(value, Function):
+            if value.name == 'currentuser':
+                if self.current_user is None:
+                    raise JQLError('currentUser() is not available offline')
+
+                return self.current_user
+
+            if value.name == 'now':
+                return self.now.isoformat()
+
+            raise JQLError(f'Function {value.name}() is not supported offline')
+
+        return value
+
+    def date(self, value: Union[str, Function]) -> str:
+        if isinstance(value, Function):
+            if value.name == 'now':
+                return self.now.astimezone(timezone.utc).isoformat()
+
+            raise JQLError(f'Function {value.name}() is not supported offline')
+
+        match = RELATIVE_DATE_PATTERN.match(value)
+        if match:
+            sign, amount, unit = match.groups()
+            delta = timedelta(**{RELATIVE_DATE_UNITS[unit]: int(amount)})
+            date = self.now - delta if sign == '-' else self.now + delta
+            return date.astimezone(timezone.utc).isoformat()
+
+        for date_format in DATE_FORMATS:
+            try:
+                date = datetime.strptime(value, date_format)
+            except ValueError:
+                continue
+
+            # JQL dates are in the user's time zone, the local one is assumed
+            return date.astimezone(timezone.utc).isoformat()
+
+        raise JQLError(f'Unable to parse date "{value}"')
+
+    def values(self, clause: Clause) -> List[Optional[str]]:
+        if isinstance(clause.value, list):
+            return [self.resolve(value) for value in clause.value]
+
+        if clause.value is None:
+            return [None]
+
+        return [self.resolve(clause.value)]
+
+    def clause(self, clause: Clause) -> str:
+        name = clause.field.lower()
+        operator = clause.operator
+
+        if operator in ('is', 'is not'):
+            return self.empty(name, clause.field, negate=operator == 'is not')
+
+        if operator in ('~', '!~'):
+            condition = self.contains(name, clause)
+            return f'NOT {condition}' if operator == '!~' else condition
+
+        if operator in ('>', '>=', '<', '<='):
+            return self.compare(name, clause)
+
+        if operator in ('=', '!=', 'in', 'not in'):
+            if clause.value is None:
+                return self.empty(name, clause.field, negate=operator == '!=')
+
+            conditions = [self.equals(name, value) for value in self.values(clause)]
+            condition = '(' + (' OR '.join(conditions) or '0') + ')'
+
+            if operator in ('!=', 'not in'):
+                return f'NOT {condition}'
+
+            return condition
+
+        raise JQLError(f'Unsupported operator "{operator}"')
+
+    def customfield(self, name: str) -> Optional[str]:
+        match = re.match(r'^(?:cf\[(\d+)\]|customfield_(\d+))$', name)
+        if not match:
+            return None
+
+        field = f'$.fields.customfield_{match.group(1) or match.group(2)}'
+        return (
+            f"coalesce(json_extract(json, '{field}.value'), "
+            f"json_extract(json, '{field}.name'), json_extract(json, '{field}'))"
+        )
+
+    def equals(self, name: str, value: Optional[str]) -> str:
+        if value is None:
+            return '0'
+
+        if name in ('key', 'issuekey', 'issue', 'id'):
+            return f'key = {self.parameter(value.upper())}'
+
+        if name == 'project':
+            # A range of keys rather than LIKE, so that the key index is used.
+            # `.` follows `-` and so bounds the keys of the project.
+            project = value.upper()
+            return (
+                f"(key >= {self.parameter(project + '-')} "
+                f"AND key < {self.parameter(project + '.')})"
+            )
+
+        if name == 'assignee':
+            return (
+                f'(assignee = {self.parameter(value)} COLLATE NOCASE '
+                f'OR assignee_name = {self.parameter(value)} COLLATE NOCASE '
+                f'OR assignee_email = {self.parameter(value)} COLLATE NOCASE)'
+            )
+
+        if name == 'labels':
+            return (
+                'key IN (SELECT key FROM labels WHERE label = '
+                f'{self.parameter(value)} COLLATE NOCASE)'
+            )
+
+        if name == 'resolution' and value.lower() == 'unresolved':
+            return 'resolution IS NULL'
+
+        if name in COLUMNS:
+            column = COLUMNS[name]
+            if column in DATE_COLUMNS:
+                return f'{column} = {self.parameter(self.date(value))}'
+
+            return f'{column} = {self.parameter(value)} COLLATE NOCASE'
+
+        expression = self.customfield(name)
+        if expression:
+            return f'{expression} = {self.parameter(self.number(value))}'
+
+        raise JQLError(f'Field {name} is not supported offline')
+
+    def empty(self, name: str, field: str, negate: bool) -> str:
+        if name == 'assignee':
+            condition = '(assignee IS NULL AND assignee_name IS NULL)'
+        elif name == 'labels':
+            condition = 'key NOT IN (SELECT key FROM labels)'
+        elif name in COLUMNS:
+            condition = f'{COLUMNS[name]} IS NULL'
+        elif name in ('description', 'text'):
+            condition = "json_extract(json, '$.fields.description') IS NULL"
+        else:
+            expression = self.customfield(name)
+            if expression is None:
+                raise JQLError(f'Field {field} is not supported offline')
+
+            condition = f'{expression} IS NULL'
+
+        return f'NOT {condition}' if negate else condition
+
+    def contains(self, name: str, clause: Clause) -> str:
+        if not isinstance(clause.value, str):
+            raise JQLError(f'Expected text for {clause.field} {clause.operator}')
+
+        pattern = '%' + re.sub(r'([%_\\])', r'\\\1', clause.value) + '%'
+        columns = {
+            'summary': ['summary'],
+            'description': ["json_extract(json, '$.fields.description')"],
+            'text': ['summary', "json_extract(json, '$.fields.description')"],
+        }.get(name)
+
+        if columns is None:
+            expression = self.customfield(name)
+            if expression is None:
+                raise JQLError(f'Field {clause.field} is not supported offline')
+
+            columns = [expression]
+
+        conditions = [
+            f"coalesce({column}, '') LIKE {self.parameter(pattern)} ESCAPE '\\'"
+            for column in columns
+        ]
+        return '(' + ' OR '.join(conditions) + ')'
+
+    def compare(self, name: str, clause: Clause) -> str:
+        if isinstance(clause.value, list) or clause.value is None:
+            raise JQLError(f'Expected a value for {clause.field} {clause.operator}')
+
+        column = COLUMNS.get(name)
+        if column in DATE_COLUMNS:
+            value = self.date(clause.value)
+            return f'{column} {clause.operator} {self.parameter(value)}'
+
+        expression = self.customfield(name)
+        if expression:
+            value = self.number(self.resolve(clause.value))
+            return f'{expression} {clause.operator} {self.parameter(value)}'
+
+        raise JQLError(f'Comparing {clause.field} is not supported offline')
+
+    def number(self, value: Optional[str]) -> Any:
+        if value is None:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def compile_query(
+    query: str, current_user: Optional[str] = None, now=None
+) -> Tuple[str, str, List[Any]]:
+    """
+    Compiles a JQL query into an SQL condition, ordering and parameters.
+    """
+
+    return Compiler(current_user, now).compile(parse(query))
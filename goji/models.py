@@ -1,19 +1,58 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
 
+T = TypeVar('T')
 
-@dataclass
+
+class InternPool:
+    """
+    Shares identical users, statuses, status categories and resolutions
+    between the issues decoded with the same pool, such as the issues of a
+    search. The shared models are frozen, as a change to an object shared
+    between issues would change every issue. Use `dataclasses.replace` to
+    give an issue a changed copy instead.
+    """
+
+    def __init__(self) -> None:
+        self.objects: Dict[Tuple[type, Tuple], Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def intern(self, cls: Type[T], *args: Any) -> T:
+        key = (cls, args)
+        value = self.objects.get(key)
+
+        if value is None:
+            value = self.objects.setdefault(key, cls(*args))
+
+        return value
+
+
+def create(pool: Optional[InternPool]) -> Callable[..., Any]:
+    if pool is None:
+        return lambda cls, *args: cls(*args)
+
+    return pool.intern
+
+
+@dataclass(slots=True, frozen=True)
 class UserDetails:
     username: Optional[str]
     name: str
     email: Optional[str] = None
 
     @classmethod
-    def from_json(cls, json: Dict[str, Any]) -> Optional['UserDetails']:
+    def from_json(
+        cls, json: Dict[str, Any], pool: Optional[InternPool] = None
+    ) -> Optional['UserDetails']:
         if json:
-            return cls(
-                json.get('name') or '', json['displayName'], json.get('emailAddress')
+            return create(pool)(
+                cls,
+                json.get('name') or '',
+                json['displayName'],
+                json.get('emailAddress'),
             )
 
         return None
@@ -22,7 +61,82 @@ class UserDetails:
         return '{} ({})'.format(self.name, self.username or self.email)
 
 
-@dataclass
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if value:
+        return datetime.fromisoformat(value.replace('+0000', '+00:00'))
+
+    return None
+
+
+def decode_links(
+    fields: Dict[str, Any], pool: Optional[InternPool]
+) -> List['IssueLink']:
+    return [IssueLink.from_json(link, pool) for link in fields.get('issuelinks') or []]
+
+
+def decode_customfields(
+    fields: Dict[str, Any], pool: Optional[InternPool]
+) -> Dict[str, Any]:
+    return {
+        key: value for key, value in fields.items() if key.startswith('customfield_')
+    }
+
+
+# Decodes each attribute of an issue from the JSON fields of the issue
+ISSUE_FIELD_DECODERS: Dict[
+    str, Callable[[Dict[str, Any], Optional[InternPool]], Any]
+] = {
+    'summary': lambda fields, pool: fields.get('summary', '').rstrip(),
+    'description': lambda fields, pool: fields.get('description'),
+    'creator': lambda fields, pool: UserDetails.from_json(fields.get('creator'), pool),
+    'created': lambda fields, pool: parse_datetime(fields.get('created')),
+    'resolutiondate': lambda fields, pool: parse_datetime(fields.get('resolutiondate')),
+    'assignee': lambda fields, pool: UserDetails.from_json(
+        fields.get('assignee'), pool
+    ),
+    'status': lambda fields, pool: (
+        StatusDetails.from_json(fields['status'], pool) if 'status' in fields else None
+    ),
+    'resolution': lambda fields, pool: (
+        Resolution.from_json(fields['resolution'], pool)
+        if fields.get('resolution')
+        else None
+    ),
+    'links': decode_links,
+    'labels': lambda fields, pool: fields.get('labels', None),
+    'customfields': decode_customfields,
+    'updated': lambda fields, pool: parse_datetime(fields.get('updated')),
+    'components': lambda fields, pool: (
+        [component['name'] for component in fields['components']]
+        if fields.get('components') is not None
+        else None
+    ),
+}
+
+# JIRA field ids of the issue attributes which are named differently, other
+# attributes and custom fields share the id of the field
+ISSUE_SERVER_FIELDS: Dict[str, str] = {
+    'links': 'issuelinks',
+}
+
+
+def server_fields(names: Iterable[str]) -> List[str]:
+    """
+    Returns the JIRA fields to request in order to read the given issue
+    attributes or custom fields, without duplicates.
+    """
+
+    fields: List[str] = []
+
+    for name in names:
+        field = ISSUE_SERVER_FIELDS.get(name, name)
+        if field not in fields:
+            fields.append(field)
+
+    return fields
+
+
+@dataclass(slots=True)
 class Issue:
     key: str
     summary: Optional[str] = None
@@ -36,46 +150,20 @@ class Issue:
     links: List['IssueLink'] = field(default_factory=list)
     labels: Optional[List[str]] = None
     customfields: Dict[str, Any] = field(default_factory=dict)
+    updated: Optional[datetime] = None
+    components: Optional[List[str]] = None
 
     @classmethod
-    def from_json(cls, json: Dict[str, Any]) -> 'Issue':
+    def from_json(
+        cls, json: Dict[str, Any], pool: Optional[InternPool] = None
+    ) -> 'Issue':
         issue = cls(json['key'])
 
         if 'fields' in json:
             fields = json['fields']
-            issue.summary = fields.get('summary', '').rstrip()
-            issue.description = fields.get('description')
-            issue.creator = UserDetails.from_json(fields.get('creator'))
-            if 'created' in fields:
-                issue.created = datetime.fromisoformat(
-                    fields['created'].replace('+0000', '+00:00')
-                )
-            if 'resolutiondate' in fields and fields['resolutiondate']:
-                issue.resolutiondate = datetime.fromisoformat(
-                    fields['resolutiondate'].replace('+0000', '+00:00')
-                )
-            issue.assignee = UserDetails.from_json(fields.get('assignee'))
-            if 'status' in fields:
-                issue.status = StatusDetails.from_json(fields['status'])
-
-            resolution = fields.get('resolution', None)
-            if resolution:
-                issue.resolution = Resolution.from_json(resolution)
-            else:
-                issue.resolution = None
-
-            issue.labels = fields.get('labels', None)
-
-            links = []
-            if 'issuelinks' in fields:
-                links = [IssueLink.from_json(link) for link in fields['issuelinks']]
-            issue.links = links
-
-            issue.customfields = {}
-
-            for key, value in fields.items():
-                if key.startswith('customfield_'):
-                    issue.customfields[key] = value
+
+            for name, decode in ISSUE_FIELD_DECODERS.items():
+                setattr(issue, name, decode(fields, pool))
 
         return issue
 
@@ -83,7 +171,7 @@ class Issue:
         return self.key
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueLinkType:
     name: str
     inward: str
@@ -94,22 +182,24 @@ class IssueLinkType:
         return cls(json['name'], json['inward'], json['outward'])
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueLink:
     link_type: IssueLinkType
     inward_issue: Optional[Issue] = None
     outward_issue: Optional[Issue] = None
 
     @classmethod
-    def from_json(cls, json: Dict[str, Any]) -> 'IssueLink':
+    def from_json(
+        cls, json: Dict[str, Any], pool: Optional[InternPool] = None
+    ) -> 'IssueLink':
         link_type = IssueLinkType.from_json(json['type'])
         issue_link = cls(link_type)
 
         if 'outwardIssue' in json:
-            issue_link.outward_issue = Issue.from_json(json['outwardIssue'])
+            issue_link.outward_issue = Issue.from_json(json['outwardIssue'], pool)
 
         if 'inwardIssue' in json:
-            issue_link.inward_issue = Issue.from_json(json['inwardIssue'])
+            issue_link.inward_issue = Issue.from_json(json['inwardIssue'], pool)
 
         return issue_link
 
@@ -128,7 +218,7 @@ class IssueLink:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TransitionField:
     id: str
     name: str
@@ -144,7 +234,7 @@ class TransitionField:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Transition:
     id: str
     name: str
@@ -159,7 +249,7 @@ class Transition:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Comment:
     id: str
     body: str
@@ -178,7 +268,7 @@ class Comment:
         return self.body
 
 
-@dataclass
+@dataclass(slots=True)
 class Comments:
     comments: List[Comment]
     start_at: int
@@ -195,7 +285,7 @@ class Comments:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Sprint:
     identifier: str
     name: str
@@ -209,7 +299,7 @@ class Sprint:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatusDetails:
     identifier: str
     name: str
@@ -217,33 +307,40 @@ class StatusDetails:
     status_category: 'StatusCategory'
 
     @classmethod
-    def from_json(cls, json: Dict[str, Any]) -> 'StatusDetails':
-        return cls(
+    def from_json(
+        cls, json: Dict[str, Any], pool: Optional[InternPool] = None
+    ) -> 'StatusDetails':
+        return create(pool)(
+            cls,
             json['id'],
             json['name'],
             json.get('description', None),
-            StatusCategory.from_json(json['statusCategory']),
+            StatusCategory.from_json(json['statusCategory'], pool),
         )
 
     def __str__(self) -> str:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Resolution:
     identifier: str
     name: str
     description: Optional[str]
 
     @classmethod
-    def from_json(cls, json: Dict[str, Any]) -> 'Resolution':
-        return cls(json['id'], json['name'], json.get('description', None))
+    def from_json(
+        cls, json: Dict[str, Any], pool: Optional[InternPool] = None
+    ) -> 'Resolution':
+        return create(pool)(
+            cls, json['id'], json['name'], json.get('description', None)
+        )
 
     def __str__(self) -> str:
         return self.name
 
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     filename: Optional[str]
     size: int
@@ -258,7 +355,7 @@ class Attachment:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResults:
     # https://docs.atlassian.com/software/jira/docs/api/REST/8.22.6/#search-search
 
@@ -269,9 +366,19 @@ class SearchResults:
     total: int
 
     @classmethod
-    def from_json(cls, json: Dict[str, Any]) -> 'SearchResults':
+    def from_json(
+        cls,
+        json: Dict[str, Any],
+        pool: Optional[InternPool] = None,
+        lazy: bool = False,
+    ) -> 'SearchResults':
+        if pool is None:
+            pool = InternPool()
+
+        issue_class = LazyIssue if lazy else Issue
+
         return cls(
-            issues=list(map(Issue.from_json, json['issues'])),
+            issues=[issue_class.from_json(issue, pool) for issue in json['issues']],
             expand=json.get('expand', '').split(','),
             start_at=json['startAt'],
             max_results=json['maxResults'],
@@ -282,15 +389,64 @@ class SearchResults:
         return f'<SearchResults issues={len(self.issues)} start_at={self.start_at} total={self.total}>'
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatusCategory:
     id: str
     key: str
     name: str
 
     @classmethod
-    def from_json(cls, json: Dict[str, Any]) -> 'StatusCategory':
-        return cls(json['id'], json['key'], json['name'])
+    def from_json(
+        cls, json: Dict[str, Any], pool: Optional[InternPool] = None
+    ) -> 'StatusCategory':
+        return create(pool)(cls, json['id'], json['key'], json['name'])
 
     def __str__(self) -> str:
         return self.name
+
+
+def lazy_field(name: str) -> property:
+    slot = Issue.__dict__[name]
+    decode = ISSUE_FIELD_DECODERS[name]
+
+    def get(issue: 'LazyIssue') -> Any:
+        try:
+            return slot.__get__(issue, Issue)
+        except AttributeError:
+            value = decode(issue.raw_fields, issue.pool)
+            slot.__set__(issue, value)
+            return value
+
+    def set(issue: 'LazyIssue', value: Any) -> None:
+        slot.__set__(issue, value)
+
+    return property(get, set)
+
+
+class LazyIssue(Issue):
+    """
+    An issue which keeps the JSON fields returned by JIRA, each attribute is
+    only decoded, and then memoised, once it is first accessed.
+    """
+
+    __slots__ = ('raw_fields', 'pool')
+
+    raw_fields: Dict[str, Any]
+    pool: Optional[InternPool]
+
+    @classmethod
+    def from_json(
+        cls, json: Dict[str, Any], pool: Optional[InternPool] = None
+    ) -> Issue:
+        if 'fields' not in json:
+            return Issue(json['key'])
+
+        issue = cls.__new__(cls)
+        issue.key = json['key']
+        issue.raw_fields = json['fields']
+        issue.pool = pool
+        return issue
+
+
+for name in ISSUE_FIELD_DECODERS:
+    setattr(LazyIssue, name, lazy_field(name))
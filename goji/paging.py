@@ -0,0 +1,184 @@
+"""
+Page sizing and keyset pagination for paginated searches.
+
+The cost of a page of search results depends heavily upon the fields which
+are requested, a page of keys and summaries is a fraction of the size of a
+page with descriptions and changelogs. Rather than relying upon the server's
+default page size, `PageSizer` starts with a large page and tunes the size
+of each following page from the latency and payload size observed for the
+previous pages.
+
+The chosen sizes are logged to the `goji.paging` logger at debug level and
+recorded in `PageSizer.history`.
+
+Paginating with `startAt` becomes slower the deeper the offset, and issues
+are skipped or repeated when the results change during the search. `Keyset`
+instead orders the results by key and requests each page as the issues after
+the last key seen, so every page is a query from offset zero.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from goji.jql import split_order_by
+
+logger = logging.getLogger('goji.paging')
+
+# JIRA Server and Data Center cap `maxResults` at 1000 by default
+DEFAULT_INITIAL_SIZE = 1000
+DEFAULT_MINIMUM_SIZE = 25
+DEFAULT_MAXIMUM_SIZE = 1000
+
+# Page sizes aim for responses within these bounds
+DEFAULT_TARGET_LATENCY = 2.0
+DEFAULT_TARGET_BYTES = 8 * 1024 * 1024
+
+# Limits how quickly the page size may grow between pages, shrinking is not
+# limited so that slow responses are backed off from immediately
+MAXIMUM_GROWTH = 2.0
+
+
+@dataclass(slots=True)
+class PageSample:
+    requested: int
+    returned: int
+    max_results: int
+    elapsed: float
+    size: int
+    next_size: int
+
+
+class PageSizer:
+    """
+    Chooses the page size of each request of a paginated search.
+
+    The size is estimated from the time and bytes taken per issue by the
+    previous page such that a page takes around `target_latency` seconds
+    and `target_bytes` bytes. When the server returns fewer results per page
+    than requested with a lower `maxResults`, the server's limit becomes the
+    maximum page size.
+
+    A sizer may be shared by searches running on several threads, pages are
+    recorded one at a time.
+    """
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_SIZE,
+        minimum: int = DEFAULT_MINIMUM_SIZE,
+        maximum: int = DEFAULT_MAXIMUM_SIZE,
+        target_latency: float = DEFAULT_TARGET_LATENCY,
+        target_bytes: int = DEFAULT_TARGET_BYTES,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.target_bytes = target_bytes
+        self.size = self.clamp(initial)
+        self.history: List[PageSample] = []
+        self.lock = threading.Lock()
+
+    def clamp(self, size: float) -> int:
+        return int(max(self.minimum, min(self.maximum, size)))
+
+    def record(
+        self,
+        requested: int,
+        returned: int,
+        max_results: Optional[int],
+        elapsed: float,
+        size: int,
+    ) -> int:
+        """
+        Records a page of results, returning the size of the next page.
+        """
+
+        with self.lock:
+            if max_results and max_results < requested:
+                # The server caps the page size
+                self.maximum = max(max_results, 1)
+                self.minimum = min(self.minimum, self.maximum)
+
+            next_size = float(self.size)
+
+            if returned > 0:
+                estimates = [self.size * MAXIMUM_GROWTH]
+
+                if elapsed > 0:
+                    estimates.append(self.target_latency * returned / elapsed)
+
+                if size > 0:
+                    estimates.append(self.target_bytes * returned / size)
+
+                next_size = min(estimates)
+
+            self.size = self.clamp(next_size)
+            self.history.append(
+                PageSample(
+                    requested, returned, max_results or 0, elapsed, size, self.size
+                )
+            )
+
+            logger.debug(
+                'Page of %d/%d issues (%d bytes) took %.2fs, next page size %d',
+                returned,
+                requested,
+                size,
+                elapsed,
+                self.size,
+            )
+
+            return self.size
+
+
+def project_key(issue_key: str) -> str:
+    return issue_key.rsplit('-', 1)[0]
+
+
+class Keyset:
+    """
+    The position of a search paginated by key.
+
+    JIRA orders keys by project and then by number, but only compares keys
+    within a project. Once the results move onto the next project, the
+    previous project is excluded from the following pages instead.
+    """
+
+    def __init__(self, query: str):
+        self.conditions, _ = split_order_by(query)
+        self.last_key: Optional[str] = None
+        self.completed: List[str] = []
+
+    def query(self) -> str:
+        """
+        Returns the JQL for the page after the last key seen.
+        """
+
+        clauses = []
+
+        if self.conditions.strip():
+            clauses.append(f'({self.conditions})')
+
+        if self.last_key:
+            project = project_key(self.last_key)
+            excluded = ', '.join(f'"{key}"' for key in self.completed + [project])
+            clauses.append(
+                f'((project = "{project}" AND key > "{self.last_key}") '
+                f'OR project NOT IN ({excluded}))'
+            )
+
+        if clauses:
+            return ' AND '.join(clauses) + ' ORDER BY key ASC'
+
+        return 'ORDER BY key ASC'
+
+    def advance(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            if self.last_key:
+                project = project_key(self.last_key)
+                if project_key(key) != project and project not in self.completed:
+                    self.completed.append(project)
+
+            self.last_key = key
@@ -0,0 +1,165 @@
+"""
+Support for plugins, this API is somewhat unstable, it may change between versions.
+
+Plugins are either modules named `goji_*` found on `sys.path` or registered
+through the `goji.plugins` entry point group. A plugin provides a `__main__`
+callable taking the client and the command line arguments, an entry point may
+refer to such a callable directly.
+
+Discovering plugins does not import them. The discovered plugins are recorded
+in an index within the cache directory which is rebuilt whenever an entry of
+`sys.path` is modified, and a plugin is only imported once its command is
+invoked.
+"""
+
+import importlib
+import json
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import click
+
+from goji.cache import cache_directory
+
+PLUGIN_PREFIX = 'goji_'
+ENTRY_POINT_GROUP = 'goji.plugins'
+
+index_cache: Optional[Tuple[Any, Dict[str, str]]] = None
+
+
+def index_key() -> List[Any]:
+    key = []
+
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or '.').st_mtime_ns
+        except OSError:
+            mtime = None
+
+        key.append([path, mtime])
+
+    return key
+
+
+def scan_plugins() -> Dict[str, str]:
+    """
+    Returns a mapping of plugin command names to their import target.
+    """
+
+    import pkgutil
+    from importlib.metadata import entry_points
+
+    plugins = {
+        name: name
+        for _, name, _ in pkgutil.iter_modules()
+        if name.startswith(PLUGIN_PREFIX)
+    }
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        plugins[entry_point.name] = entry_point.value
+
+    return plugins
+
+
+def discover_plugins() -> Dict[str, str]:
+    global index_cache
+
+    key = index_key()
+    if index_cache and index_cache[0] == key:
+        return index_cache[1]
+
+    path = cache_directory() / 'plugins.json'
+    plugins = None
+
+    try:
+        with open(path) as fp:
+            index = json.load(fp)
+
+        if index['key'] == key:
+            plugins = index['plugins']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    if plugins is None:
+        plugins = scan_plugins()
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as fp:
+                json.dump({'key': key, 'plugins': plugins}, fp)
+        except OSError:
+            pass
+
+    index_cache = (key, plugins)
+    return plugins
+
+
+def load_plugin(target: str) -> Any:
+    module_name, _, attribute = target.partition(':')
+    plugin: Any = importlib.import_module(module_name)
+
+    for name in filter(None, attribute.split('.')):
+        plugin = getattr(plugin, name)
+
+    return plugin
+
+
+class PluginCommand(click.Command):
+    """
+    A command for a plugin that is not imported until it is invoked.
+    """
+
+    def __init__(self, name: str, target: str):
+        self.target = target
+        self.main_function: Optional[Callable] = None
+        super().__init__(
+            name,
+            callback=click.pass_obj(self.invoke_plugin),
+            params=[click.Argument(['args'], nargs=-1, type=click.UNPROCESSED)],
+            context_settings=dict(ignore_unknown_options=True),
+            short_help=f'Plugin command from {target}',
+        )
+
+    def load(self) -> Callable:
+        if self.main_function is None:
+            try:
+                plugin = load_plugin(self.target)
+            except Exception as e:
+                raise click.ClickException(
+                    f'Failed to load plugin {self.name}: {repr(e)}'
+                )
+
+            self.main_function = getattr(plugin, '__main__', plugin)
+            self.help = getattr(plugin, '__doc__', None)
+
+        return self.main_function
+
+    def format_help_text(self, ctx, formatter) -> None:
+        self.load()
+        super().format_help_text(ctx, formatter)
+
+    def invoke_plugin(self, client, args) -> None:
+        self.load()(client, args)
+
+
+class PluginGroup(click.Group):
+    """
+    A command group which additionally lists the discovered plugins.
+    """
+
+    def list_commands(self, ctx) -> List[str]:
+        commands = set(super().list_commands(ctx))
+        commands.update(discover_plugins())
+        return sorted(commands)
+
+    def get_command(self, ctx, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command:
+            return command
+
+        target = discover_plugins().get(cmd_name)
+        if target:
+            return PluginCommand(cmd_name, target)
+
+        return None
@@ -0,0 +1,200 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Tuple
+
+RETRY_STATUS_CODES = (429, 503)
+
+
+def parse_timestamp(value: str) -> Optional[float]:
+    """
+    Parses a rate limit reset header into a unix timestamp, JIRA Cloud sends
+    ISO 8601 dates while other servers send epoch seconds.
+    """
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        date = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return date.timestamp()
+
+
+def retry_after(response) -> Optional[float]:
+    """
+    Returns the amount of seconds the server asked us to wait before trying
+    again, via either the `Retry-After` or `X-RateLimit-Reset` header.
+    """
+
+    value = response.headers.get('Retry-After')
+    if value:
+        from email.utils import parsedate_to_datetime
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            date = None
+
+        if date:
+            return max(date.timestamp() - time.time(), 0)
+
+    if response.headers.get('X-RateLimit-Remaining') == '0':
+        return rate_limit_reset(response)
+
+    return None
+
+
+def rate_limit_reset(response) -> Optional[float]:
+    value = response.headers.get('X-RateLimit-Reset')
+    if not value:
+        return None
+
+    reset = parse_timestamp(value)
+    if reset is None:
+        return None
+
+    # Small values are relative delays rather than epoch timestamps
+    if reset < 1_000_000_000:
+        return max(reset, 0)
+
+    return max(reset - time.time(), 0)
+
+
+class RetryPolicy:
+    """
+    Retries idempotent requests which were rate limited or failed with a
+    temporary server error, after a full jitter exponential backoff capped
+    at `max_backoff`. The server's `Retry-After` is honoured as the minimum
+    delay, however long it is.
+    """
+
+    def __init__(
+        self,
+        retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 60,
+        status_codes: Tuple[int, ...] = RETRY_STATUS_CODES,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.status_codes = status_codes
+        self.sleep = sleep
+
+    def should_retry(self, response, attempt: int) -> bool:
+        return attempt < self.retries and response.status_code in self.status_codes
+
+    def delay(self, response, attempt: int) -> float:
+        backoff = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        return max(retry_after(response) or 0, backoff)
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket limiting the rate of requests, permitting
+    bursts of up to `capacity` requests and refilling at `rate` requests per
+    second. Use `TokenBucket.for_profile` to share one budget between every
+    client of a profile, the most recently requested rate applies to every
+    client of the profile.
+    """
+
+    buckets: Dict[str, 'TokenBucket'] = {}
+    buckets_lock = threading.Lock()
+
+    @classmethod
+    def for_profile(
+        cls, profile: str, rate: float, capacity: Optional[float] = None
+    ) -> 'TokenBucket':
+        with cls.buckets_lock:
+            bucket = cls.buckets.get(profile)
+            if bucket is None:
+                bucket = cls.buckets[profile] = cls(rate, capacity)
+            elif bucket.rate != rate or (capacity and bucket.capacity != capacity):
+                bucket.set_rate(rate, capacity)
+
+            return bucket
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated_at = clock()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None) -> None:
+        """
+        Changes the rate and capacity, tokens accrued at the previous rate
+        are kept up to the new capacity.
+        """
+
+        with self.lock:
+            self.refill(self.clock())
+            self.rate = rate
+            self.capacity = capacity or max(rate, 1)
+            self.tokens = min(self.tokens, self.capacity)
+
+    def reserve(self) -> float:
+        """
+        Takes a token, returning the seconds to wait until it may be used.
+        Tokens may be reserved ahead of time so that waiting callers are
+        served in order.
+        """
+
+        with self.lock:
+            now = self.clock()
+            self.refill(now)
+            self.tokens -= 1
+
+            delay = max(self.paused_until - now, 0)
+            if self.tokens < 0:
+                delay = max(delay, -self.tokens / self.rate)
+
+        return delay
+
+    def acquire(self) -> None:
+        """
+        Takes a token, blocking until one is available.
+        """
+
+        delay = self.reserve()
+        if delay > 0:
+            self.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Holds back every caller for the given duration, used when the server
+        reports that the rate limit has been exhausted.
+        """
+
+        with self.lock:
+            self.paused_until = max(self.paused_until, self.clock() + seconds)
@@ -1,13 +1,24 @@
 import importlib
-from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from urllib.parse import quote, urljoin
 
 import toml
 
+from goji.aggregation import Accumulator, Aggregation, GroupKey, aggregate
 from goji.client import JIRAClient
-from goji.models import Issue, UserDetails
+from goji.models import ISSUE_FIELD_DECODERS, Issue, UserDetails
+from goji.timeseries import TimeSeries, rolling_mean
+
+# Amount of widgets loaded concurrently
+DEFAULT_CONCURRENCY = 4
+
+# Colours of the lines of a chart, in order
+CHART_COLORS = ('#3e4349', '#2a9d8f', '#e76f51')
 
 HTML_ESCAPE_DICT = [
     ('&', '&amp;'),
@@ -92,11 +103,191 @@ td {
 '''
 
 
+HTML_ESCAPE_TABLE = str.maketrans(dict(HTML_ESCAPE_DICT))
+
+# Amount of characters of HTML buffered before being written out
+BUFFER_SIZE = 64 * 1024
+
+DATETIME_FORMAT = '%y-%m-%d %H:%M'
+
+# Issue fields by the type of their values, used to choose the formatting of
+# a column once rather than for every cell
+DATETIME_FIELDS = ('created', 'resolutiondate', 'updated')
+USER_FIELDS = ('creator', 'assignee')
+LIST_FIELDS = ('labels', 'components', 'links')
+TEXT_FIELDS = ('summary', 'description')
+
+
 def html_escape(text: str) -> str:
-    for escape, replacement in HTML_ESCAPE_DICT:
-        text = text.replace(escape, replacement)
+    return text.translate(HTML_ESCAPE_TABLE)
+
+
+class BufferedOutput:
+    """
+    Collects the HTML written to it, writing it out to the underlying output
+    in chunks of around `size` characters.
+    """
+
+    def __init__(self, output, size: int = BUFFER_SIZE):
+        self.output = output
+        self.size = size
+        self.parts: List[str] = []
+        self.length = 0
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+        self.length += len(text)
+
+        if self.length >= self.size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.parts:
+            self.output.write(''.join(self.parts))
+            self.parts.clear()
+            self.length = 0
+
+
+def cell_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+
+    if isinstance(value, UserDetails):
+        return value.name
+
+    if isinstance(value, list):
+        return ', '.join([str(v) for v in value])
+
+    return value
+
+
+def format_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime(DATETIME_FORMAT) if value else None
+
+
+def format_user(value: Optional[UserDetails]) -> Optional[str]:
+    return value.name if value else None
+
+
+def format_list(value: Optional[List[Any]]) -> Optional[str]:
+    return ', '.join([str(v) for v in value]) if value else None
+
+
+def line_chart(
+    series: List[Tuple[str, Sequence[float]]], width: int = 750, height: int = 200
+) -> str:
+    """
+    Renders the series as lines of an inline SVG chart, with a legend below.
+    """
+
+    count = max((len(values) for _, values in series), default=0)
+    maximum = max((max(values, default=0) for _, values in series), default=0)
+    step = width / max(count - 1, 1)
+    scale = height / (maximum or 1)
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height + 20}">'
+    ]
+
+    for index, (name, values) in enumerate(series):
+        color = CHART_COLORS[index % len(CHART_COLORS)]
+        points = ' '.join(
+            f'{x * step:.1f},{height - value * scale:.1f}'
+            for x, value in enumerate(values)
+        )
+        parts.append(
+            f'<polyline fill="none" stroke="{color}" stroke-width="2" '
+            f'points="{points}"><title>{html_escape(name)}</title></polyline>'
+        )
+        parts.append(
+            f'<text x="{index * 120}" y="{height + 16}" fill="{color}">'
+            f'{html_escape(name)}</text>'
+        )
+
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+@dataclass(slots=True)
+class IssueQuery:
+    """
+    A search whose issues a widget renders, along with the fields it reads.
+    """
+
+    query: str
+    fields: List[str]
+
+
+@dataclass(slots=True)
+class SharedSearch:
+    query: str
+    fields: List[str] = field(default_factory=list)
+    widgets: List['Widget'] = field(default_factory=list)
+
+    def add(self, widget: 'Widget', fields: List[str]) -> None:
+        self.widgets.append(widget)
+        self.fields.extend(name for name in fields if name not in self.fields)
+
+    def load(self, client: JIRAClient) -> None:
+        aggregations: List[Accumulator] = []
+        consumers: List[Widget] = []
+
+        for widget in self.widgets:
+            widget_aggregations = widget.aggregations()
+            if widget_aggregations:
+                aggregations.extend(widget_aggregations)
+            else:
+                consumers.append(widget)
+
+        # Issues are only held in memory when a widget consumes them, the
+        # aggregations are otherwise fed as the issues are fetched
+        issues: Iterable[Issue] = client.search_all(
+            query=self.query, fields=self.fields, lazy=not consumers, adaptive=True
+        )
+        if consumers:
+            issues = list(issues)
+
+        aggregate(issues, aggregations)
+
+        for widget in consumers:
+            widget.consume(issues)
+
+
+def plan_searches(widgets: Iterable['Widget']) -> List[Callable[[], None]]:
+    """
+    Plans the loading of the given widgets, widgets with identical queries
+    are fed from a single search requesting the union of their fields.
+    Returns the tasks which load the widgets.
+    """
+
+    searches: Dict[str, SharedSearch] = {}
+    tasks: List[Callable[[], None]] = []
+
+    for widget in widgets:
+        issue_query = widget.issue_query()
+
+        if issue_query is None:
+            tasks.append(widget.load)
+            continue
+
+        query = issue_query.query.strip()
+        if query not in searches:
+            searches[query] = SharedSearch(query)
+            tasks.append(partial(searches[query].load, widget.client))
+
+        searches[query].add(widget, issue_query.fields)
+
+    return tasks
+
 
-    return text
+def format_number(value: Optional[float]) -> str:
+    if value is None:
+        return ''
+
+    if value == int(value):
+        return str(int(value))
+
+    return f'{value:.2f}'
 
 
 class Widget:
@@ -114,16 +305,71 @@ class Widget:
         self.client = client
         self.title = title
 
+    def issue_query(self) -> Optional[IssueQuery]:
+        """
+        Returns the search whose issues the widget renders, if any. The
+        issues of the search are passed to `consume` when the widget loads.
+        """
+
+        return None
+
+    def aggregations(self) -> List[Accumulator]:
+        """
+        Returns new aggregations to feed with the issues of the widget's
+        search. A widget with aggregations is not passed the issues.
+        """
+
+        return []
+
+    def consume(self, issues: List[Issue]) -> None:
+        """
+        Receives the issues of the widget's search. The issues may be shared
+        with other widgets and must not be modified.
+        """
+
+    def load(self) -> None:
+        """
+        Fetches the data the widget renders. Widgets are loaded concurrently
+        with the other widgets of a report, and rendered in order afterwards.
+        """
+
+        issue_query = self.issue_query()
+
+        if issue_query is not None:
+            SharedSearch(issue_query.query, issue_query.fields, [self]).load(
+                self.client
+            )
+
     def render(self, output) -> None:
         pass
 
 
 class ReportWidget(Widget):
-    def __init__(self, title: str, widgets):
+    def __init__(self, title: str, widgets, concurrency: int = DEFAULT_CONCURRENCY):
         self.title = title
         self.widgets = widgets
+        self.concurrency = concurrency
+
+    def load(self) -> None:
+        tasks = plan_searches(self.widgets)
+
+        if self.concurrency <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                task()
+            return
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            # Consuming the results re-raises the first error of a task
+            list(executor.map(lambda task: task(), tasks))
 
     def render(self, output) -> None:
+        self.load()
+
+        buffer = BufferedOutput(output)
+        self.render_document(buffer)
+        buffer.flush()
+
+    def render_document(self, output) -> None:
         output.write('<html>')
         output.write('<head>')
         output.write(f'<style>{CSS}</style>')
@@ -141,6 +387,15 @@ class ReportWidget(Widget):
 
 
 class IssueListWidget(Widget):
+    @staticmethod
+    def required_fields(columns: List[str]) -> List[str]:
+        """
+        Returns the issue fields read in order to render the given columns,
+        each column reads the issue field of the same name.
+        """
+
+        return list(dict.fromkeys(['key'] + columns))
+
     @classmethod
     def from_config(cls, client: JIRAClient, config: Dict[str, Any], **kwargs):
         kwargs['fields'] = config.pop('fields', ['key'])
@@ -179,6 +434,49 @@ class IssueListWidget(Widget):
 
         return field.capitalize()
 
+    def compile_column(self, field: str) -> Callable[[Issue], str]:
+        """
+        Returns a function rendering the cell of the column for an issue.
+        """
+
+        if field == 'key':
+            browse_url = html_escape(urljoin(self.client.base_url, 'browse/'))
+
+            def key_cell(issue: Issue) -> str:
+                key = html_escape(issue.key)
+                return f'<td><a href="{browse_url}{key}">{key}</a></td>'
+
+            return key_cell
+
+        accessor: Callable[[Issue], Any]
+        formatter: Callable[[Any], Any] = cell_value
+
+        if hasattr(self, f'get_{field}'):
+            accessor = getattr(self, f'get_{field}')
+        elif field in ISSUE_FIELD_DECODERS:
+            accessor = attrgetter(field)
+
+            if field in DATETIME_FIELDS:
+                formatter = format_datetime
+            elif field in USER_FIELDS:
+                formatter = format_user
+            elif field in LIST_FIELDS:
+                formatter = format_list
+            elif field in TEXT_FIELDS:
+                formatter = lambda value: value
+        else:
+            accessor = lambda issue: issue.customfields.get(field)
+
+        def cell(issue: Issue) -> str:
+            value = formatter(accessor(issue))
+
+            if value:
+                return f'<td>{html_escape(str(value))}</td>'
+
+            return '<td></td>'
+
+        return cell
+
     def render(self, output) -> None:
         title = self.title or 'Search'
         output.write(f'<h2>{html_escape(title)}</h2>')
@@ -192,35 +490,11 @@ class IssueListWidget(Widget):
         output.write('</tr></thead>')
 
         # Rows
+        cells = [self.compile_column(field) for field in self.fields]
+
         output.write('<tbody>')
         for issue in self.issues:
-            output.write('<tr>')
-            for field in self.fields:
-                if hasattr(self, f'get_{field}'):
-                    value = getattr(self, f'get_{field}')(issue)
-                elif field in issue.customfields:
-                    value = issue.customfields[field]
-                else:
-                    value = getattr(issue, field)
-
-                if isinstance(value, datetime):
-                    value = value.strftime('%y-%m-%d %H:%M')
-                elif isinstance(value, UserDetails):
-                    value = value.name
-                elif isinstance(value, list):
-                    value = ', '.join([str(v) for v in value])
-
-                if field == 'key':
-                    url = urljoin(self.client.base_url, f'browse/{issue.key}')
-                    output.write(
-                        f'<td><a href="{html_escape(url)}">{html_escape(value)}</a></td>'
-                    )
-                elif value:
-                    output.write(f'<td>{html_escape(str(value))}</td>')
-                else:
-                    output.write(f'<td></td>')
-
-            output.write('</tr>')
+            output.write('<tr>' + ''.join([cell(issue) for cell in cells]) + '</tr>')
         output.write('</tbody>')
 
         output.write('</table>')
@@ -229,10 +503,27 @@ class IssueListWidget(Widget):
 class SearchWidget(IssueListWidget):
     @classmethod
     def from_config(cls, client: JIRAClient, config: Dict[str, Any], **kwargs):
-        query = config.pop('query', '')
-        kwargs['issues'] = list(client.search_all(query=query, fields=config['fields']))
+        kwargs['query'] = config.pop('query', '')
         return super().from_config(client, config, **kwargs)
 
+    def __init__(
+        self,
+        client: JIRAClient,
+        title: Optional[str],
+        fields: List[str],
+        display_names: Dict[str, str],
+        query: str,
+        issues: Optional[List[Issue]] = None,
+    ):
+        self.query = query
+        super().__init__(client, title, fields, display_names, issues or [])
+
+    def issue_query(self) -> Optional[IssueQuery]:
+        return IssueQuery(self.query, self.required_fields(self.fields))
+
+    def consume(self, issues: List[Issue]) -> None:
+        self.issues = issues
+
 
 class StatisticsWidget(Widget):
     @classmethod
@@ -240,6 +531,8 @@ class StatisticsWidget(Widget):
         kwargs['query'] = config.pop('query', '')
         kwargs['field'] = config.pop('field', '')
         kwargs['results'] = config.pop('results', 10)
+        kwargs['sums'] = config.pop('sum', [])
+        kwargs['averages'] = config.pop('average', [])
         return super().from_config(client, config, **kwargs)
 
     def __init__(
@@ -247,58 +540,91 @@ class StatisticsWidget(Widget):
         client: JIRAClient,
         title: Optional[str],
         query: str,
-        field: str,
+        field: Union[str, List[str]],
         results: int,
+        sums: Optional[List[str]] = None,
+        averages: Optional[List[str]] = None,
     ):
         self.query = query
-        self.field = field
+        self.group_by = [field] if isinstance(field, str) else list(field)
         self.results = results
+        self.sums = sums or []
+        self.averages = averages or []
+        self.aggregation: Optional[Aggregation] = None
         super().__init__(client, title)
 
-    def get_issues(self):
-        return self.client.search_all(query=self.query, fields=[self.field])
+    def issue_query(self) -> Optional[IssueQuery]:
+        return IssueQuery(self.query, self.new_aggregation().fields)
+
+    def new_aggregation(self) -> Aggregation:
+        measures = list(dict.fromkeys(self.sums + self.averages))
+        return Aggregation(self.group_by, measures)
+
+    def aggregations(self) -> List[Accumulator]:
+        self.aggregation = self.new_aggregation()
+        return [self.aggregation]
+
+    def group_jql(self, key: GroupKey) -> str:
+        clauses = []
+
+        for field, name in zip(self.group_by, key):
+            if field == 'assignee' and name == 'Unassigned':
+                clauses.append(f'"{field}" is empty')
+            else:
+                clauses.append(f'"{field}" = "{name}"')
+
+        jql = ' and '.join(clauses)
+        if self.query:
+            jql += f' and {self.query}'
+
+        return jql
 
     def render(self, output) -> None:
+        if self.aggregation is None:
+            self.load()
+
+        assert self.aggregation is not None
+        aggregation = self.aggregation
+        measures = aggregation.measures
+
         title = self.title or 'Statistics'
         output.write(f'<h2>{html_escape(title)}</h2>')
         output.write('<table>')
 
         # Header
         output.write('<thead><tr>')
-        output.write(f'<th>{html_escape(self.field.capitalize())}</th>')
+        for field in self.group_by:
+            output.write(f'<th>{html_escape(field.capitalize())}</th>')
         output.write(f'<th>Count</th>')
+        for field in self.sums:
+            output.write(f'<th>{html_escape(f"Sum of {field}")}</th>')
+        for field in self.averages:
+            output.write(f'<th>{html_escape(f"Average of {field}")}</th>')
         output.write('</tr></thead>')
 
-        counter = Counter()
-
-        for issue in self.get_issues():
-            value = getattr(issue, self.field)
-            if self.field == 'assignee' and value is None:
-                value = 'Unassigned'
-
-            if isinstance(value, UserDetails):
-                value = value.name
-
-            if self.field == 'labels':
-                for label in value:
-                    counter[str(label)] += 1
-            else:
-                counter[str(value)] += 1
-
         # Rows
         output.write('<tbody>')
-        for name, count in counter.most_common(self.results):
-            jql = f'"{self.field}" = "{name}"'
-            if name == 'Unassigned':
-                jql = f'"{self.field}" is empty'
-            if self.query:
-                jql += ' and {self.query}'
-            url = urljoin(self.client.base_url, f'issues') + '?jql=' + quote(jql)
-            output.write('<tr>')
-            output.write(
-                f'<td><a href="{html_escape(url)}">{html_escape(name)}</a></td>'
+        for key, group in aggregation.most_common(self.results):
+            url = (
+                urljoin(self.client.base_url, f'issues')
+                + '?jql='
+                + quote(self.group_jql(key))
             )
-            output.write(f'<td>{html_escape(str(count))}</td>')
+            output.write('<tr>')
+            for index, name in enumerate(key):
+                if index == 0:
+                    output.write(
+                        f'<td><a href="{html_escape(url)}">{html_escape(name)}</a></td>'
+                    )
+                else:
+                    output.write(f'<td>{html_escape(name)}</td>')
+            output.write(f'<td>{html_escape(str(group.count))}</td>')
+            for field in self.sums:
+                measure = group.measures[measures.index(field)]
+                output.write(f'<td>{format_number(measure.total)}</td>')
+            for field in self.averages:
+                measure = group.measures[measures.index(field)]
+                output.write(f'<td>{format_number(measure.average)}</td>')
             output.write('</tr>')
         output.write('</tbody>')
 
@@ -308,16 +634,185 @@ class StatisticsWidget(Widget):
         if self.query:
             url += '?jql=' + quote(self.query)
         output.write(f'<td><a href="{url}">Total</a></td>')
-        output.write(f'<td>{html_escape(str(counter.total()))}</td>')
+        for _ in self.group_by[1:]:
+            output.write('<td></td>')
+        output.write(f'<td>{html_escape(str(aggregation.total))}</td>')
+        for _ in self.sums + self.averages:
+            output.write('<td></td>')
         output.write('</tr>')
         output.write('</tfoot>')
 
         output.write('</table>')
 
 
+class TimeSeriesWidget(Widget):
+    @classmethod
+    def from_config(cls, client: JIRAClient, config: Dict[str, Any], **kwargs):
+        kwargs['query'] = config.pop('query', '')
+        return super().from_config(client, config, **kwargs)
+
+    def __init__(self, client: JIRAClient, title: Optional[str], query: str):
+        self.query = query
+        self.series: Optional[TimeSeries] = None
+        super().__init__(client, title)
+
+    def issue_query(self) -> Optional[IssueQuery]:
+        return IssueQuery(self.query, TimeSeries.fields)
+
+    def aggregations(self) -> List[Accumulator]:
+        self.series = TimeSeries()
+        return [self.series]
+
+    def get_series(self) -> TimeSeries:
+        if self.series is None:
+            self.load()
+
+        assert self.series is not None
+        return self.series
+
+
+class ThroughputWidget(TimeSeriesWidget):
+    """
+    The amount of issues created and resolved each week, along with the
+    throughput of resolved issues per week over a rolling window of weeks.
+    """
+
+    @classmethod
+    def from_config(cls, client: JIRAClient, config: Dict[str, Any], **kwargs):
+        window = config.pop('window', 4)
+        if isinstance(window, bool) or not isinstance(window, int) or window < 1:
+            raise ValueError(f'window must be a positive number of weeks, not {window}')
+
+        kwargs['window'] = window
+        kwargs['chart'] = config.pop('chart', True)
+        return super().from_config(client, config, **kwargs)
+
+    def __init__(
+        self,
+        client: JIRAClient,
+        title: Optional[str],
+        query: str,
+        window: int = 4,
+        chart: bool = True,
+    ):
+        self.window = window
+        self.chart = chart
+        super().__init__(client, title, query)
+
+    def render(self, output) -> None:
+        weekly = self.get_series().weekly()
+        throughput = rolling_mean(weekly.resolved, self.window)
+
+        title = self.title or 'Throughput'
+        output.write(f'<h2>{html_escape(title)}</h2>')
+
+        if self.chart and weekly.weeks:
+            output.write(
+                line_chart(
+                    [
+                        ('Created', weekly.created),
+                        ('Resolved', weekly.resolved),
+                        ('Throughput', throughput),
+                    ]
+                )
+            )
+
+        output.write('<table>')
+
+        # Header
+        output.write('<thead><tr>')
+        output.write('<th>Week</th>')
+        output.write('<th>Created</th>')
+        output.write('<th>Resolved</th>')
+        output.write('<th>Throughput</th>')
+        output.write('</tr></thead>')
+
+        # Rows
+        output.write('<tbody>')
+        for index, week in enumerate(weekly.weeks):
+            output.write('<tr>')
+            output.write(f'<td>{week:%Y-%m-%d}</td>')
+            output.write(f'<td>{weekly.created[index]}</td>')
+            output.write(f'<td>{weekly.resolved[index]}</td>')
+            output.write(f'<td>{format_number(throughput[index])}</td>')
+            output.write('</tr>')
+        output.write('</tbody>')
+
+        output.write('</table>')
+
+
+class LeadTimeWidget(TimeSeriesWidget):
+    """
+    Percentiles of the lead time of resolved issues, in days from their
+    creation until their resolution. Time spent waiting before work started
+    is included, this is not cycle time.
+    """
+
+    @classmethod
+    def from_config(cls, client: JIRAClient, config: Dict[str, Any], **kwargs):
+        percentiles = config.pop('percentiles', [50, 85, 95])
+        if not isinstance(percentiles, list):
+            raise ValueError(f'percentiles must be a list, not {percentiles}')
+
+        for percentile in percentiles:
+            if (
+                isinstance(percentile, bool)
+                or not isinstance(percentile, (int, float))
+                or not 0 <= percentile <= 100
+            ):
+                raise ValueError(
+                    f'percentiles must be between 0 and 100, not {percentile}'
+                )
+
+        kwargs['percentiles'] = percentiles
+        return super().from_config(client, config, **kwargs)
+
+    def __init__(
+        self,
+        client: JIRAClient,
+        title: Optional[str],
+        query: str,
+        percentiles: Sequence[float] = (50, 85, 95),
+    ):
+        self.percentiles = percentiles
+        super().__init__(client, title, query)
+
+    def render(self, output) -> None:
+        series = self.get_series()
+        lead_times = series.lead_time_percentiles(self.percentiles)
+
+        title = self.title or 'Lead Time'
+        output.write(f'<h2>{html_escape(title)}</h2>')
+        output.write('<table>')
+
+        # Header
+        output.write('<thead><tr>')
+        output.write('<th>Percentile</th>')
+        output.write('<th>Days</th>')
+        output.write('</tr></thead>')
+
+        # Rows
+        output.write('<tbody>')
+        for percentile, lead_time in zip(self.percentiles, lead_times):
+            output.write('<tr>')
+            output.write(f'<td>{format_number(percentile)}%</td>')
+            output.write(f'<td>{format_number(lead_time)}</td>')
+            output.write('</tr>')
+        output.write('</tbody>')
+
+        output.write('<tfoot><tr>')
+        output.write('<td>Resolved</td>')
+        output.write(f'<td>{len(series.lead_times)}</td>')
+        output.write('</tr></tfoot>')
+
+        output.write('</table>')
+
+
 WIDGETS = {
     'search': SearchWidget,
     'statistics': StatisticsWidget,
+    'throughput': ThroughputWidget,
+    'lead_time': LeadTimeWidget,
 }
 
 
@@ -334,8 +829,16 @@ def create_widget(client, config) -> Widget:
     return widget_cls.from_config(client, config)
 
 
-def generate_report(client: JIRAClient, input) -> Widget:
+def generate_report(
+    client: JIRAClient, input, concurrency: Optional[int] = None
+) -> Widget:
     config = toml.load(input)
+
+    if concurrency is None:
+        concurrency = config.get('concurrency', DEFAULT_CONCURRENCY)
+
     return ReportWidget(
-        'Report', [create_widget(client, cfg) for cfg in config['widget']]
+        'Report',
+        [create_widget(client, cfg) for cfg in config['widget']],
+        concurrency=concurrency,
     )
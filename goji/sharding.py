@@ -0,0 +1,132 @@
+"""
+Sharding of large searches by creation date.
+
+Paginating through a large search with `startAt` becomes slower the further
+into the results a page is, and some servers refuse offsets beyond 10,000.
+A sharded search instead partitions the query into ranges of the `created`
+date holding at most `shard_size` issues each, so that each shard can be
+paginated without deep offsets and the shards can be fetched concurrently.
+
+Shards are planned by bisecting the range between the earliest and latest
+created issue, probing the amount of issues within a range with a search
+for zero results. The first and last shards are left open ended so that
+issues are never missed at the edges of the range, regardless of the time
+zone JIRA interprets the dates in.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from goji.jql import split_order_by
+
+# JQL compares dates at minute precision
+PRECISION = timedelta(minutes=1)
+
+DEFAULT_SHARD_SIZE = 5000
+
+
+@dataclass(slots=True)
+class Shard:
+    query: str
+    total: int
+
+
+def floor_minute(date: datetime) -> datetime:
+    return date.astimezone(timezone.utc).replace(second=0, microsecond=0)
+
+
+def floor_minute_delta(delta: timedelta) -> timedelta:
+    return max(PRECISION, delta - delta % PRECISION)
+
+
+def range_query(
+    conditions: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+    order_by: str = '',
+) -> str:
+    clauses = []
+
+    if conditions.strip():
+        clauses.append(f'({conditions})')
+
+    if start:
+        clauses.append(f'created >= "{start:%Y/%m/%d %H:%M}"')
+
+    if end:
+        clauses.append(f'created < "{end:%Y/%m/%d %H:%M}"')
+
+    query = ' AND '.join(clauses)
+
+    if order_by:
+        query += f' {order_by}'
+
+    return query
+
+
+def count(client, query: str) -> int:
+    return client.search(query, fields=['key'], max_results=0).total
+
+
+def created_date(client, query: str) -> Optional[datetime]:
+    results = client.search(query, fields=['created'], max_results=1)
+    if results.issues:
+        return results.issues[0].created
+
+    return None
+
+
+def plan_shards(
+    client, query: str, shard_size: int = DEFAULT_SHARD_SIZE
+) -> List[Shard]:
+    """
+    Partitions the query into shards holding at most `shard_size` issues,
+    in order of their creation dates. A range a minute long is never split
+    further, and so may exceed the shard size.
+    """
+
+    conditions, order_by = split_order_by(query)
+    total = count(client, range_query(conditions, None, None))
+
+    if total == 0:
+        return []
+
+    if total <= shard_size:
+        return [Shard(query, total)]
+
+    first = created_date(
+        client, range_query(conditions, None, None, 'ORDER BY created ASC')
+    )
+    last = created_date(
+        client, range_query(conditions, None, None, 'ORDER BY created DESC')
+    )
+
+    if first is None or last is None:
+        return [Shard(query, total)]
+
+    lower = floor_minute(first)
+    upper = floor_minute(last) + PRECISION
+    shards: List[Shard] = []
+
+    def bounds(start: datetime, end: datetime):
+        return (start if start > lower else None, end if end < upper else None)
+
+    def split(start: datetime, end: datetime, total: int) -> None:
+        if total == 0:
+            return
+
+        if total <= shard_size or end - start <= PRECISION:
+            shards.append(
+                Shard(range_query(conditions, *bounds(start, end), order_by), total)
+            )
+            return
+
+        middle = start + floor_minute_delta((end - start) / 2)
+        before = count(client, range_query(conditions, *bounds(start, middle)))
+
+        split(start, middle, before)
+        split(middle, end, max(total - before, 0))
+
+    split(lower, upper, total)
+    return shards
@@ -0,0 +1,457 @@
+import json
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import click
+
+from goji.jql import compile_query, split_order_by
+from goji.models import InternPool, Issue, LazyIssue, SearchResults
+
+# Issues updated within this window before the watermark are fetched again on
+# each sync, covering issues which JIRA had not yet indexed at the previous
+# sync. JQL compares dates at minute precision in the user's time zone.
+SYNC_OVERLAP = timedelta(minutes=5)
+
+# When the user's time zone is not known, the overlap covers any time zone
+# offset instead
+UNKNOWN_TIME_ZONE_OVERLAP = timedelta(days=1)
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    summary TEXT,
+    status TEXT,
+    assignee TEXT,
+    assignee_name TEXT,
+    resolution TEXT,
+    created TEXT,
+    updated TEXT,
+    resolutiondate TEXT,
+    json TEXT NOT NULL,
+    assignee_email TEXT
+);
+CREATE INDEX IF NOT EXISTS issues_status ON issues (status COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS issues_assignee ON issues (assignee COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS issues_assignee_name
+    ON issues (assignee_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS issues_created ON issues (created);
+CREATE INDEX IF NOT EXISTS issues_updated ON issues (updated);
+CREATE INDEX IF NOT EXISTS issues_resolutiondate ON issues (resolutiondate);
+
+CREATE TABLE IF NOT EXISTS labels (
+    key TEXT NOT NULL,
+    label TEXT NOT NULL,
+    PRIMARY KEY (key, label)
+);
+CREATE INDEX IF NOT EXISTS labels_label ON labels (label COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS queries (
+    jql TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS query_issues (
+    jql TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (jql, key)
+);
+CREATE INDEX IF NOT EXISTS query_issues_key ON query_issues (key);
+'''
+
+
+def data_directory() -> Path:
+    base = os.environ.get('XDG_DATA_HOME')
+    if base:
+        return Path(base) / 'goji'
+
+    return Path.home() / '.local' / 'share' / 'goji'
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+
+    return datetime.fromisoformat(value.replace('+0000', '+00:00'))
+
+
+def store_date(value: Optional[str]) -> Optional[str]:
+    """
+    Normalises a JIRA date to UTC so that dates in the store are ordered
+    lexicographically.
+    """
+
+    date = parse_date(value)
+    if date is None:
+        return None
+
+    return date.astimezone(timezone.utc).isoformat()
+
+
+def updated_since_query(
+    query: str, since: datetime, time_zone: Optional[tzinfo] = None
+) -> str:
+    """
+    Restricts the query to issues updated since the given date, written in
+    the time zone JIRA interprets the user's dates in.
+    """
+
+    conditions, order_by = split_order_by(query)
+    since = since.astimezone(time_zone or timezone.utc)
+    jql = f'updated >= "{since:%Y/%m/%d %H:%M}"'
+
+    if conditions.strip():
+        jql = f'({conditions}) AND {jql}'
+
+    if order_by:
+        jql += f' {order_by}'
+
+    return jql
+
+
+class IssueStore:
+    """
+    A local SQLite mirror of issues synced from a JIRA instance.
+
+    The issues are stored as returned by JIRA, alongside indexed columns for
+    commonly queried fields. The queries which have been synced are recorded
+    along with a watermark of the most recently updated issue, so that
+    subsequent syncs only fetch issues which have since been updated, and
+    the keys each query matched so that issues which no longer match any
+    synced query are removed.
+    """
+
+    @classmethod
+    def for_url(cls, base_url: str) -> 'IssueStore':
+        name = urlparse(base_url).netloc.replace(':', '_')
+        directory = data_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        return cls(directory / f'{name}.sqlite')
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(str(path), check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+        self.migrate()
+
+    def migrate(self) -> None:
+        columns = {
+            row[1] for row in self.connection.execute('PRAGMA table_info(issues)')
+        }
+
+        if 'assignee_email' not in columns:
+            with self.connection:
+                self.connection.execute(
+                    'ALTER TABLE issues ADD COLUMN assignee_email TEXT'
+                )
+                self.connection.execute(
+                    'UPDATE issues SET assignee_email = '
+                    "json_extract(json, '$.fields.assignee.emailAddress')"
+                )
+
+        self.connection.execute(
+            'CREATE INDEX IF NOT EXISTS issues_assignee_email '
+            'ON issues (assignee_email COLLATE NOCASE)'
+        )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def watermark(self, query: str) -> Optional[datetime]:
+        row = self.connection.execute(
+            'SELECT watermark FROM queries WHERE jql = ?', (query,)
+        ).fetchone()
+
+        if row:
+            return parse_date(row[0])
+
+        return None
+
+    def save(self, issues: Iterable[Dict[str, Any]]) -> Optional[str]:
+        """
+        Inserts or replaces the given issues, returning the latest `updated`
+        date of the issues.
+        """
+
+        latest = None
+
+        with self.connection:
+            for issue in issues:
+                fields = issue.get('fields', {})
+                assignee = fields.get('assignee') or {}
+                status = fields.get('status') or {}
+                resolution = fields.get('resolution') or {}
+                updated = store_date(fields.get('updated'))
+
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO issues (key, id, summary, status, '
+                    'assignee, assignee_name, assignee_email, resolution, '
+                    'created, updated, resolutiondate, json) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        issue['key'],
+                        issue.get('id'),
+                        fields.get('summary'),
+                        status.get('name'),
+                        assignee.get('name'),
+                        assignee.get('displayName'),
+                        assignee.get('emailAddress'),
+                        resolution.get('name'),
+                        store_date(fields.get('created')),
+                        updated,
+                        store_date(fields.get('resolutiondate')),
+                        json.dumps(issue),
+                    ),
+                )
+
+                self.connection.execute(
+                    'DELETE FROM labels WHERE key = ?', (issue['key'],)
+                )
+                self.connection.executemany(
+                    'INSERT OR IGNORE INTO labels VALUES (?, ?)',
+                    [(issue['key'], label) for label in fields.get('labels') or []],
+                )
+
+                if updated and (latest is None or updated > latest):
+                    latest = updated
+
+        return latest
+
+    def set_watermark(self, query: str, watermark: Optional[str]) -> None:
+        with self.connection:
+            self.connection.execute(
+                'INSERT INTO queries VALUES (?, ?, ?) ON CONFLICT (jql) DO UPDATE '
+                'SET watermark = coalesce(max(watermark, excluded.watermark), '
+                'watermark, excluded.watermark), '
+                'synced_at = excluded.synced_at',
+                (query, watermark, datetime.now(timezone.utc).isoformat()),
+            )
+
+    def set_query_keys(self, query: str, keys: Iterable[str]) -> int:
+        """
+        Records the keys matched by the query, removing the issues which the
+        query previously matched and no other synced query matches. Returns
+        the amount of issues removed.
+        """
+
+        keys = set(keys)
+
+        with self.connection:
+            previous = {
+                row[0]
+                for row in self.connection.execute(
+                    'SELECT key FROM query_issues WHERE jql = ?', (query,)
+                )
+            }
+            stale = [(query, key) for key in previous - keys]
+
+            self.connection.executemany(
+                'DELETE FROM query_issues WHERE jql = ? AND key = ?', stale
+            )
+            self.connection.executemany(
+                'INSERT OR IGNORE INTO query_issues VALUES (?, ?)',
+                [(query, key) for key in keys - previous],
+            )
+
+            removed = 0
+            for _, key in stale:
+                (matched,) = self.connection.execute(
+                    'SELECT count(*) FROM query_issues WHERE key = ?', (key,)
+                ).fetchone()
+
+                if matched == 0:
+                    self.connection.execute('DELETE FROM issues WHERE key = ?', (key,))
+                    self.connection.execute('DELETE FROM labels WHERE key = ?', (key,))
+                    removed += 1
+
+        return removed
+
+    def get_issue(self, key: str) -> Optional[Issue]:
+        row = self.connection.execute(
+            'SELECT json FROM issues WHERE key = ?', (key,)
+        ).fetchone()
+
+        if row:
+            return Issue.from_json(json.loads(row[0]))
+
+        return None
+
+    def search(
+        self,
+        query: str,
+        start_at: int = 0,
+        max_results: Optional[int] = None,
+        current_user: Optional[str] = None,
+        lazy: bool = False,
+    ) -> Tuple[List[Issue], int]:
+        """
+        Evaluates a JQL query against the stored issues, returning a page of
+        the matching issues along with the total amount of matches.
+        """
+
+        issues, total = self.search_json(query, start_at, max_results, current_user)
+        issue_class = LazyIssue if lazy else Issue
+        pool = InternPool()
+        return ([issue_class.from_json(issue, pool) for issue in issues], total)
+
+    def search_json(
+        self,
+        query: str,
+        start_at: int = 0,
+        max_results: Optional[int] = None,
+        current_user: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Like `search`, returning the issues as they were returned by JIRA.
+        """
+
+        where, order_by, parameters = compile_query(query, current_user)
+
+        (total,) = self.connection.execute(
+            f'SELECT count(*) FROM issues WHERE {where}', parameters
+        ).fetchone()
+
+        rows = self.connection.execute(
+            f'SELECT json FROM issues WHERE {where} ORDER BY {order_by} '
+            'LIMIT ? OFFSET ?',
+            parameters + [-1 if max_results is None else max_results, start_at],
+        )
+        return ([json.loads(row[0]) for row in rows], total)
+
+
+def user_time_zone(client) -> Optional[tzinfo]:
+    """
+    Returns the time zone of the user's profile, which JIRA interprets the
+    dates of their JQL in.
+    """
+
+    try:
+        name = client.get_time_zone()
+        return ZoneInfo(name) if name else None
+    except (ValueError, ZoneInfoNotFoundError):
+        return None
+
+
+def sync(client, store: IssueStore, query: str) -> int:
+    """
+    Syncs the issues matching the query into the store, returning the amount
+    of issues fetched. Only issues updated since the previous sync of the
+    query are fetched, paginated by key so that issues updated during the
+    sync are neither skipped nor fetched twice.
+
+    An issue which stops matching the query, such as an issue moved out of
+    a project, is not updated by the query. Each later sync therefore also
+    lists the keys of every matching issue, and removes the issues which
+    were deleted or no longer match any synced query from the store.
+    """
+
+    watermark = store.watermark(query)
+    jql = query
+    if watermark:
+        time_zone = user_time_zone(client)
+        overlap = SYNC_OVERLAP if time_zone else UNKNOWN_TIME_ZONE_OVERLAP
+        jql = updated_since_query(query, watermark - overlap, time_zone)
+
+    count = 0
+    latest = None
+    keys = set()
+
+    for page in client.search_pages(jql, adaptive=True, keyset=True):
+        updated = store.save(page['issues'])
+        count += len(page['issues'])
+        keys.update(issue['key'] for issue in page['issues'])
+
+        if updated and (latest is None or updated > latest):
+            latest = updated
+
+    if watermark:
+        keys = set()
+        for page in client.search_pages(
+            query, fields=['key'], adaptive=True, keyset=True
+        ):
+            keys.update(issue['key'] for issue in page['issues'])
+
+    store.set_query_keys(query, keys)
+    store.set_watermark(query, latest)
+    return count
+
+
+class OfflineClient(object):
+    """
+    Answers the read-only subset of `JIRAClient` from the local issue store,
+    searches are evaluated locally against every synced issue as it was at
+    the last sync of its query.
+    """
+
+    def __init__(
+        self, base_url: str, store: IssueStore, username: Optional[str] = None
+    ):
+        self.base_url = base_url
+        self.store = store
+        self.username = username
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        raise click.ClickException(f'`{name}` is not available offline')
+
+    def get_issue(self, issue_key: str, cache: bool = True) -> Issue:
+        issue = self.store.get_issue(issue_key)
+        if issue is None:
+            raise click.ClickException(f'{issue_key} has not been synced')
+
+        return issue
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        start_at: Optional[int] = None,
+        lazy: bool = False,
+    ) -> SearchResults:
+        issues, total = self.store.search(
+            query, start_at or 0, max_results, current_user=self.username, lazy=lazy
+        )
+
+        return SearchResults(
+            issues=issues,
+            expand=[],
+            start_at=start_at or 0,
+            max_results=len(issues) if max_results is None else max_results,
+            total=total,
+        )
+
+    def search_pages(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        max_results: Optional[int] = None,
+        **kwargs,
+    ) -> Generator[Dict[str, Any], None, None]:
+        issues, total = self.store.search_json(
+            query, max_results=max_results, current_user=self.username
+        )
+
+        yield {
+            'startAt': 0,
+            'maxResults': len(issues),
+            'total': total,
+            'issues': issues,
+        }
+
+    def search_all(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        lazy: bool = False,
+        **kwargs,
+    ) -> Generator[Issue, None, None]:
+        yield from self.search(query, lazy=lazy).issues
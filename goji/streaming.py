@@ -0,0 +1,159 @@
+"""
+Incremental parsing of large JSON responses.
+
+A search page of a thousand issues with their changelogs can be tens of
+megabytes. Rather than holding the entire body along with the decoded tree
+in memory, `StreamingObject` parses the body as it arrives and yields each
+item of an array member, such as the `issues` of a search page, as soon as
+the item is complete. Only the unparsed tail of the body is buffered.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Consumed text is discarded from the buffer once it exceeds this length
+TRIM_SIZE = 1024 * 1024
+
+
+class StreamingObject:
+    """
+    Parses a JSON object from an iterable of byte chunks. Iterating yields
+    the decoded items of the `array` member, every other member is decoded
+    into `members` as it is encountered, and so is only complete once
+    iteration has finished.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], array: str):
+        self.chunks = iter(chunks)
+        self.array = array
+        self.members: Dict[str, Any] = {}
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.position = 0
+        self.exhausted = False
+
+    def fill(self) -> bool:
+        """
+        Appends the next chunk to the buffer, returning False once the
+        chunks are exhausted.
+        """
+
+        if self.exhausted:
+            return False
+
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.exhausted = True
+            self.buffer += self.text_decoder.decode(b'', final=True)
+            return False
+
+        self.buffer += self.text_decoder.decode(chunk)
+        return True
+
+    def trim(self) -> None:
+        if self.position > TRIM_SIZE:
+            self.buffer = self.buffer[self.position :]
+            self.position = 0
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.position)
+
+    def peek(self) -> str:
+        """
+        Skips whitespace, returning the next character or an empty string at
+        the end of the body.
+        """
+
+        while True:
+            match = WHITESPACE.match(self.buffer, self.position)
+            assert match
+            self.position = match.end()
+
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+
+            if not self.fill():
+                return ''
+
+    def expect(self, character: str) -> None:
+        if self.peek() != character:
+            raise self.error(f'Expecting {character!r}')
+
+        self.position += 1
+
+    def value(self) -> Any:
+        """
+        Decodes the value at the current position, reading further chunks
+        until the value is complete.
+        """
+
+        self.peek()
+
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.exhausted:
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the next
+                # chunk, so values are only accepted once followed by more
+                # text
+                if end < len(self.buffer) or self.exhausted:
+                    self.position = end
+                    return value
+
+            # Wait for the unparsed text to double before trying again so
+            # that a large value is not decoded from the start per chunk
+            target = len(self.buffer) + max(len(self.buffer) - self.position, 1)
+            while len(self.buffer) < target and self.fill():
+                pass
+
+    def __iter__(self) -> Iterator[Any]:
+        self.expect('{')
+
+        while True:
+            character = self.peek()
+
+            if character == '}':
+                self.position += 1
+                return
+
+            if character == ',':
+                self.position += 1
+                continue
+
+            if character != '"':
+                raise self.error('Expecting property name enclosed in double quotes')
+
+            key = self.value()
+            self.expect(':')
+
+            if key != self.array or self.peek() != '[':
+                self.members[key] = self.value()
+                continue
+
+            self.position += 1
+
+            while True:
+                character = self.peek()
+
+                if character == ']':
+                    self.position += 1
+                    break
+
+                if character == ',':
+                    self.position += 1
+                    continue
+
+                if character == '':
+                    raise self.error('Unterminated array')
+
+                yield self.value()
+                self.trim()
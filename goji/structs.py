@@ -0,0 +1,269 @@
+"""
+Typed decoding of search results with msgspec.
+
+Search pages are decoded against a schema of the fields goji understands,
+directly into structs rather than into a tree of dictionaries, and the
+structs are then converted into the models. Any field which is not part of
+the schema, such as the avatars of users or fields which were not requested,
+is skipped by the parser. Custom fields are only decoded when they are
+requested by name.
+
+The typed path is only used when msgspec is the selected JSON backend and
+the search requests an explicit list of fields, and the search is not lazy.
+Otherwise search results are decoded via `SearchResults.from_json`, lazy
+searches parse only the fields which are read.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, List, Optional
+
+from goji import decoding
+from goji.models import (
+    InternPool,
+    Issue,
+    IssueLink,
+    IssueLinkType,
+    Resolution,
+    SearchResults,
+    StatusCategory,
+    StatusDetails,
+    UserDetails,
+    create,
+    parse_datetime,
+)
+
+SearchDecoder = Callable[[bytes, Optional[InternPool]], SearchResults]
+
+
+def supports_fields(fields: Optional[List[str]]) -> bool:
+    """
+    Whether the requested fields are known ahead of the response. Wildcards
+    such as `*all` and exclusions such as `-description` are not.
+    """
+
+    if not fields:
+        return False
+
+    return not any(field.startswith(('*', '-')) for field in fields)
+
+
+@lru_cache(maxsize=None)
+def schema() -> Any:
+    import msgspec
+
+    class User(msgspec.Struct):
+        name: Optional[str] = None
+        displayName: str = ''
+        emailAddress: Optional[str] = None
+
+    class Category(msgspec.Struct):
+        id: Any
+        key: str
+        name: str
+
+    class Status(msgspec.Struct):
+        id: Any
+        name: str
+        statusCategory: Category
+        description: Optional[str] = None
+
+    class Resolve(msgspec.Struct):
+        id: Any
+        name: str
+        description: Optional[str] = None
+
+    class LinkedFields(msgspec.Struct):
+        summary: Optional[str] = ''
+        status: Optional[Status] = None
+
+    class LinkedIssue(msgspec.Struct):
+        key: str
+        fields: Optional[LinkedFields] = None
+
+    class LinkType(msgspec.Struct):
+        name: str
+        inward: str
+        outward: str
+
+    class Component(msgspec.Struct):
+        name: str
+
+    class Link(msgspec.Struct):
+        type: LinkType
+        inwardIssue: Optional[LinkedIssue] = None
+        outwardIssue: Optional[LinkedIssue] = None
+
+    fields = [
+        ('summary', Optional[str], ''),
+        ('description', Optional[str], None),
+        ('creator', Optional[User], None),
+        ('created', Optional[str], None),
+        ('resolutiondate', Optional[str], None),
+        ('assignee', Optional[User], None),
+        ('status', Optional[Status], None),
+        ('resolution', Optional[Resolve], None),
+        ('issuelinks', Optional[List[Link]], None),
+        ('labels', Optional[List[str]], None),
+        ('updated', Optional[str], None),
+        ('components', Optional[List[Component]], None),
+    ]
+
+    return msgspec, fields
+
+
+@lru_cache(maxsize=32)
+def search_decoder(customfields: FrozenSet[str]) -> Any:
+    msgspec, fields = schema()
+
+    Fields = msgspec.defstruct(
+        'Fields',
+        fields + [(name, Any, msgspec.UNSET) for name in sorted(customfields)],
+    )
+    IssueStruct = msgspec.defstruct(
+        'Issue', [('key', str), ('fields', Optional[Fields], None)]
+    )
+    Page = msgspec.defstruct(
+        'Page',
+        [
+            ('issues', List[IssueStruct]),
+            ('startAt', int),
+            ('maxResults', int),
+            ('total', int),
+            ('expand', str, ''),
+        ],
+    )
+
+    return msgspec.json.Decoder(Page)
+
+
+def convert_user(user, pool: Optional[InternPool]) -> Optional[UserDetails]:
+    if user is None:
+        return None
+
+    return create(pool)(
+        UserDetails, user.name or '', user.displayName, user.emailAddress
+    )
+
+
+def convert_status(status, pool: Optional[InternPool]) -> Optional[StatusDetails]:
+    if status is None:
+        return None
+
+    category = status.statusCategory
+    return create(pool)(
+        StatusDetails,
+        status.id,
+        status.name,
+        status.description,
+        create(pool)(StatusCategory, category.id, category.key, category.name),
+    )
+
+
+def convert_linked_issue(issue, pool: Optional[InternPool]) -> Optional[Issue]:
+    if issue is None:
+        return None
+
+    if issue.fields is None:
+        return Issue(issue.key)
+
+    return Issue(
+        issue.key,
+        summary=(issue.fields.summary or '').rstrip(),
+        status=convert_status(issue.fields.status, pool),
+    )
+
+
+def convert_link(link, pool: Optional[InternPool]) -> IssueLink:
+    return IssueLink(
+        IssueLinkType(link.type.name, link.type.inward, link.type.outward),
+        inward_issue=convert_linked_issue(link.inwardIssue, pool),
+        outward_issue=convert_linked_issue(link.outwardIssue, pool),
+    )
+
+
+def convert_issue(
+    issue, customfields: List[str], unset: Any, pool: Optional[InternPool]
+) -> Issue:
+    fields = issue.fields
+    if fields is None:
+        return Issue(issue.key)
+
+    resolution = None
+    if fields.resolution:
+        resolution = create(pool)(
+            Resolution,
+            fields.resolution.id,
+            fields.resolution.name,
+            fields.resolution.description,
+        )
+
+    values = {}
+    for name in customfields:
+        value = getattr(fields, name)
+        if value is not unset:
+            values[name] = value
+
+    return Issue(
+        issue.key,
+        summary=(fields.summary or '').rstrip(),
+        description=fields.description,
+        creator=convert_user(fields.creator, pool),
+        created=parse_datetime(fields.created),
+        resolutiondate=parse_datetime(fields.resolutiondate),
+        assignee=convert_user(fields.assignee, pool),
+        status=convert_status(fields.status, pool),
+        resolution=resolution,
+        links=[convert_link(link, pool) for link in fields.issuelinks or []],
+        labels=fields.labels,
+        customfields=values,
+        updated=parse_datetime(fields.updated),
+        components=(
+            [component.name for component in fields.components]
+            if fields.components is not None
+            else None
+        ),
+    )
+
+
+def typed_search_decoder(fields: Optional[List[str]]) -> Optional[SearchDecoder]:
+    """
+    Returns a decoder of search pages for the requested fields, or None when
+    the typed path is not available.
+    """
+
+    if not supports_fields(fields):
+        return None
+
+    if decoding.current_backend() != 'msgspec':
+        return None
+
+    assert fields
+    customfields = sorted(
+        {field for field in fields if field.startswith('customfield_')}
+    )
+    decoder = search_decoder(frozenset(customfields))
+    msgspec = schema()[0]
+    unset = msgspec.UNSET
+
+    def decode(content: bytes, pool: Optional[InternPool] = None) -> SearchResults:
+        if pool is None:
+            pool = InternPool()
+
+        try:
+            page = decoder.decode(content)
+        except msgspec.ValidationError:
+            # The response does not match the schema, such as a field of an
+            # unexpected type, the dictionary path is more lenient
+            return SearchResults.from_json(decoding.decode_json(content), pool)
+
+        return SearchResults(
+            issues=[
+                convert_issue(issue, customfields, unset, pool) for issue in page.issues
+            ],
+            expand=page.expand.split(','),
+            start_at=page.startAt,
+            max_results=page.maxResults,
+            total=page.total,
+        )
+
+    return decode
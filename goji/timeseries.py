@@ -0,0 +1,163 @@
+"""
+Time series of the creation and resolution of issues.
+
+`TimeSeries` collects the creation and resolution times of the issues of a
+search into arrays of timestamps as the issues are fetched. The amount of
+issues created and resolved each week, the rolling throughput and the
+percentiles of lead times are then computed by plain accumulation over the
+arrays, rather than exporting the issues and computing them elsewhere.
+
+Lead time is the time from the creation of an issue until its resolution,
+which includes any time the issue waited before work started. It is not
+cycle time, JIRA does not record when work on an issue started outside of
+the changelog.
+"""
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence
+
+from goji.models import Issue
+
+WEEK = timedelta(weeks=1).total_seconds()
+DAY = timedelta(days=1).total_seconds()
+
+
+def week_start(timestamp: float) -> float:
+    """
+    Returns the start of the week (Monday, UTC) holding the timestamp.
+    """
+
+    date = datetime.fromtimestamp(timestamp, timezone.utc)
+    monday = date.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(
+        days=date.weekday()
+    )
+    return monday.timestamp()
+
+
+def bucket(timestamps: Sequence[float], start: float, count: int) -> array:
+    """
+    Counts the timestamps within each of `count` weeks from `start`.
+    """
+
+    counts = array('l', [0]) * count
+
+    for timestamp in timestamps:
+        counts[int((timestamp - start) // WEEK)] += 1
+
+    return counts
+
+
+def rolling_mean(values: Sequence[float], window: int) -> array:
+    """
+    Returns the mean of each value with the values preceding it within the
+    window. The first values are averaged over the values available.
+    """
+
+    means = array('d')
+    total = 0.0
+
+    for index, value in enumerate(values):
+        total += value
+        if index >= window:
+            total -= values[index - window]
+
+        means.append(total / min(index + 1, window))
+
+    return means
+
+
+def percentiles(
+    values: Sequence[float], percents: Sequence[float]
+) -> List[Optional[float]]:
+    """
+    Returns the given percentiles of the values, interpolating linearly
+    between the closest ranks.
+    """
+
+    ordered = array('d', sorted(values))
+
+    if not ordered:
+        return [None for _ in percents]
+
+    results: List[Optional[float]] = []
+    last = len(ordered) - 1
+
+    for percent in percents:
+        rank = last * percent / 100
+        lower = math.floor(rank)
+        upper = min(lower + 1, last)
+        results.append(
+            ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+        )
+
+    return results
+
+
+@dataclass(slots=True)
+class WeeklyCounts:
+    weeks: List[datetime]
+    created: array
+    resolved: array
+
+
+class TimeSeries:
+    """
+    Collects the creation and resolution timestamps of issues.
+    """
+
+    fields = ['created', 'resolutiondate']
+
+    def __init__(self) -> None:
+        self.created = array('d')
+        self.resolved = array('d')
+        self.lead_times = array('d')
+
+    def add(self, issue: Issue) -> None:
+        created = issue.created.timestamp() if issue.created else None
+
+        if created is not None:
+            self.created.append(created)
+
+        if issue.resolutiondate:
+            resolved = issue.resolutiondate.timestamp()
+            self.resolved.append(resolved)
+
+            if created is not None:
+                self.lead_times.append(resolved - created)
+
+    def weekly(self) -> WeeklyCounts:
+        """
+        Returns the amount of issues created and resolved in each week from
+        the first until the last week with an issue created or resolved.
+        """
+
+        if not self.created and not self.resolved:
+            return WeeklyCounts([], array('l'), array('l'))
+
+        first = week_start(min(self.created + self.resolved))
+        last = week_start(max(self.created + self.resolved))
+        count = round((last - first) / WEEK) + 1
+
+        return WeeklyCounts(
+            [
+                datetime.fromtimestamp(first + index * WEEK, timezone.utc)
+                for index in range(count)
+            ],
+            bucket(self.created, first, count),
+            bucket(self.resolved, first, count),
+        )
+
+    def lead_time_percentiles(
+        self, percents: Sequence[float]
+    ) -> List[Optional[float]]:
+        """
+        Returns the percentiles of the lead times of resolved issues in days.
+        """
+
+        return [
+            None if value is None else value / DAY
+            for value in percentiles(self.lead_times, percents)
+        ]
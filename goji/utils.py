@@ -1,7 +1,13 @@
+import queue
+import threading
+from collections import deque
 from datetime import datetime
+from typing import Any, Deque, Generator, Iterable, Tuple, TypeVar
 
 from click import ParamType
 
+T = TypeVar('T')
+
 
 class Datetime(ParamType):
     name = 'date'
@@ -25,3 +31,96 @@ class Datetime(ParamType):
                 param,
                 ctx,
             )
+
+
+class Producer:
+    """
+    Iterates over an iterable in a background thread, keeping up to `size`
+    items ready in a queue.
+    """
+
+    def __init__(self, iterable: Iterable[Any], size: int = 1):
+        self.items: 'queue.Queue[Tuple[bool, Any]]' = queue.Queue(maxsize=size)
+        self.stopped = threading.Event()
+
+        thread = threading.Thread(target=self.produce, args=(iterable,), daemon=True)
+        thread.start()
+
+    def produce(self, iterable: Iterable[Any]) -> None:
+        try:
+            for item in iterable:
+                self.items.put((True, item))
+
+                if self.stopped.is_set():
+                    return
+        except BaseException as e:
+            if not self.stopped.is_set():
+                self.items.put((False, e))
+        else:
+            self.items.put((False, None))
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        while True:
+            ok, item = self.items.get()
+            if not ok:
+                if item is not None:
+                    raise item
+
+                return
+
+            yield item
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+        # Unblock the producer should it be waiting on a full queue
+        try:
+            self.items.get_nowait()
+        except queue.Empty:
+            pass
+
+
+def prefetch(iterable: Iterable[T], size: int = 1) -> Generator[T, None, None]:
+    """
+    Iterates over the iterable in a background thread, keeping up to `size`
+    items ready so that producing the next item overlaps with consuming the
+    previous one. Exceptions raised by the iterable are re-raised to the
+    consumer.
+    """
+
+    producer = Producer(iterable, size)
+
+    try:
+        yield from producer
+    finally:
+        producer.stop()
+
+
+def prefetch_each(
+    iterables: Iterable[Iterable[T]], concurrency: int, size: int = 1
+) -> Generator[T, None, None]:
+    """
+    Chains the iterables, iterating over up to `concurrency` of them at once
+    in background threads and keeping up to `size` items of each ready.
+    Items are yielded in the order of the iterables.
+    """
+
+    remaining = iter(iterables)
+    producers: Deque[Producer] = deque()
+
+    def start_next() -> None:
+        iterable = next(remaining, None)
+        if iterable is not None:
+            producers.append(Producer(iterable, size))
+
+    try:
+        for _ in range(concurrency):
+            start_next()
+
+        while producers:
+            yield from producers[0]
+            producers.popleft()
+            start_next()
+    finally:
+        for producer in producers:
+            producer.stop()
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from goji.client import JIRAException
+from goji.ratelimit import RetryPolicy, TokenBucket
+from tests.server import OPEN_STATUS, JIRAServer, Response
+
+pytest.importorskip('httpx')
+
+from goji.async_client import AsyncJIRAClient  # noqa: E402
+
+
+def run(server: JIRAServer, method, **kwargs):
+    async def main():
+        async with AsyncJIRAClient(
+            server.url, ('username', 'password'), **kwargs
+        ) as client:
+            return await method(client)
+
+    return asyncio.run(main())
+
+
+def test_get_issue(server: JIRAServer):
+    server.set_issue_response()
+
+    issue = run(server, lambda client: client.get_issue('GOJI-1'))
+
+    assert server.last_request.path == '/rest/api/2/issue/GOJI-1'
+    assert (
+        server.last_request.headers.get('Authorization')
+        == 'Basic dXNlcm5hbWU6cGFzc3dvcmQ='
+    )
+    assert issue.key == 'GOJI-1'
+    assert issue.summary == 'Example Issue'
+    assert issue.status and issue.status.name == 'Open'
+
+
+def test_error(server: JIRAServer):
+    server.set_error_response(404, 'Issue Does Not Exist')
+
+    with pytest.raises(JIRAException) as exc:
+        run(server, lambda client: client.get_issue('GOJI-1'))
+
+    assert exc.value.status_code == 404
+    assert exc.value.error_messages == ['Issue Does Not Exist']
+
+
+def test_search_all(server: JIRAServer):
+    def handler(request):
+        start_at = request.body.get('startAt', 0)
+        return Response(
+            200,
+            {
+                'issues': [
+                    {
+                        'key': f'GOJI-{index}',
+                        'fields': {'summary': 'Hello', 'status': OPEN_STATUS},
+                    }
+                    for index in range(start_at, min(start_at + 2, 5))
+                ],
+                'startAt': start_at,
+                'maxResults': 2,
+                'total': 5,
+            },
+        )
+
+    server.handler = handler
+
+    async def search_all(client):
+        return [
+            issue.key
+            async for issue in client.search_all('PROJECT = GOJI', concurrency=2)
+        ]
+
+    keys = run(server, search_all)
+
+    assert keys == ['GOJI-0', 'GOJI-1', 'GOJI-2', 'GOJI-3', 'GOJI-4']
+    assert len(server.requests) == 3
+
+
+def test_search_retries_rate_limited_request(server: JIRAServer):
+    server.response = None
+    server.responses = [
+        Response(429, {}, headers={'Retry-After': '0'}),
+        Response(
+            200,
+            {
+                'issues': [{'key': 'GOJI-1', 'fields': {}}],
+                'startAt': 0,
+                'maxResults': 50,
+                'total': 1,
+            },
+        ),
+    ]
+
+    results = run(
+        server,
+        lambda client: client.search('PROJECT = GOJI'),
+        retry=RetryPolicy(retries=1, backoff=0),
+    )
+
+    assert [issue.key for issue in results.issues] == ['GOJI-1']
+    assert len(server.requests) == 2
+
+
+def test_does_not_retry_non_idempotent_request(server: JIRAServer):
+    server.response = Response(429, {}, headers={'Retry-After': '0'})
+
+    with pytest.raises(JIRAException):
+        run(
+            server,
+            lambda client: client.create_sprint(5, 'Sprint #1'),
+            retry=RetryPolicy(retries=1, backoff=0),
+        )
+
+    assert len(server.requests) == 1
+
+
+def test_requests_take_from_rate_limiter(server: JIRAServer):
+    server.set_issue_response()
+    bucket = TokenBucket(rate=1000, capacity=10, clock=lambda: 0)
+
+    run(server, lambda client: client.get_issue('GOJI-1'), rate_limiter=bucket)
+
+    assert bucket.tokens == 9
+
+
+def test_create_sprint(server: JIRAServer):
+    server.set_create_sprint_response()
+
+    sprint = run(server, lambda client: client.create_sprint(5, 'Sprint #1'))
+
+    assert server.last_request.body == {'name': 'Sprint #1', 'originBoardId': 5}
+    assert sprint.name == 'Sprint #1'
@@ -1,3 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from goji.client import JIRAClient
 from tests.server import OPEN_STATUS, JIRAServer, Response
 
@@ -32,6 +36,17 @@ def test_search(client: JIRAClient, server: JIRAServer):
     assert results.start_at == 0
 
 
+def test_search_projects_fields(client: JIRAClient, server: JIRAServer):
+    server.set_search_response()
+
+    client.search('PROJECT = GOJI', fields=['key', 'links', 'customfield_10000'])
+
+    assert server.last_request.body == {
+        'jql': 'PROJECT = GOJI',
+        'fields': ['key', 'issuelinks', 'customfield_10000'],
+    }
+
+
 def test_search_max_results(client: JIRAClient, server: JIRAServer):
     server.response.body = {
         'issues': [
@@ -150,3 +165,182 @@ def test_search_all_empty_page(client: JIRAClient, server: JIRAServer):
     assert server.last_request.method == 'POST'
     assert server.last_request.path == '/rest/api/2/search'
     assert server.last_request.body == {'jql': 'PROJECT = GOJI'}
+
+
+def test_search_all_concurrently(client: JIRAClient, server: JIRAServer):
+    def handler(request):
+        start_at = request.body.get('startAt', 0)
+        return Response(
+            200,
+            {
+                'issues': [
+                    {'key': f'GOJI-{index}', 'fields': {'summary': 'Hello World'}}
+                    for index in range(start_at, min(start_at + 2, 7))
+                ],
+                'startAt': start_at,
+                'maxResults': 2,
+                'total': 7,
+            },
+        )
+
+    server.handler = handler
+
+    issues = list(client.search_all('PROJECT = GOJI', concurrency=3))
+
+    assert [issue.key for issue in issues] == [f'GOJI-{i}' for i in range(7)]
+    assert len(server.requests) == 4
+    assert server.requests[0].body == {'jql': 'PROJECT = GOJI'}
+    assert sorted(request.body.get('startAt', 0) for request in server.requests) == [
+        0,
+        2,
+        4,
+        6,
+    ]
+    assert all(request.body.get('maxResults', 2) == 2 for request in server.requests)
+
+
+def test_search_all_concurrently_single_page(client: JIRAClient, server: JIRAServer):
+    server.response.body = {
+        'issues': [{'key': 'GOJI-1', 'fields': {'summary': 'Hello World'}}],
+        'startAt': 0,
+        'maxResults': 50,
+        'total': 1,
+    }
+
+    issues = list(client.search_all('PROJECT = GOJI', concurrency=4))
+
+    assert [issue.key for issue in issues] == ['GOJI-1']
+    assert len(server.requests) == 1
+
+
+def test_search_all_stream(client: JIRAClient, server: JIRAServer):
+    def handler(request):
+        start_at = request.body.get('startAt', 0)
+        return Response(
+            200,
+            {
+                'issues': [
+                    {'key': f'GOJI-{index}', 'fields': {'summary': 'Hello World'}}
+                    for index in range(start_at, min(start_at + 2, 5))
+                ],
+                'startAt': start_at,
+                'maxResults': 2,
+                'total': 5,
+            },
+        )
+
+    server.handler = handler
+
+    issues = list(client.search_all('PROJECT = GOJI', stream=True))
+
+    assert [issue.key for issue in issues] == [f'GOJI-{i}' for i in range(5)]
+    assert issues[0].summary == 'Hello World'
+    assert [request.body.get('startAt', 0) for request in server.requests] == [
+        0,
+        2,
+        4,
+    ]
+
+
+def test_search_all_adaptive(client: JIRAClient, server: JIRAServer):
+    def handler(request):
+        start_at = request.body.get('startAt', 0)
+        return Response(
+            200,
+            {
+                'issues': [
+                    {'key': f'GOJI-{index}', 'fields': {'summary': 'Hello World'}}
+                    for index in range(start_at, min(start_at + 2, 5))
+                ],
+                'startAt': start_at,
+                'maxResults': 2,
+                'total': 5,
+            },
+        )
+
+    server.handler = handler
+
+    issues = list(client.search_all('PROJECT = GOJI', adaptive=True))
+
+    assert [issue.key for issue in issues] == [f'GOJI-{i}' for i in range(5)]
+    assert [request.body['maxResults'] for request in server.requests] == [
+        1000,
+        2,
+        2,
+    ]
+    assert client.page_sizer(None).maximum == 2
+
+
+def test_search_all_keyset(client: JIRAClient, server: JIRAServer):
+    def page(keys, total):
+        return Response(
+            200,
+            {
+                'issues': [{'key': key, 'fields': {'summary': key}} for key in keys],
+                'startAt': 0,
+                'maxResults': 2,
+                'total': total,
+            },
+        )
+
+    server.response = None
+    server.responses = [
+        page(['ABC-1', 'ABC-2'], 5),
+        page(['GOJI-1', 'GOJI-2'], 3),
+        page(['GOJI-3'], 1),
+    ]
+
+    issues = list(client.search_all('assignee = kyle', keyset=True))
+
+    assert [issue.key for issue in issues] == [
+        'ABC-1',
+        'ABC-2',
+        'GOJI-1',
+        'GOJI-2',
+        'GOJI-3',
+    ]
+    assert [request.body['jql'] for request in server.requests] == [
+        '(assignee = kyle) ORDER BY key ASC',
+        '(assignee = kyle) AND ((project = "ABC" AND key > "ABC-2") '
+        'OR project NOT IN ("ABC")) ORDER BY key ASC',
+        '(assignee = kyle) AND ((project = "GOJI" AND key > "GOJI-2") '
+        'OR project NOT IN ("ABC", "GOJI")) ORDER BY key ASC',
+    ]
+    assert all('startAt' not in request.body for request in server.requests)
+
+
+def test_page_sizer_is_shared_between_threads(client: JIRAClient):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sizers = list(executor.map(lambda _: client.page_sizer(['key']), range(100)))
+
+    assert all(sizer is sizers[0] for sizer in sizers)
+    assert client.page_sizers == {('key',): sizers[0]}
+
+
+@pytest.mark.parametrize(
+    'options',
+    [
+        {'stream': True, 'keyset': True},
+        {'stream': True, 'shard_size': 100},
+        {'stream': True, 'concurrency': 2},
+        {'keyset': True, 'concurrency': 2},
+    ],
+)
+def test_search_all_rejects_incompatible_options(client: JIRAClient, options):
+    with pytest.raises(ValueError):
+        list(client.search_all('PROJECT = GOJI', **options))
+
+
+def test_search_all_keyset_shards_concurrently(client: JIRAClient, server: JIRAServer):
+    server.set_search_response()
+
+    issues = client.search_all(
+        'PROJECT = GOJI', shard_size=100, keyset=True, concurrency=2
+    )
+
+    assert [issue.key for issue in issues] == ['GOJI-7']
+
+
+def test_search_pages_concurrency_requires_shards(client: JIRAClient):
+    with pytest.raises(ValueError):
+        list(client.search_pages('PROJECT = GOJI', concurrency=2))
@@ -1,5 +1,7 @@
 import os
 
+from goji.cache import CacheEntry, ResponseCache
+
 from tests.server import JIRAServer
 
 
@@ -26,3 +28,15 @@ def test_login_with_incorret_credentials(tmp_path, invoke, server: JIRAServer) -
 
     assert 'Error: Incorrect credentials. Try `goji login`.' in result.output
     assert result.exit_code == 1
+
+
+def test_login_clears_cache(tmp_path, invoke, server: JIRAServer) -> None:
+    server.set_user_response()
+    cache = ResponseCache('default')
+    cache.set('key', CacheEntry('url', 200, {}, '{}', 0))
+
+    os.environ['HOME'] = str(tmp_path)
+    result = invoke('login', client=None, input='email\npassword\n')
+
+    assert result.exit_code == 0
+    assert cache.get('key') is None
@@ -1,4 +1,6 @@
-from tests.server import JIRAServer
+import json
+
+from tests.server import OPEN_STATUS, JIRAServer
 
 
 def test_search(invoke, server: JIRAServer) -> None:
@@ -59,3 +61,138 @@ def test_search_format_assignee(invoke, server: JIRAServer) -> None:
     assert result.exception is None
     assert result.output == 'Delisa (delisa)\n'
     assert result.exit_code == 0
+
+
+def test_search_all_concurrency(invoke, server: JIRAServer) -> None:
+    server.set_search_response()
+
+    result = invoke('search', '--all', '--concurrency', '4', 'PROJECT=GOJI')
+
+    assert result.exception is None
+    assert result.output == 'GOJI-7 My First Issue\n'
+    assert result.exit_code == 0
+
+
+def test_search_format_attribute(invoke, server: JIRAServer) -> None:
+    server.set_search_response()
+
+    result = invoke('search', '--format', '{assignee.name} {key}', 'PROJECT=GOJI')
+
+    assert result.exception is None
+    assert result.output == 'Delisa GOJI-7\n'
+    assert result.exit_code == 0
+    assert server.last_request.body['fields'] == ['assignee', 'key']
+
+
+def test_search_output_ndjson(invoke, server: JIRAServer) -> None:
+    server.set_search_response()
+
+    result = invoke(
+        'search',
+        '--output',
+        'ndjson',
+        '--field',
+        'status',
+        '--field',
+        'assignee',
+        'GOJI',
+    )
+
+    assert result.exception is None
+    assert json.loads(result.output) == {
+        'key': 'GOJI-7',
+        'status': OPEN_STATUS,
+        'assignee': {'displayName': 'Delisa', 'name': 'delisa'},
+    }
+    assert result.exit_code == 0
+
+
+def test_search_output_ndjson_links(invoke, server: JIRAServer) -> None:
+    server.set_search_response()
+    server.response.body['issues'][0]['fields']['issuelinks'] = []
+
+    result = invoke('search', '--output', 'ndjson', '--field', 'links', 'GOJI')
+
+    assert result.exception is None
+    assert json.loads(result.output) == {'key': 'GOJI-7', 'links': []}
+    assert server.last_request.body['fields'] == ['issuelinks']
+
+
+def test_search_output_csv(invoke, server: JIRAServer) -> None:
+    server.set_search_response()
+
+    result = invoke(
+        'search',
+        '--output',
+        'csv',
+        '--field',
+        'description',
+        '--field',
+        'status',
+        '--field',
+        'assignee',
+        'GOJI',
+    )
+
+    assert result.exception is None
+    assert result.output == (
+        'key,description,status,assignee\n' 'GOJI-7,"One\nTwo\nThree\n",Open,Delisa\n'
+    )
+    assert result.exit_code == 0
+
+
+def test_search_output_tsv_all(invoke, server: JIRAServer) -> None:
+    server.set_search_response()
+
+    result = invoke(
+        'search', '--all', '--output', 'tsv', '--field', 'summary', 'PROJECT=GOJI'
+    )
+
+    assert result.exception is None
+    assert result.output == 'key\tsummary\nGOJI-7\tMy First Issue\n'
+    assert result.exit_code == 0
+
+
+def test_search_output_every_field(invoke, server: JIRAServer) -> None:
+    server.set_search_response()
+    fields = server.response.body['issues'][0]['fields']
+    fields['customfield_10000'] = {'value': 'Red'}
+
+    result = invoke('search', '--output', 'csv', 'GOJI')
+
+    assert result.exception is None
+    assert result.output == (
+        'key,assignee,creator,customfield_10000,description,status,summary\n'
+        'GOJI-7,Delisa,Kyle Fuller,Red,"One\nTwo\nThree\n",Open,My First Issue\n'
+    )
+    assert server.last_request.body['fields'] == ['*all']
+    assert result.exit_code == 0
+
+
+def test_search_output_ndjson_every_field(invoke, server: JIRAServer) -> None:
+    server.set_search_response()
+
+    result = invoke('search', '--output', 'ndjson', 'GOJI')
+
+    assert result.exception is None
+    assert json.loads(result.output) == {
+        'key': 'GOJI-7',
+        **server.response.body['issues'][0]['fields'],
+    }
+    assert result.exit_code == 0
+
+
+def test_search_output_concurrency_requires_shards(invoke) -> None:
+    result = invoke(
+        'search', '--all', '--concurrency', '4', '--output', 'csv', 'PROJECT=GOJI'
+    )
+
+    assert '--concurrency with --output requires --shard-size' in result.output
+    assert result.exit_code == 2
+
+
+def test_search_keyset_concurrency_requires_shards(invoke) -> None:
+    result = invoke('search', '--all', '--keyset', '--concurrency', '4', 'PROJECT=GOJI')
+
+    assert '--concurrency with --keyset requires --shard-size' in result.output
+    assert result.exit_code == 2
@@ -8,6 +8,12 @@ from goji.commands import cli
 from tests.server import JIRAServer
 
 
+@pytest.fixture(autouse=True)
+def xdg_home(tmp_path, monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setenv('XDG_DATA_HOME', str(tmp_path / 'data'))
+
+
 @pytest.fixture(scope='session')
 def global_server() -> Iterator[JIRAServer]:
     server = JIRAServer()
@@ -1,6 +1,18 @@
 import unittest
+from dataclasses import FrozenInstanceError, replace
+from datetime import datetime, timezone
 
-from goji.models import Issue, IssueLink, IssueLinkType, StatusCategory, StatusDetails
+from goji.models import (
+    InternPool,
+    Issue,
+    IssueLink,
+    IssueLinkType,
+    LazyIssue,
+    SearchResults,
+    StatusCategory,
+    StatusDetails,
+    server_fields,
+)
 from tests.server import OPEN_STATUS
 
 
@@ -69,10 +81,84 @@ class IssueTests(unittest.TestCase):
         assert issue.links[0].link_type.inward == 'related to'
         assert issue.links[0].link_type.outward == 'relates to'
 
+    def test_issue_components_from_json(self) -> None:
+        issue = Issue.from_json(
+            {
+                'key': 'GOJI-1',
+                'fields': {'components': [{'id': '1', 'name': 'API'}]},
+            }
+        )
+
+        assert issue.components == ['API']
+
     def test_string_conversion(self) -> None:
         issue = Issue(key='GOJI-1')
         assert str(issue) == 'GOJI-1'
 
+    def test_issue_from_json_interns_shared_objects(self) -> None:
+        pool = InternPool()
+        user = {'name': 'kyle', 'displayName': 'Kyle Fuller'}
+        fields = {
+            'creator': user,
+            'assignee': dict(user),
+            'status': OPEN_STATUS,
+            'resolution': {'id': '1', 'name': 'Done'},
+        }
+
+        first = Issue.from_json({'key': 'GOJI-1', 'fields': fields}, pool)
+        second = Issue.from_json({'key': 'GOJI-2', 'fields': dict(fields)}, pool)
+
+        assert first.creator is first.assignee
+        assert first.assignee is second.assignee
+        assert first.status is second.status
+        assert first.resolution is second.resolution
+        assert len(pool) == 4
+
+    def test_interned_objects_are_copied_on_write(self) -> None:
+        pool = InternPool()
+        json = {'key': 'GOJI-1', 'fields': {'status': OPEN_STATUS}}
+        issue = Issue.from_json(json, pool)
+
+        assert issue.status
+        with self.assertRaises(FrozenInstanceError):
+            issue.status.name = 'Closed'  # type: ignore[misc]
+
+        issue.status = replace(issue.status, name='Closed')
+
+        assert str(issue.status) == 'Closed'
+        assert str(Issue.from_json(json, pool).status) == 'Open'
+
+    def test_issue_from_json_without_pool(self) -> None:
+        json = {'key': 'GOJI-1', 'fields': {'status': OPEN_STATUS}}
+
+        assert Issue.from_json(json).status is not Issue.from_json(json).status
+
+    def test_search_results_interns_issues(self) -> None:
+        issue = {'key': 'GOJI-1', 'fields': {'status': OPEN_STATUS}}
+        results = SearchResults.from_json(
+            {'startAt': 0, 'maxResults': 2, 'total': 2, 'issues': [issue, issue]}
+        )
+
+        assert results.issues[0].status is results.issues[1].status
+
+    def test_slots(self) -> None:
+        with self.assertRaises(AttributeError):
+            Issue(key='GOJI-1').unknown = True  # type: ignore
+
+    def test_server_fields(self) -> None:
+        assert server_fields(['key', 'links', 'status', 'customfield_10000']) == [
+            'key',
+            'issuelinks',
+            'status',
+            'customfield_10000',
+        ]
+
+    def test_server_fields_removes_duplicates(self) -> None:
+        assert server_fields(['links', 'issuelinks', 'status', 'status']) == [
+            'issuelinks',
+            'status',
+        ]
+
 
 class IssueLinkTests(unittest.TestCase):
     def test_outward_issue_link_creation_from_json(self) -> None:
@@ -144,3 +230,65 @@ class IssueLinkTests(unittest.TestCase):
         )
 
         assert str(link) == 'Related to: GOJI-15 (Open)'
+
+
+class LazyIssueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.json = {
+            'key': 'GOJI-1',
+            'fields': {
+                'summary': 'Issue Summary ',
+                'created': '2025-04-10T10:00:00.000+0000',
+                'status': OPEN_STATUS,
+                'customfield_10000': 5,
+            },
+        }
+
+    def test_decodes_fields_on_access(self) -> None:
+        issue = LazyIssue.from_json(self.json)
+
+        assert issue.key == 'GOJI-1'
+        assert issue.summary == 'Issue Summary'
+        assert issue.created == datetime(2025, 4, 10, 10, tzinfo=timezone.utc)
+        assert issue.status
+        assert issue.status.name == 'Open'
+        assert issue.customfields == {'customfield_10000': 5}
+        assert issue.links == []
+        assert issue.description is None
+
+    def test_memoises_fields(self) -> None:
+        issue = LazyIssue.from_json(self.json, InternPool())
+
+        status = issue.status
+        self.json['fields']['status'] = None
+
+        assert issue.status is status
+
+    def test_only_decodes_accessed_fields(self) -> None:
+        self.json['fields']['created'] = 'invalid'
+        issue = LazyIssue.from_json(self.json)
+
+        assert issue.summary == 'Issue Summary'
+
+        with self.assertRaises(ValueError):
+            issue.created
+
+    def test_set_field(self) -> None:
+        issue = LazyIssue.from_json(self.json)
+        issue.summary = 'Updated'
+
+        assert issue.summary == 'Updated'
+
+    def test_without_fields(self) -> None:
+        issue = LazyIssue.from_json({'key': 'GOJI-1'})
+
+        assert issue == Issue('GOJI-1')
+
+    def test_search_results(self) -> None:
+        results = SearchResults.from_json(
+            {'startAt': 0, 'maxResults': 1, 'total': 1, 'issues': [self.json]},
+            lazy=True,
+        )
+
+        assert isinstance(results.issues[0], LazyIssue)
+        assert results.issues[0].summary == 'Issue Summary'
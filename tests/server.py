@@ -1,7 +1,7 @@
 import json
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from threading import Thread
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 OPEN_STATUS = {
     'id': 1,
@@ -23,9 +23,10 @@ class Request(object):
 
 
 class Response(object):
-    def __init__(self, status_code: int, body):
+    def __init__(self, status_code: int, body, headers=None):
         self.status_code = status_code
         self.headers = {'Content-Type': 'application/json'}
+        self.headers.update(headers or {})
         self.body = body
 
 
@@ -65,15 +66,23 @@ class JIRAServer(object):
                 request = Request(method, self.path, self.headers, body)
                 server.requests.append(request)
 
-                response = server.response
+                if server.handler:
+                    response = server.handler(request)
+                else:
+                    response = server.response
+
                 if response is None:
                     response = server.responses.pop(0)
 
-                body = json.dumps(response.body)
+                if response.status_code == 304:
+                    body = ''
+                else:
+                    body = json.dumps(response.body)
 
                 self.send_response(response.status_code)
                 self.send_header('Content-Length', str(len(body)))
-                self.send_header('Content-Type', response.headers['Content-Type'])
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
                 self.end_headers()
                 self.wfile.write(body.encode('utf-8'))
 
@@ -107,6 +116,7 @@ class JIRAServer(object):
         self.requests: List[Request] = []
         self.response: Optional[Response] = Response(200, None)
         self.responses: Optional[List[Response]] = None
+        self.handler: Optional[Callable[[Request], Response]] = None
         self.require_method: Optional[str] = None
         self.require_path: Optional[str] = None
         self.got_request = lambda: None
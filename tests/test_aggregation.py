@@ -0,0 +1,98 @@
+from goji.aggregation import Aggregation, aggregate, group_values
+from goji.models import Issue, UserDetails
+
+DELISA = UserDetails('delisa', 'Delisa', None)
+
+
+def issue(key: str, **kwargs) -> Issue:
+    return Issue(key, **kwargs)
+
+
+def counts(aggregation: Aggregation):
+    return {key: group.count for key, group in aggregation.groups.items()}
+
+
+def test_group_values():
+    assert group_values('assignee', DELISA) == ['Delisa']
+    assert group_values('assignee', None) == ['Unassigned']
+    assert group_values('labels', None) == []
+    assert group_values('labels', ['a', 'b']) == ['a', 'b']
+    assert group_values('customfield_10000', {'value': 'Red'}) == ['Red']
+    assert group_values('customfield_10000', None) == ['None']
+
+
+def test_aggregation_groups_by_several_fields():
+    aggregation = Aggregation(['assignee', 'labels'])
+
+    aggregate(
+        [
+            issue('GOJI-1', assignee=DELISA, labels=['api', 'ui']),
+            issue('GOJI-2', assignee=None, labels=['api']),
+            issue('GOJI-3', assignee=DELISA, labels=['api']),
+            issue('GOJI-4', assignee=DELISA, labels=[]),
+        ],
+        [aggregation],
+    )
+
+    assert counts(aggregation) == {
+        ('Delisa', 'api'): 2,
+        ('Delisa', 'ui'): 1,
+        ('Unassigned', 'api'): 1,
+    }
+    assert aggregation.total == 4
+
+
+def test_aggregation_measures():
+    aggregation = Aggregation(['components'], ['customfield_10002'])
+
+    aggregate(
+        [
+            issue('GOJI-1', components=['API'], customfields={'customfield_10002': 3}),
+            issue('GOJI-2', components=['API'], customfields={'customfield_10002': 2}),
+            issue('GOJI-3', components=['API'], customfields={}),
+            issue('GOJI-4', components=['UI'], customfields={'customfield_10002': 'x'}),
+        ],
+        [aggregation],
+    )
+
+    api = aggregation.groups[('API',)]
+    assert api.count == 3
+    assert api.measures[0].total == 5
+    assert api.measures[0].average == 2.5
+
+    ui = aggregation.groups[('UI',)]
+    assert ui.measures[0].total == 0
+    assert ui.measures[0].average is None
+
+
+def test_aggregate_feeds_every_aggregation_in_one_pass():
+    consumed = []
+
+    def issues():
+        for key in ('GOJI-1', 'GOJI-2'):
+            consumed.append(key)
+            yield issue(key, assignee=DELISA, labels=['api'])
+
+    by_assignee = Aggregation(['assignee'])
+    by_label = Aggregation(['labels'])
+
+    aggregate(issues(), [by_assignee, by_label])
+
+    assert consumed == ['GOJI-1', 'GOJI-2']
+    assert counts(by_assignee) == {('Delisa',): 2}
+    assert counts(by_label) == {('api',): 2}
+
+
+def test_aggregation_most_common():
+    aggregation = Aggregation(['labels'])
+    aggregation.add(issue('GOJI-1', labels=['a', 'b']))
+    aggregation.add(issue('GOJI-2', labels=['b', 'c']))
+
+    assert [key for key, _ in aggregation.most_common()] == [('b',), ('a',), ('c',)]
+    assert [key for key, _ in aggregation.most_common(2)] == [('b',), ('a',)]
+
+
+def test_aggregation_fields():
+    aggregation = Aggregation(['status', 'assignee'], ['customfield_10002'])
+
+    assert aggregation.fields == ['status', 'assignee', 'customfield_10002']
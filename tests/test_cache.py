@@ -0,0 +1,164 @@
+import os
+
+import pytest
+
+from goji.cache import CacheEntry, ResponseCache
+from goji.client import JIRAClient
+from tests.server import JIRAServer, Response
+
+USER = {
+    'name': 'kyle',
+    'displayName': 'Kyle Fuller',
+    'emailAddress': 'kyle@example.com',
+}
+
+
+@pytest.fixture()
+def cache(tmp_path) -> ResponseCache:
+    return ResponseCache('default', ttl=60, directory=tmp_path)
+
+
+@pytest.fixture()
+def cached_client(server: JIRAServer, cache: ResponseCache) -> JIRAClient:
+    return JIRAClient(server.url, ('username', 'password'), cache=cache)
+
+
+def test_fresh_response_is_served_from_cache(
+    cached_client: JIRAClient, server: JIRAServer
+):
+    server.response.body = USER
+
+    assert cached_client.get_user() == cached_client.get_user()
+    assert len(server.requests) == 1
+
+
+def test_search_is_cached_by_body(cached_client: JIRAClient, server: JIRAServer):
+    server.set_search_response()
+
+    cached_client.search('PROJECT = GOJI')
+    cached_client.search('PROJECT = GOJI')
+    results = cached_client.search('PROJECT = ABC')
+
+    assert len(server.requests) == 2
+    assert results.issues[0].key == 'GOJI-7'
+
+
+def test_expired_response_is_revalidated(
+    cached_client: JIRAClient, cache: ResponseCache, server: JIRAServer
+):
+    cache.ttl = 0
+    server.response = None
+    server.responses = [
+        Response(200, USER, headers={'ETag': '"v1"'}),
+        Response(304, None),
+    ]
+
+    cached_client.get_user()
+    user = cached_client.get_user()
+
+    assert user and user.name == 'Kyle Fuller'
+    assert len(server.requests) == 2
+    assert server.requests[1].headers['If-None-Match'] == '"v1"'
+
+
+def test_write_invalidates_issue_and_searches(
+    cached_client: JIRAClient, server: JIRAServer
+):
+    server.response.body = USER
+    cached_client.get_user()
+    server.set_issue_response('GOJI-1')
+    cached_client.get_issue('GOJI-1')
+    server.set_issue_response('GOJI-2')
+    cached_client.get_issue('GOJI-2')
+    server.set_search_response()
+    cached_client.search('PROJECT = GOJI')
+    server.set_assign_response('GOJI-1')
+
+    cached_client.assign('GOJI-1', 'kyle')
+    requests = len(server.requests)
+
+    server.response.body = USER
+    cached_client.get_user()
+    server.set_issue_response('GOJI-2')
+    cached_client.get_issue('GOJI-2')
+    assert len(server.requests) == requests
+
+    server.set_issue_response('GOJI-1')
+    cached_client.get_issue('GOJI-1')
+    server.set_search_response()
+    cached_client.search('PROJECT = GOJI')
+    assert len(server.requests) == requests + 2
+
+
+def test_other_write_clears_cache(cached_client: JIRAClient, server: JIRAServer):
+    server.response.body = USER
+    cached_client.get_user()
+
+    cached_client.link_issue('GOJI-1', 'GOJI-2', 'Blocks')
+    cached_client.get_user()
+
+    assert len(server.requests) == 3
+
+
+def test_get_issue_bypassing_cache(cached_client: JIRAClient, server: JIRAServer):
+    server.set_issue_response()
+
+    cached_client.get_issue('GOJI-1')
+    cached_client.get_issue('GOJI-1', cache=False)
+
+    assert len(server.requests) == 2
+
+
+def test_least_recently_used_entries_are_evicted(cache: ResponseCache):
+    def store(index: int) -> str:
+        key = cache.key('GET', f'url/{index}')
+        cache.set(key, CacheEntry('url', 200, {}, 'x' * 100, 0))
+        os.utime(cache.path(key), (index, index))
+        return key
+
+    keys = [store(index) for index in range(3)]
+    # Room for three and a half entries, a fourth entry evicts one entry
+    cache.max_size = int(cache.path(keys[0]).stat().st_size * 3.5)
+
+    cache.get(keys[0])
+    keys.append(store(3))
+
+    assert cache.get(keys[0])
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2])
+    assert cache.get(keys[3])
+
+
+def test_entries_are_keyed_by_user(server: JIRAServer, cache: ResponseCache):
+    server.response.body = USER
+
+    JIRAClient(server.url, ('kyle', 'password'), cache=cache).get_user()
+    JIRAClient(server.url, ('delisa', 'password'), cache=cache).get_user()
+
+    assert len(server.requests) == 2
+
+
+def test_eviction_keeps_written_entry(cache: ResponseCache):
+    cache.max_size = 150
+    cache.set('first', CacheEntry('url', 200, {}, 'x' * 50, 0))
+    cache.set('second', CacheEntry('url', 200, {}, 'x' * 50, 0))
+
+    assert cache.get('first') is None
+    assert cache.get('second')
+    assert cache.size == cache.path('second').stat().st_size
+
+
+def test_entry_larger_than_cache_is_not_stored(cache: ResponseCache):
+    cache.max_size = 10
+    cache.set('key', CacheEntry('url', 200, {}, 'x' * 50, 0))
+
+    assert cache.get('key') is None
+
+
+def test_search_all_pages_are_not_cached(cached_client: JIRAClient, server: JIRAServer):
+    server.set_search_response()
+
+    list(cached_client.search_all('PROJECT = GOJI'))
+    list(cached_client.search_all('PROJECT = GOJI'))
+
+    assert len(server.requests) == 2
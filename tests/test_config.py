@@ -0,0 +1,58 @@
+import os
+
+import click
+import pytest
+
+from goji.config import Configuration
+
+
+@pytest.fixture()
+def config_path(tmp_path):
+    path = tmp_path / 'config.toml'
+    path.write_text('[profile.default]\nurl = "https://goji.atlassian.net"\n')
+    return path
+
+
+def test_fromfile(config_path):
+    config = Configuration.fromfile(config_path)
+
+    assert config.profiles['default'].url == 'https://goji.atlassian.net'
+    assert config.profiles['default'].email is None
+
+
+def test_fromfile_invalid(tmp_path):
+    path = tmp_path / 'config.toml'
+    path.write_text('[profile.default]\nemail = "kyle@example.com"\n')
+
+    with pytest.raises(click.ClickException) as exc:
+        Configuration.fromfile(path)
+
+    assert "'url' is a required property" in exc.value.message
+
+
+def test_fromfile_uses_cached_validation(config_path, monkeypatch):
+    Configuration.fromfile(config_path)
+
+    def parse(path):
+        pytest.fail('configuration was parsed again')
+
+    monkeypatch.setattr(Configuration, 'parse', parse)
+    config = Configuration.fromfile(config_path)
+
+    assert config.profiles['default'].url == 'https://goji.atlassian.net'
+
+
+def test_fromfile_revalidates_modified_file(config_path):
+    Configuration.fromfile(config_path)
+
+    config_path.write_text(
+        '[profile.default]\nurl = "https://example.atlassian.net"\n'
+        'email = "kyle@example.com"\n'
+    )
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    config = Configuration.fromfile(config_path)
+
+    assert config.profiles['default'].url == 'https://example.atlassian.net'
+    assert config.profiles['default'].email == 'kyle@example.com'
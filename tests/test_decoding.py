@@ -0,0 +1,83 @@
+import pytest
+
+from goji import decoding
+
+PAGE = b'{"total": 1, "issues": [{"key": "GOJI-1", "fields": {"summary": "\\u00e9"}}]}'
+
+
+@pytest.fixture(autouse=True)
+def reset_backend(monkeypatch) -> None:
+    monkeypatch.setattr(decoding, 'backend', None)
+    monkeypatch.setattr(decoding, 'loads', None)
+    monkeypatch.delenv('GOJI_JSON_BACKEND', raising=False)
+
+
+@pytest.mark.parametrize('backend', ['json', 'orjson', 'msgspec'])
+def test_decode_json(backend: str) -> None:
+    if backend != 'json':
+        pytest.importorskip(backend)
+
+    assert decoding.load_backend(backend) == backend
+    assert decoding.decode_json(PAGE) == {
+        'total': 1,
+        'issues': [{'key': 'GOJI-1', 'fields': {'summary': 'é'}}],
+    }
+
+
+def test_backend_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv('GOJI_JSON_BACKEND', 'json')
+
+    assert decoding.decode_json(b'[1]') == [1]
+    assert decoding.backend == 'json'
+
+
+def test_backend_fallback(monkeypatch) -> None:
+    def unavailable():
+        raise ImportError()
+
+    monkeypatch.setitem(decoding.BACKENDS, 'orjson', unavailable)
+    monkeypatch.setitem(decoding.BACKENDS, 'msgspec', unavailable)
+
+    assert decoding.load_backend() == 'json'
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        decoding.load_backend('yaml')
+
+
+def test_unknown_backend_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv('GOJI_JSON_BACKEND', 'yaml')
+
+    with pytest.raises(ValueError) as exc:
+        decoding.decode_json(b'[1]')
+
+    assert str(exc.value) == (
+        'Invalid GOJI_JSON_BACKEND. Unknown JSON backend yaml, '
+        'expected one of msgspec, orjson, json'
+    )
+
+
+def test_unavailable_backend_from_environment(monkeypatch) -> None:
+    def unavailable():
+        raise ImportError()
+
+    monkeypatch.setitem(decoding.BACKENDS, 'orjson', unavailable)
+    monkeypatch.setenv('GOJI_JSON_BACKEND', 'orjson')
+
+    with pytest.raises(ValueError) as exc:
+        decoding.decode_json(b'[1]')
+
+    assert str(exc.value) == (
+        'GOJI_JSON_BACKEND is orjson which is not installed, '
+        'install goji with the orjson extra'
+    )
+
+
+def test_invalid_backend_is_usage_error(monkeypatch, invoke) -> None:
+    monkeypatch.setenv('GOJI_JSON_BACKEND', 'yaml')
+
+    result = invoke('show', 'GOJI-1')
+
+    assert 'Invalid GOJI_JSON_BACKEND. Unknown JSON backend yaml' in result.output
+    assert result.exit_code == 2
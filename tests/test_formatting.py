@@ -0,0 +1,70 @@
+from goji.formatting import Exporter, IssueTemplate, echo_lines, flatten
+from goji.models import Issue
+
+
+def make_issue() -> Issue:
+    return Issue('GOJI-1', summary='Example', customfields={'customfield_10000': 5})
+
+
+def test_template_fields() -> None:
+    template = IssueTemplate('{key} {key} {summary!r} {customfield_10000:>3}')
+
+    assert template.fields == ['key', 'summary', 'customfield_10000']
+    assert template.render(make_issue()) == "GOJI-1 GOJI-1 'Example'   5"
+
+
+def test_template_newlines() -> None:
+    template = IssueTemplate('{key}\\n{summary}')
+
+    assert template.render(make_issue()) == 'GOJI-1\nExample'
+
+
+def test_template_hyperlink() -> None:
+    template = IssueTemplate('{key}', link_base_url='https://example.com/jira/')
+
+    assert template.render(make_issue()) == (
+        '\033]8;;https://example.com/jira/browse/GOJI-1\aGOJI-1\033]8;;\a'
+    )
+
+
+def test_echo_lines_chunks(capsys) -> None:
+    echo_lines((str(i) for i in range(5)), chunk_size=2)
+
+    assert capsys.readouterr().out == '0\n1\n2\n3\n4\n'
+
+
+def test_flatten() -> None:
+    assert flatten(None) == ''
+    assert flatten({'displayName': 'Kyle Fuller', 'name': 'kyle'}) == 'Kyle Fuller'
+    assert flatten({'name': 'Open', 'id': 1}) == 'Open'
+    assert flatten({'value': 'Red', 'id': '1'}) == 'Red'
+    assert flatten([{'value': 'Red'}, {'value': 'Blue'}]) == 'Red, Blue'
+    assert flatten(5.0) == '5.0'
+    assert flatten(True) == 'true'
+
+
+def test_exporter_ndjson_missing_field() -> None:
+    exporter = Exporter('ndjson', ['key', 'customfield_10000'])
+
+    assert exporter.header() == ''
+    assert exporter.export([{'key': 'GOJI-1', 'fields': {}}]) == (
+        '{"key":"GOJI-1","customfield_10000":null}\n'
+    )
+
+
+def test_exporter_csv_header_on_first_page() -> None:
+    exporter = Exporter('csv', ['summary'])
+    issue = {'key': 'GOJI-1', 'fields': {'summary': 'A'}}
+
+    assert exporter.export([issue]) == 'key,summary\nGOJI-1,A\n'
+    assert exporter.export([issue]) == 'GOJI-1,A\n'
+
+
+def test_exporter_csv_every_field() -> None:
+    exporter = Exporter('csv')
+    issues = [
+        {'key': 'GOJI-1', 'fields': {'summary': 'A', 'labels': ['x']}},
+        {'key': 'GOJI-2', 'fields': {'summary': 'B', 'labels': []}},
+    ]
+
+    assert exporter.export(issues) == 'key,labels,summary\nGOJI-1,x,A\nGOJI-2,,B\n'
@@ -0,0 +1,243 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from goji.jql import (
+    And,
+    Clause,
+    JQLError,
+    Not,
+    Or,
+    compile_query,
+    parse,
+    split_order_by,
+)
+from goji.store import IssueStore
+from tests.server import OPEN_STATUS
+
+DONE_STATUS = dict(OPEN_STATUS, name='Done')
+
+
+def issue_json(key: str, **fields):
+    fields.setdefault('summary', f'Summary of {key}')
+    fields.setdefault('status', OPEN_STATUS)
+    fields.setdefault('created', '2025-04-01T10:00:00.000+0000')
+    return {'key': key, 'fields': fields}
+
+
+@pytest.fixture(scope='module')
+def store(tmp_path_factory) -> IssueStore:
+    store = IssueStore(tmp_path_factory.mktemp('jql') / 'issues.sqlite')
+    store.save(
+        [
+            issue_json(
+                'GOJI-1',
+                assignee={
+                    'name': 'kyle',
+                    'displayName': 'Kyle Fuller',
+                    'emailAddress': 'kyle@example.com',
+                },
+                labels=['backend'],
+                customfield_10000=5,
+            ),
+            issue_json(
+                'GOJI-2',
+                summary='Fix the login page',
+                status=DONE_STATUS,
+                resolution={'id': '1', 'name': 'Fixed'},
+                resolutiondate='2025-04-10T10:00:00.000+0000',
+                created='2025-03-01T10:00:00.000+0000',
+                labels=['frontend', 'backend'],
+                customfield_10000=8,
+            ),
+            issue_json('GOJI-10', customfield_10001={'value': 'Red'}),
+            issue_json('ABC-3', assignee={'name': 'delisa', 'displayName': 'Delisa'}),
+        ]
+    )
+    yield store
+    store.close()
+
+
+def keys(store: IssueStore, query: str, **kwargs):
+    issues, total = store.search(query, **kwargs)
+    assert total == len(issues) or 'max_results' in kwargs
+    return [issue.key for issue in issues]
+
+
+def test_parse():
+    query = parse('project = GOJI AND (status = "In Progress" OR NOT labels IN (a, b))')
+
+    assert query.where == And(
+        [
+            Clause('project', '=', 'GOJI'),
+            Or(
+                [
+                    Clause('status', '=', 'In Progress'),
+                    Not(Clause('labels', 'in', ['a', 'b'])),
+                ]
+            ),
+        ]
+    )
+    assert query.order_by == []
+
+
+def test_parse_order_by():
+    query = parse('ORDER BY created DESC, key')
+
+    assert query.where is None
+    assert query.order_by == [('created', True), ('key', False)]
+
+
+def test_split_order_by():
+    assert split_order_by('project = GOJI ORDER BY key') == (
+        'project = GOJI',
+        'ORDER BY key',
+    )
+    assert split_order_by('project = GOJI') == ('project = GOJI', '')
+
+
+def test_split_order_by_without_conditions():
+    assert split_order_by('ORDER BY created DESC') == ('', 'ORDER BY created DESC')
+
+
+def test_split_order_by_ignores_strings():
+    assert split_order_by('summary ~ "order by" order by key') == (
+        'summary ~ "order by"',
+        'order by key',
+    )
+    assert split_order_by("summary ~ 'sort order by date'") == (
+        "summary ~ 'sort order by date'",
+        '',
+    )
+
+
+def test_parse_error():
+    with pytest.raises(JQLError) as exc:
+        parse('status = ')
+
+    assert exc.value.message == 'Unexpected end of JQL query'
+
+
+def test_default_order_is_by_key(store: IssueStore):
+    assert keys(store, '') == ['ABC-3', 'GOJI-1', 'GOJI-2', 'GOJI-10']
+
+
+def test_project(store: IssueStore):
+    assert keys(store, 'project = goji') == ['GOJI-1', 'GOJI-2', 'GOJI-10']
+
+
+def test_status(store: IssueStore):
+    assert keys(store, 'status = done') == ['GOJI-2']
+    assert keys(store, 'status != Done AND project = GOJI') == ['GOJI-1', 'GOJI-10']
+
+
+def test_assignee(store: IssueStore):
+    assert keys(store, 'assignee = kyle') == ['GOJI-1']
+    assert keys(store, 'assignee in ("Delisa", kyle)') == ['ABC-3', 'GOJI-1']
+    assert keys(store, 'assignee is EMPTY') == ['GOJI-2', 'GOJI-10']
+    assert keys(store, 'assignee = currentUser()', current_user='kyle') == ['GOJI-1']
+    assert keys(store, 'assignee = KYLE@example.com') == ['GOJI-1']
+
+
+def query_plan(store: IssueStore, query: str):
+    where, _, parameters = compile_query(query, 'kyle')
+    return [
+        row[3]
+        for row in store.connection.execute(
+            f'EXPLAIN QUERY PLAN SELECT json FROM issues WHERE {where}', parameters
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    'query', ['assignee = kyle', 'assignee = currentUser()', 'project = GOJI']
+)
+def test_query_uses_index(store: IssueStore, query: str):
+    plan = query_plan(store, query)
+
+    assert not any(step.startswith('SCAN') for step in plan)
+    assert any('USING INDEX' in step for step in plan)
+
+
+def test_labels(store: IssueStore):
+    assert keys(store, 'labels = backend') == ['GOJI-1', 'GOJI-2']
+    assert keys(store, 'labels not in (frontend)') == ['ABC-3', 'GOJI-1', 'GOJI-10']
+    assert keys(store, 'labels is not empty') == ['GOJI-1', 'GOJI-2']
+
+
+def test_resolution(store: IssueStore):
+    assert keys(store, 'resolution = Unresolved AND project = GOJI') == [
+        'GOJI-1',
+        'GOJI-10',
+    ]
+    assert keys(store, 'resolution = Fixed') == ['GOJI-2']
+
+
+def test_dates(store: IssueStore):
+    assert keys(store, 'created < "2025/03/15"') == ['GOJI-2']
+    assert keys(store, 'resolved >= 2025-04-10 ORDER BY key') == ['GOJI-2']
+
+    now = datetime(2025, 4, 3, tzinfo=timezone.utc)
+    where, _, parameters = compile_query('created > -7d', now=now)
+    assert where == 'created > ?'
+    assert parameters == ['2025-03-27T00:00:00+00:00']
+
+
+def test_summary_contains(store: IssueStore):
+    assert keys(store, 'summary ~ login') == ['GOJI-2']
+    assert keys(store, 'summary !~ "login" AND project = GOJI') == [
+        'GOJI-1',
+        'GOJI-10',
+    ]
+
+
+def test_customfields(store: IssueStore):
+    assert keys(store, 'cf[10000] > 6') == ['GOJI-2']
+    assert keys(store, 'customfield_10000 = 5') == ['GOJI-1']
+    assert keys(store, 'cf[10001] = Red') == ['GOJI-10']
+
+
+def test_order_by(store: IssueStore):
+    assert keys(store, 'project = GOJI ORDER BY key DESC') == [
+        'GOJI-10',
+        'GOJI-2',
+        'GOJI-1',
+    ]
+    assert keys(store, 'project = GOJI ORDER BY created, key')[0] == 'GOJI-2'
+
+
+def test_order_by_project_labels_and_customfields(store: IssueStore):
+    assert keys(store, 'project = GOJI ORDER BY project, key DESC') == [
+        'GOJI-10',
+        'GOJI-2',
+        'GOJI-1',
+    ]
+    assert keys(store, 'project = GOJI ORDER BY labels, key') == [
+        'GOJI-10',
+        'GOJI-1',
+        'GOJI-2',
+    ]
+    assert keys(store, 'project = GOJI ORDER BY description, key') == [
+        'GOJI-1',
+        'GOJI-2',
+        'GOJI-10',
+    ]
+    assert keys(store, 'project = GOJI ORDER BY cf[10000] DESC, key') == [
+        'GOJI-2',
+        'GOJI-1',
+        'GOJI-10',
+    ]
+
+
+def test_paging(store: IssueStore):
+    issues, total = store.search('project = GOJI', start_at=1, max_results=1)
+
+    assert [issue.key for issue in issues] == ['GOJI-2']
+    assert total == 3
+
+
+def test_unsupported_field(store: IssueStore):
+    with pytest.raises(JQLError) as exc:
+        store.search('watcher = kyle')
+
+    assert exc.value.message == 'Field watcher is not supported offline'
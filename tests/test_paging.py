@@ -0,0 +1,93 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from goji.paging import Keyset, PageSizer
+
+
+def test_page_sizer_starts_large() -> None:
+    assert PageSizer().size == 1000
+    assert PageSizer(initial=10, minimum=25).size == 25
+
+
+def test_page_sizer_server_cap() -> None:
+    sizer = PageSizer()
+
+    assert sizer.record(1000, 100, 100, 0.1, 10_000) == 100
+    assert sizer.maximum == 100
+
+
+def test_page_sizer_backs_off_slow_responses() -> None:
+    sizer = PageSizer(target_latency=2.0)
+
+    # 1000 issues in 10 seconds, 5 issues per second
+    assert sizer.record(1000, 1000, 1000, 10.0, 1000) == 200
+
+
+def test_page_sizer_limits_payload_size() -> None:
+    sizer = PageSizer(target_bytes=1_000_000)
+
+    # 10KB per issue
+    assert sizer.record(1000, 1000, 1000, 0.5, 10_000_000) == 100
+
+
+def test_page_sizer_limits_growth() -> None:
+    sizer = PageSizer(initial=100)
+
+    assert sizer.record(100, 100, 100, 0.01, 1000) == 200
+    assert sizer.record(200, 200, 200, 0.01, 2000) == 400
+
+
+def test_page_sizer_minimum() -> None:
+    sizer = PageSizer()
+
+    assert sizer.record(1000, 1000, 1000, 1000.0, 1000) == 25
+
+
+def test_page_sizer_history(caplog) -> None:
+    sizer = PageSizer()
+
+    with caplog.at_level(logging.DEBUG, logger='goji.paging'):
+        sizer.record(1000, 50, 50, 0.5, 5000)
+
+    assert [(sample.requested, sample.next_size) for sample in sizer.history] == [
+        (1000, 50)
+    ]
+    assert 'next page size 50' in caplog.text
+
+
+def test_page_sizer_records_pages_from_threads() -> None:
+    sizer = PageSizer(initial=100, maximum=100)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sizes = list(
+            executor.map(lambda _: sizer.record(100, 100, 100, 0.01, 1000), range(400))
+        )
+
+    assert len(sizer.history) == 400
+    assert set(sizes) == {100}
+
+
+def test_keyset_query() -> None:
+    keyset = Keyset('project in (GOJI, ABC) ORDER BY created')
+
+    assert keyset.query() == '(project in (GOJI, ABC)) ORDER BY key ASC'
+
+    keyset.advance(['ABC-1', 'ABC-2'])
+
+    assert keyset.query() == (
+        '(project in (GOJI, ABC)) AND ((project = "ABC" AND key > "ABC-2") '
+        'OR project NOT IN ("ABC")) ORDER BY key ASC'
+    )
+
+    keyset.advance(['ABC-3', 'GOJI-1'])
+
+    assert keyset.completed == ['ABC']
+    assert keyset.query() == (
+        '(project in (GOJI, ABC)) AND ((project = "GOJI" AND key > "GOJI-1") '
+        'OR project NOT IN ("ABC", "GOJI")) ORDER BY key ASC'
+    )
+
+
+def test_keyset_query_without_conditions() -> None:
+    assert Keyset('').query() == 'ORDER BY key ASC'
+    assert Keyset('ORDER BY created DESC').query() == 'ORDER BY key ASC'
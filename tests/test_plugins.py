@@ -0,0 +1,69 @@
+import sys
+from textwrap import dedent
+
+import pytest
+
+from goji import plugins
+from tests.server import JIRAServer
+
+
+@pytest.fixture()
+def plugin_path(tmp_path, monkeypatch):
+    path = tmp_path / 'plugins'
+    path.mkdir()
+    (path / 'goji_example.py').write_text(
+        dedent(
+            '''\
+            """Example plugin"""
+
+
+            def __main__(client, args):
+                print('Example', client.base_url, ' '.join(args))
+            '''
+        )
+    )
+
+    monkeypatch.syspath_prepend(str(path))
+    monkeypatch.setattr(plugins, 'index_cache', None)
+    yield path
+    sys.modules.pop('goji_example', None)
+
+
+def test_discover_plugins_uses_index(plugin_path, monkeypatch):
+    assert plugins.discover_plugins()['goji_example'] == 'goji_example'
+
+    monkeypatch.setattr(plugins, 'index_cache', None)
+    monkeypatch.setattr(plugins, 'scan_plugins', lambda: pytest.fail('rescanned'))
+
+    assert plugins.discover_plugins()['goji_example'] == 'goji_example'
+
+
+def test_discover_plugins_rescans_modified_path(plugin_path, monkeypatch):
+    plugins.discover_plugins()
+    (plugin_path / 'goji_other.py').write_text('')
+
+    assert 'goji_other' in plugins.discover_plugins()
+
+
+def test_help_lists_plugin_without_importing(invoke, plugin_path):
+    result = invoke('--help')
+
+    assert result.exit_code == 0
+    assert 'goji_example' in result.output
+    assert 'goji_example' not in sys.modules
+
+
+def test_invoke_plugin(invoke, server: JIRAServer, plugin_path):
+    result = invoke('goji_example', 'one', '--two')
+
+    assert result.exception is None
+    assert result.output == f'Example {server.url} one --two\n'
+
+
+def test_invoke_failing_plugin(invoke, plugin_path):
+    (plugin_path / 'goji_broken.py').write_text('raise ImportError("broken")')
+
+    result = invoke('goji_broken')
+
+    assert result.exit_code == 1
+    assert "Failed to load plugin goji_broken: ImportError('broken')" in result.output
@@ -0,0 +1,151 @@
+from typing import List
+
+import pytest
+
+from goji.client import JIRAClient, JIRAException
+from goji.ratelimit import RetryPolicy, TokenBucket
+from tests.server import JIRAServer, Response
+
+USER = {
+    'name': 'kyle',
+    'displayName': 'Kyle Fuller',
+    'emailAddress': 'kyle@example.com',
+}
+
+
+@pytest.fixture()
+def sleeps() -> List[float]:
+    return []
+
+
+@pytest.fixture()
+def retrying_client(server: JIRAServer, sleeps: List[float]) -> JIRAClient:
+    retry = RetryPolicy(retries=2, backoff=1, sleep=sleeps.append)
+    return JIRAClient(server.url, ('username', 'password'), retry=retry)
+
+
+def test_retries_rate_limited_request(
+    retrying_client: JIRAClient, server: JIRAServer, sleeps: List[float]
+):
+    server.response = None
+    server.responses = [
+        Response(429, {}, headers={'Retry-After': '7'}),
+        Response(200, USER),
+    ]
+
+    user = retrying_client.get_user()
+
+    assert user and user.name == 'Kyle Fuller'
+    assert len(server.requests) == 2
+    assert sleeps == [7]
+
+
+def test_retry_after_exceeds_max_backoff(server: JIRAServer, sleeps: List[float]):
+    retry = RetryPolicy(retries=1, backoff=1, max_backoff=60, sleep=sleeps.append)
+    client = JIRAClient(server.url, ('username', 'password'), retry=retry)
+    server.response = None
+    server.responses = [
+        Response(429, {}, headers={'Retry-After': '120'}),
+        Response(200, USER),
+    ]
+
+    client.get_user()
+
+    assert sleeps == [120]
+
+
+def test_retries_with_jittered_backoff(
+    retrying_client: JIRAClient, server: JIRAServer, sleeps: List[float]
+):
+    server.response = None
+    server.responses = [Response(503, {}), Response(503, {}), Response(200, USER)]
+
+    retrying_client.get_user()
+
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1
+    assert 0 <= sleeps[1] <= 2
+
+
+def test_gives_up_after_retries(
+    retrying_client: JIRAClient, server: JIRAServer, sleeps: List[float]
+):
+    server.response.status_code = 429
+    server.response.body = {'errorMessages': ['Rate limit exceeded']}
+
+    with pytest.raises(JIRAException) as exc:
+        retrying_client.get_user()
+
+    assert exc.value.status_code == 429
+    assert len(server.requests) == 3
+
+
+def test_does_not_retry_non_idempotent_request(
+    retrying_client: JIRAClient, server: JIRAServer, sleeps: List[float]
+):
+    server.response.status_code = 429
+    server.response.body = {}
+
+    with pytest.raises(JIRAException):
+        retrying_client.comment('GOJI-1', 'Hello World')
+
+    assert len(server.requests) == 1
+    assert sleeps == []
+
+
+def test_token_bucket_allows_burst_then_waits():
+    now = [0.0]
+    sleeps: List[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+
+    bucket.acquire()
+    bucket.acquire()
+    assert sleeps == []
+
+    bucket.acquire()
+    assert sleeps == [0.5]
+
+
+def test_token_bucket_pause():
+    now = [0.0]
+    sleeps: List[float] = []
+    bucket = TokenBucket(rate=10, clock=lambda: now[0], sleep=sleeps.append)
+
+    bucket.pause(3)
+    bucket.acquire()
+
+    assert sleeps == [3]
+
+
+def test_token_bucket_is_shared_per_profile():
+    bucket = TokenBucket.for_profile('shared-test', 5)
+
+    assert TokenBucket.for_profile('shared-test', 5) is bucket
+    assert TokenBucket.for_profile('other-test', 5) is not bucket
+
+
+def test_token_bucket_for_profile_updates_rate():
+    bucket = TokenBucket.for_profile('rate-test', 5)
+
+    assert TokenBucket.for_profile('rate-test', 10) is bucket
+    assert bucket.rate == 10
+    assert bucket.capacity == 10
+
+
+def test_token_bucket_set_rate():
+    now = [0.0]
+    sleeps: List[float] = []
+    bucket = TokenBucket(rate=10, clock=lambda: now[0], sleep=sleeps.append)
+
+    bucket.set_rate(2)
+
+    assert bucket.tokens == 2
+    for _ in range(3):
+        bucket.acquire()
+
+    assert sleeps == [0.5]
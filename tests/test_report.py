@@ -1,3 +1,5 @@
+import threading
+from datetime import datetime, timezone
 from io import StringIO
 
 import pytest
@@ -5,12 +7,18 @@ import pytest
 from goji.client import JIRAClient
 from goji.models import Issue
 from goji.report import (
+    BufferedOutput,
     CSS,
     IssueListWidget,
+    LeadTimeWidget,
     ReportWidget,
+    SearchWidget,
     StatisticsWidget,
+    ThroughputWidget,
     Widget,
+    generate_report,
     html_escape,
+    plan_searches,
 )
 from tests.server import JIRAServer
 
@@ -123,3 +131,328 @@ def test_statistics_widget(client: JIRAClient, server: JIRAServer):
         f'<tr><td><a href="{server.url}/issues?jql=%22assignee%22%20%3D%20%22Delisa%22">Delisa</a></td><td>1</td></tr>'
         f'</tbody><tfoot><tr><td><a href="{server.url}/issues">Total</a></td><td>1</td></tr></tfoot></table>'
     )
+
+
+def test_issue_list_widget_required_fields():
+    assert IssueListWidget.required_fields(['summary', 'assignee', 'links']) == [
+        'key',
+        'summary',
+        'assignee',
+        'links',
+    ]
+
+
+def test_search_widget_requests_displayed_fields(
+    client: JIRAClient, server: JIRAServer
+):
+    server.set_search_response()
+
+    widget = SearchWidget.from_config(
+        client, {'query': 'project = GOJI', 'fields': ['summary', 'links']}
+    )
+    widget.load()
+
+    assert [issue.key for issue in widget.issues] == ['GOJI-7']
+    assert server.last_request.body['fields'] == ['key', 'summary', 'issuelinks']
+
+
+def test_statistics_widget_requests_field(client: JIRAClient, server: JIRAServer):
+    server.set_search_response()
+    widget = StatisticsWidget(client, None, '', field='status', results=5)
+
+    widget.render(StringIO())
+
+    assert server.last_request.body['fields'] == ['status']
+
+
+class TitleWidget(Widget):
+    def __init__(self, client: JIRAClient, title: str, barrier: threading.Barrier):
+        self.barrier = barrier
+        self.loaded = False
+        super().__init__(client, title)
+
+    def load(self) -> None:
+        # Both widgets must be loading at the same time to pass the barrier
+        self.barrier.wait(timeout=5)
+        self.loaded = True
+
+    def render(self, output) -> None:
+        output.write(f'<h2>{self.title}</h2>')
+
+
+def test_report_widget_loads_widgets_concurrently(client: JIRAClient):
+    barrier = threading.Barrier(2)
+    widgets = [
+        TitleWidget(client, 'First', barrier),
+        TitleWidget(client, 'Second', barrier),
+    ]
+    report = ReportWidget('Report', widgets, concurrency=2)
+
+    output = StringIO()
+    report.render(output)
+
+    assert all(widget.loaded for widget in widgets)
+    assert '<h2>First</h2><h2>Second</h2>' in output.getvalue()
+
+
+def test_search_widget_loads_issues(client: JIRAClient, server: JIRAServer):
+    server.set_search_response()
+    widget = SearchWidget.from_config(client, {'query': 'project = GOJI'})
+
+    assert widget.issues == []
+    assert server.requests == []
+
+    widget.load()
+
+    assert [issue.key for issue in widget.issues] == ['GOJI-7']
+
+
+def test_generate_report_concurrency(client: JIRAClient):
+    report = generate_report(
+        client, StringIO('concurrency = 2\n[[widget]]\ntype = "search"\n')
+    )
+
+    assert report.concurrency == 2
+    assert len(report.widgets) == 1
+
+
+def test_generate_report_concurrency_override(client: JIRAClient):
+    report = generate_report(client, StringIO('concurrency = 2\nwidget = []\n'), 8)
+
+    assert report.concurrency == 8
+
+
+def test_plan_searches_merges_identical_queries(client: JIRAClient):
+    widgets = [
+        SearchWidget(client, None, ['summary'], {}, 'project = GOJI'),
+        StatisticsWidget(client, None, ' project = GOJI ', 'assignee', 10),
+        StatisticsWidget(client, None, 'project = OTHER', 'status', 10),
+        Widget(client, None),
+    ]
+
+    assert len(plan_searches(widgets)) == 3
+
+
+def test_report_widget_shares_searches(client: JIRAClient, server: JIRAServer):
+    server.set_search_response()
+    search = SearchWidget(client, None, ['summary'], {}, 'project = GOJI')
+    statistics = StatisticsWidget(client, None, 'project = GOJI', 'assignee', 10)
+    report = ReportWidget('Report', [search, statistics])
+
+    report.load()
+
+    assert len(server.requests) == 1
+    assert server.last_request.body['jql'] == 'project = GOJI'
+    assert server.last_request.body['fields'] == ['key', 'summary', 'assignee']
+    assert [issue.key for issue in search.issues] == ['GOJI-7']
+    assert statistics.aggregation
+    assert [
+        (key, group.count) for key, group in statistics.aggregation.most_common()
+    ] == [(('Delisa',), 1)]
+
+
+def test_statistics_widget_group_by_several_fields(
+    client: JIRAClient, server: JIRAServer
+):
+    server.set_search_response()
+    server.response.body['issues'][0]['fields']['customfield_10002'] = 3
+    widget = StatisticsWidget.from_config(
+        client,
+        {
+            'title': 'Points',
+            'field': ['status', 'assignee'],
+            'sum': ['customfield_10002'],
+            'average': ['customfield_10002'],
+        },
+    )
+
+    output = StringIO()
+    widget.render(output)
+
+    assert server.last_request.body['fields'] == [
+        'status',
+        'assignee',
+        'customfield_10002',
+    ]
+    assert output.getvalue() == (
+        '<h2>Points</h2>'
+        '<table>'
+        '<thead><tr>'
+        '<th>Status</th>'
+        '<th>Assignee</th>'
+        '<th>Count</th>'
+        '<th>Sum of customfield_10002</th>'
+        '<th>Average of customfield_10002</th>'
+        '</tr></thead>'
+        '<tbody><tr>'
+        f'<td><a href="{server.url}/issues?jql=%22status%22%20%3D%20%22Open%22%20and%20%22assignee%22%20%3D%20%22Delisa%22">Open</a></td>'
+        '<td>Delisa</td>'
+        '<td>1</td>'
+        '<td>3</td>'
+        '<td>3</td>'
+        '</tr></tbody>'
+        f'<tfoot><tr><td><a href="{server.url}/issues">Total</a></td><td></td><td>1</td><td></td><td></td></tr></tfoot>'
+        '</table>'
+    )
+
+
+def set_time_series_response(server: JIRAServer) -> None:
+    server.set_search_response()
+    server.response.body['total'] = 2
+    server.response.body['issues'] = [
+        {
+            'key': 'GOJI-1',
+            'fields': {
+                'created': '2025-04-07T10:00:00.000+0000',
+                'resolutiondate': '2025-04-15T10:00:00.000+0000',
+            },
+        },
+        {
+            'key': 'GOJI-2',
+            'fields': {
+                'created': '2025-04-08T10:00:00.000+0000',
+                'resolutiondate': '2025-04-10T10:00:00.000+0000',
+            },
+        },
+    ]
+
+
+def test_throughput_widget(client: JIRAClient, server: JIRAServer):
+    set_time_series_response(server)
+    widget = ThroughputWidget.from_config(
+        client, {'query': 'project = GOJI', 'window': 2, 'chart': False}
+    )
+
+    output = StringIO()
+    widget.render(output)
+
+    assert server.last_request.body['fields'] == ['created', 'resolutiondate']
+    assert output.getvalue() == (
+        '<h2>Throughput</h2>'
+        '<table>'
+        '<thead><tr>'
+        '<th>Week</th><th>Created</th><th>Resolved</th><th>Throughput</th>'
+        '</tr></thead>'
+        '<tbody>'
+        '<tr><td>2025-04-07</td><td>2</td><td>1</td><td>1</td></tr>'
+        '<tr><td>2025-04-14</td><td>0</td><td>1</td><td>1</td></tr>'
+        '</tbody>'
+        '</table>'
+    )
+
+
+def test_throughput_widget_chart(client: JIRAClient, server: JIRAServer):
+    set_time_series_response(server)
+    widget = ThroughputWidget(client, None, 'project = GOJI')
+
+    output = StringIO()
+    widget.render(output)
+
+    assert '<svg' in output.getvalue()
+    assert 'points="0.0,0.0 750.0,200.0"' in output.getvalue()
+
+
+def test_lead_time_widget(client: JIRAClient, server: JIRAServer):
+    set_time_series_response(server)
+    widget = LeadTimeWidget.from_config(
+        client, {'query': 'project = GOJI', 'percentiles': [50, 100]}
+    )
+
+    output = StringIO()
+    widget.render(output)
+
+    assert output.getvalue() == (
+        '<h2>Lead Time</h2>'
+        '<table>'
+        '<thead><tr><th>Percentile</th><th>Days</th></tr></thead>'
+        '<tbody>'
+        '<tr><td>50%</td><td>5</td></tr>'
+        '<tr><td>100%</td><td>8</td></tr>'
+        '</tbody>'
+        '<tfoot><tr><td>Resolved</td><td>2</td></tr></tfoot>'
+        '</table>'
+    )
+
+
+@pytest.mark.parametrize('window', [0, -1, 1.5, 'four'])
+def test_throughput_widget_invalid_window(client: JIRAClient, window):
+    with pytest.raises(ValueError) as exc:
+        ThroughputWidget.from_config(
+            client, {'query': 'project = GOJI', 'window': window}
+        )
+
+    assert str(exc.value) == f'window must be a positive number of weeks, not {window}'
+
+
+@pytest.mark.parametrize('percentile', [-1, 101, '50'])
+def test_lead_time_widget_invalid_percentiles(client: JIRAClient, percentile):
+    with pytest.raises(ValueError) as exc:
+        LeadTimeWidget.from_config(
+            client, {'query': 'project = GOJI', 'percentiles': [50, percentile]}
+        )
+
+    assert str(exc.value) == (
+        f'percentiles must be between 0 and 100, not {percentile}'
+    )
+
+
+def test_report_command_invalid_config(invoke, tmp_path):
+    path = tmp_path / 'report.toml'
+    path.write_text(
+        '[[widget]]\n'
+        'type = "lead_time"\n'
+        'query = "project = GOJI"\n'
+        'percentiles = [50, 150]\n'
+    )
+
+    result = invoke('report', str(path))
+
+    assert result.output == (
+        'Error: Invalid report. percentiles must be between 0 and 100, not 150\n'
+    )
+    assert result.exit_code == 1
+
+
+def test_buffered_output():
+    output = StringIO()
+    buffer = BufferedOutput(output, size=4)
+
+    buffer.write('ab')
+    assert output.getvalue() == ''
+
+    buffer.write('cd')
+    assert output.getvalue() == 'abcd'
+
+    buffer.write('e')
+    buffer.flush()
+    assert output.getvalue() == 'abcde'
+
+
+def test_issue_list_widget_columns(client: JIRAClient):
+    issue = Issue(
+        'GOJI-1',
+        summary='<Summary>',
+        created=datetime(2025, 4, 10, 12, 30, tzinfo=timezone.utc),
+        labels=['api', 'ui'],
+    )
+    widget = IssueListWidget(
+        client,
+        None,
+        fields=['summary', 'created', 'labels', 'assignee', 'customfield_10000'],
+        display_names={},
+        issues=[issue],
+    )
+
+    output = StringIO()
+    widget.render(output)
+
+    assert output.getvalue().endswith(
+        '<tbody><tr>'
+        '<td>&lt;Summary&gt;</td>'
+        '<td>25-04-10 12:30</td>'
+        '<td>api, ui</td>'
+        '<td>Unassigned</td>'
+        '<td></td>'
+        '</tr></tbody>'
+        '</table>'
+    )
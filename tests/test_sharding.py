@@ -0,0 +1,162 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from goji.client import JIRAClient
+from goji.models import Issue, SearchResults
+from goji.sharding import plan_shards, range_query
+from tests.server import JIRAServer, Response
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Issues created every 7 minutes, four of which are created at 01:10
+CREATED = [START + timedelta(minutes=7 * index) for index in range(40)] + [
+    START + timedelta(minutes=70, seconds=seconds) for seconds in (10, 20, 30)
+]
+
+
+def matching(query: str) -> List[int]:
+    indexes = list(range(len(CREATED)))
+
+    for operator, value in re.findall(r'created (>=|<) "([^"]+)"', query):
+        date = datetime.strptime(value, '%Y/%m/%d %H:%M').replace(tzinfo=timezone.utc)
+        if operator == '>=':
+            indexes = [index for index in indexes if CREATED[index] >= date]
+        else:
+            indexes = [index for index in indexes if CREATED[index] < date]
+
+    indexes.sort(key=lambda index: CREATED[index])
+    if 'ORDER BY created DESC' in query:
+        indexes.reverse()
+
+    return indexes
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.queries: List[str] = []
+
+    def search(
+        self, query: str, fields=None, max_results: Optional[int] = None
+    ) -> SearchResults:
+        self.queries.append(query)
+        indexes = matching(query)
+        issues = [
+            Issue(f'GOJI-{index}', created=CREATED[index])
+            for index in indexes[:max_results]
+        ]
+        return SearchResults(issues, [], 0, max_results or 50, len(indexes))
+
+
+def test_range_query() -> None:
+    assert range_query('project = GOJI', START, None, 'ORDER BY key') == (
+        '(project = GOJI) AND created >= "2025/01/01 00:00" ORDER BY key'
+    )
+    assert range_query('', None, START) == 'created < "2025/01/01 00:00"'
+
+
+def test_plan_shards_single_shard() -> None:
+    client = FakeClient()
+
+    assert [shard.query for shard in plan_shards(client, 'project = GOJI')] == [
+        'project = GOJI'
+    ]
+    assert len(client.queries) == 1
+
+
+def test_plan_shards() -> None:
+    shards = plan_shards(FakeClient(), 'project = GOJI ORDER BY key', shard_size=5)
+
+    assert all(shard.total <= 5 for shard in shards)
+    assert sum(shard.total for shard in shards) == len(CREATED)
+    assert all(shard.query.endswith(' ORDER BY key') for shard in shards)
+
+    # The outer shards are open ended
+    assert 'created >=' not in shards[0].query
+    assert 'created <' not in shards[-1].query
+
+    # Shards partition the issues
+    keys = [index for shard in shards for index in matching(shard.query)]
+    assert sorted(keys) == list(range(len(CREATED)))
+
+
+def test_plan_shards_minute_is_not_split() -> None:
+    shards = plan_shards(FakeClient(), 'project = GOJI', shard_size=2)
+
+    assert max(shard.total for shard in shards) == 4
+    assert sum(shard.total for shard in shards) == len(CREATED)
+
+
+def search_handler(duplicate: bool = False):
+    def handler(request):
+        indexes = matching(request.body['jql'])
+
+        # The first issue moves into every later shard, as if it were
+        # recreated during the search
+        if duplicate and 'created >=' in request.body['jql'] and 0 not in indexes:
+            indexes.insert(0, 0)
+
+        start_at = request.body.get('startAt', 0)
+        max_results = min(request.body.get('maxResults', 50), 4)
+        return Response(
+            200,
+            {
+                'issues': [
+                    {
+                        'key': f'GOJI-{index}',
+                        'fields': {
+                            'created': CREATED[index].isoformat(),
+                            'summary': 'Example',
+                        },
+                    }
+                    for index in indexes[start_at : start_at + max_results]
+                ],
+                'startAt': start_at,
+                'maxResults': max_results,
+                'total': len(indexes),
+            },
+        )
+
+    return handler
+
+
+def test_search_all_sharded(client: JIRAClient, server: JIRAServer) -> None:
+    server.handler = search_handler()
+
+    issues = list(
+        client.search_all('project = GOJI', ['summary'], concurrency=3, shard_size=10)
+    )
+
+    assert sorted(issue.key for issue in issues) == sorted(
+        f'GOJI-{index}' for index in range(len(CREATED))
+    )
+    assert all(request.body.get('startAt', 0) < 10 for request in server.requests)
+
+
+def test_search_all_sharded_adaptive(client: JIRAClient, server: JIRAServer) -> None:
+    server.handler = search_handler(duplicate=True)
+
+    issues = list(
+        client.search_all(
+            'project = GOJI', ['summary'], concurrency=3, adaptive=True, shard_size=10
+        )
+    )
+
+    assert sorted(issue.key for issue in issues) == sorted(
+        f'GOJI-{index}' for index in range(len(CREATED))
+    )
+    # Each shard sizes its own pages
+    assert client.page_sizers == {}
+
+
+def test_search_pages_sharded(client: JIRAClient, server: JIRAServer) -> None:
+    server.handler = search_handler(duplicate=True)
+
+    pages = list(
+        client.search_pages(
+            'project = GOJI', ['summary'], adaptive=True, shard_size=10, concurrency=3
+        )
+    )
+    keys = [issue['key'] for page in pages for issue in page['issues']]
+
+    assert sorted(keys) == sorted(f'GOJI-{index}' for index in range(len(CREATED)))
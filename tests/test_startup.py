@@ -0,0 +1,89 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+# Modules which are slow to import and only needed by some commands
+DEFERRED_MODULES = [
+    'requests',
+    'urllib3',
+    'httpx',
+    'jsonschema',
+    'toml',
+    'msgspec',
+    'orjson',
+    'sqlite3',
+    'mimetypes',
+    'concurrent.futures',
+    'goji.jql',
+    'goji.paging',
+    'goji.ratelimit',
+    'goji.report',
+    'goji.store',
+    'goji.streaming',
+    'goji.structs',
+]
+
+# Budget for running `goji --help`, as a multiple of the time taken to
+# start the interpreter. Timings vary between machines, measuring against
+# the interpreter on the same machine keeps the budget meaningful.
+STARTUP_TIME_BUDGET = 3
+
+
+def deferred_modules(script: str) -> list:
+    script += (
+        'import json, sys\n'
+        f'print(json.dumps([m for m in {DEFERRED_MODULES!r} if m in sys.modules]))\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, check=True, text=True
+    )
+
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def startup_time(env, *arguments: str) -> float:
+    """
+    Returns the time taken by a run of the interpreter, in seconds.
+    """
+
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *arguments], capture_output=True, check=True, env=env
+    )
+    return time.perf_counter() - started
+
+
+def test_import_does_not_import_deferred_modules():
+    assert deferred_modules('import goji.commands\n') == []
+
+
+def test_help_does_not_import_deferred_modules():
+    script = (
+        'from goji.commands import cli\n'
+        'try:\n'
+        '    cli(["--help"])\n'
+        'except SystemExit:\n'
+        '    pass\n'
+    )
+
+    assert deferred_modules(script) == []
+
+
+def test_help_startup_time_budget(tmp_path):
+    # Bytecode is cached as it would be for an installed package, otherwise
+    # compiling goji's modules is measured on every run
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    startup_time(env, '-m', 'goji', '--help')
+
+    # Runs are interleaved so that both are measured under the same load
+    baseline = []
+    elapsed = []
+
+    for _ in range(5):
+        baseline.append(startup_time(env, '-c', 'pass'))
+        elapsed.append(startup_time(env, '-m', 'goji', '--help'))
+
+    assert min(elapsed) < min(baseline) * STARTUP_TIME_BUDGET
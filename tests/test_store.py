@@ -0,0 +1,262 @@
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from goji.client import JIRAClient
+from goji.store import IssueStore, OfflineClient, sync, updated_since_query
+from tests.server import OPEN_STATUS, JIRAServer, Response
+
+
+def issue_json(key: str, updated: str, **fields):
+    fields.setdefault('summary', f'Summary of {key}')
+    fields.setdefault('status', OPEN_STATUS)
+    fields['updated'] = updated
+    return {'id': key.split('-')[1], 'key': key, 'fields': fields}
+
+
+def page(*issues):
+    return {
+        'issues': list(issues),
+        'startAt': 0,
+        'maxResults': 50,
+        'total': len(issues),
+    }
+
+
+@pytest.fixture()
+def store(tmp_path) -> IssueStore:
+    store = IssueStore(tmp_path / 'issues.sqlite')
+    yield store
+    store.close()
+
+
+def test_updated_since_query():
+    since = datetime(2025, 4, 12, 9, 30, tzinfo=timezone.utc)
+
+    assert updated_since_query('project = GOJI ORDER BY key', since) == (
+        '(project = GOJI) AND updated >= "2025/04/12 09:30" ORDER BY key'
+    )
+    assert updated_since_query(
+        'project = GOJI', since, ZoneInfo('Australia/Sydney')
+    ) == ('(project = GOJI) AND updated >= "2025/04/12 19:30"')
+    assert updated_since_query('ORDER BY created DESC', since) == (
+        'updated >= "2025/04/12 09:30" ORDER BY created DESC'
+    )
+
+
+def test_sync(client: JIRAClient, server: JIRAServer, store: IssueStore):
+    server.response = None
+    server.responses = [
+        Response(
+            200,
+            page(
+                issue_json(
+                    'GOJI-1',
+                    '2025-04-10T10:00:00.000+0000',
+                    labels=['one', 'two'],
+                    customfield_10000='Custom',
+                ),
+                issue_json('GOJI-2', '2025-04-12T10:00:00.000+0000'),
+            ),
+        ),
+        Response(200, {'name': 'kyle', 'timeZone': 'Australia/Sydney'}),
+        Response(
+            200,
+            page(
+                issue_json('GOJI-2', '2025-04-13T10:00:00.000+0000', summary='Updated')
+            ),
+        ),
+        Response(200, page({'key': 'GOJI-1'}, {'key': 'GOJI-2'})),
+    ]
+
+    assert sync(client, store, 'project = GOJI') == 2
+    assert server.requests[0].body == {
+        'jql': '(project = GOJI) ORDER BY key ASC',
+        'maxResults': 1000,
+    }
+
+    issue = store.get_issue('GOJI-1')
+    assert issue
+    assert issue.labels == ['one', 'two']
+    assert issue.customfields == {'customfield_10000': 'Custom'}
+    assert issue.status and issue.status.name == 'Open'
+
+    assert sync(client, store, 'project = GOJI') == 1
+    assert server.requests[1].path == '/rest/api/2/myself'
+    assert server.requests[2].body == {
+        'jql': '((project = GOJI) AND updated >= "2025/04/12 19:55") '
+        'ORDER BY key ASC',
+        'maxResults': 50,
+    }
+    assert server.requests[3].body == {
+        'jql': '(project = GOJI) ORDER BY key ASC',
+        'fields': ['key'],
+        'maxResults': 1000,
+    }
+    assert store.watermark('project = GOJI') == datetime(
+        2025, 4, 13, 10, tzinfo=timezone.utc
+    )
+
+    issues, total = store.search('project = GOJI')
+    assert total == 2
+    assert [(issue.key, issue.summary) for issue in issues] == [
+        ('GOJI-1', 'Summary of GOJI-1'),
+        ('GOJI-2', 'Updated'),
+    ]
+
+
+def test_sync_unknown_time_zone(
+    client: JIRAClient, server: JIRAServer, store: IssueStore
+):
+    updated = store.save([issue_json('GOJI-1', '2025-04-12T10:00:00.000+0000')])
+    store.set_watermark('project = GOJI', updated)
+    server.response = None
+    server.responses = [
+        Response(200, {'name': 'kyle'}),
+        Response(200, page()),
+        Response(200, page()),
+    ]
+
+    assert sync(client, store, 'project = GOJI') == 0
+    assert server.requests[1].body['jql'] == (
+        '((project = GOJI) AND updated >= "2025/04/11 10:00") ORDER BY key ASC'
+    )
+
+
+def test_sync_removes_issues_no_longer_matching(
+    client: JIRAClient, server: JIRAServer, store: IssueStore
+):
+    server.response = None
+    server.responses = [
+        Response(
+            200,
+            page(
+                issue_json('GOJI-1', '2025-04-10T10:00:00.000+0000'),
+                issue_json('GOJI-2', '2025-04-10T10:00:00.000+0000'),
+            ),
+        ),
+        Response(200, page(issue_json('GOJI-2', '2025-04-10T10:00:00.000+0000'))),
+        Response(200, {'name': 'kyle', 'timeZone': 'UTC'}),
+        Response(200, page()),
+        Response(200, page({'key': 'GOJI-1'})),
+    ]
+
+    sync(client, store, 'project = GOJI')
+    sync(client, store, 'status = Open')
+    # GOJI-2 moved out of the project, and is still matched by the status
+    sync(client, store, 'project = GOJI')
+
+    assert store.get_issue('GOJI-1')
+    assert store.get_issue('GOJI-2')
+    assert server.requests[-1].body['fields'] == ['key']
+
+    # Both issues were resolved
+    server.responses = [
+        Response(200, {'name': 'kyle', 'timeZone': 'UTC'}),
+        Response(200, page()),
+        Response(200, page()),
+    ]
+
+    sync(client, store, 'status = Open')
+
+    assert store.get_issue('GOJI-1')
+    assert store.get_issue('GOJI-2') is None
+
+
+def test_store_migrates_assignee_email(tmp_path):
+    path = tmp_path / 'issues.sqlite'
+    store = IssueStore(path)
+    store.save(
+        [
+            issue_json(
+                'GOJI-1',
+                '2025-04-10T10:00:00+0000',
+                assignee={'displayName': 'Kyle', 'emailAddress': 'kyle@example.com'},
+            )
+        ]
+    )
+    store.connection.execute('DROP INDEX issues_assignee_email')
+    store.connection.execute('ALTER TABLE issues DROP COLUMN assignee_email')
+    store.close()
+
+    store = IssueStore(path)
+    issues, _ = store.search('assignee = "kyle@example.com"')
+    store.close()
+
+    assert [issue.key for issue in issues] == ['GOJI-1']
+
+
+def test_offline_client(store: IssueStore):
+    store.save([issue_json('GOJI-1', '2025-04-10T10:00:00+0000')])
+    client = OfflineClient('https://example.atlassian.net', store)
+
+    results = client.search('project = GOJI')
+    assert [issue.key for issue in results.issues] == ['GOJI-1']
+    assert results.total == 1
+    assert client.get_issue('GOJI-1').summary == 'Summary of GOJI-1'
+
+
+def test_sync_command(invoke, server: JIRAServer):
+    server.response.body = page(issue_json('GOJI-1', '2025-04-10T10:00:00+0000'))
+
+    result = invoke('sync', 'project = GOJI')
+
+    assert result.exception is None
+    assert result.output == 'Synced 1 issues.\n'
+
+    result = invoke('--offline', 'search', 'project = GOJI', client=None)
+
+    assert result.exception is None
+    assert result.output == 'GOJI-1 Summary of GOJI-1\n'
+    assert len(server.requests) == 1
+
+
+def test_offline_search_current_user(invoke, server: JIRAServer):
+    server.response.body = page(
+        issue_json(
+            'GOJI-1',
+            '2025-04-10T10:00:00+0000',
+            assignee={'displayName': 'Kyle', 'emailAddress': 'kyle@example.com'},
+        ),
+        issue_json('GOJI-2', '2025-04-10T10:00:00+0000'),
+    )
+    invoke('sync', 'project = GOJI')
+
+    result = invoke(
+        '--offline',
+        '--email',
+        'kyle@example.com',
+        'search',
+        'assignee = currentUser()',
+        client=None,
+    )
+
+    assert result.exception is None
+    assert result.output == 'GOJI-1 Summary of GOJI-1\n'
+
+
+def test_offline_search_unsupported_query(invoke):
+    result = invoke('--offline', 'search', 'watcher = kyle', client=None)
+
+    assert result.exit_code == 1
+    assert result.output == 'Error: Field watcher is not supported offline\n'
+
+
+def test_offline_search_output(invoke, server: JIRAServer):
+    server.response.body = page(issue_json('GOJI-1', '2025-04-10T10:00:00+0000'))
+    invoke('sync', 'project = GOJI')
+
+    result = invoke(
+        '--offline',
+        'search',
+        '--output',
+        'csv',
+        '--field',
+        'summary',
+        'project = GOJI',
+        client=None,
+    )
+
+    assert result.exception is None
+    assert result.output == 'key,summary\nGOJI-1,Summary of GOJI-1\n'
@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from goji.streaming import StreamingObject
+
+PAGE = {
+    'expand': 'schema,names',
+    'startAt': 0,
+    'issues': [
+        {
+            'key': f'GOJI-{index}',
+            'fields': {
+                'summary': 'Überprüfung ' * index,
+                'labels': ['issues', 'backend'],
+                'issues': [index],
+                'customfield_10000': 1234.5,
+            },
+        }
+        for index in range(20)
+    ],
+    'maxResults': 20,
+    'total': 12345,
+}
+
+
+def chunked(content: bytes, size: int):
+    return [content[index : index + size] for index in range(0, len(content), size)]
+
+
+@pytest.mark.parametrize('size', [1, 3, 64, 100_000])
+def test_streaming_object(size: int) -> None:
+    page = StreamingObject(chunked(json.dumps(PAGE).encode('utf-8'), size), 'issues')
+
+    assert list(page) == PAGE['issues']
+    assert page.members == {
+        'expand': 'schema,names',
+        'startAt': 0,
+        'maxResults': 20,
+        'total': 12345,
+    }
+
+
+def test_streaming_object_yields_items_before_body_is_complete() -> None:
+    content = json.dumps(PAGE).encode('utf-8')
+    chunks = iter(chunked(content, 10))
+    page = iter(StreamingObject(chunks, 'issues'))
+
+    assert next(page) == PAGE['issues'][0]
+    assert len(list(chunks)) > len(content) // 20
+
+
+def test_streaming_object_empty_array() -> None:
+    page = StreamingObject([b'{"issues": [], "total": 0}'], 'issues')
+
+    assert list(page) == []
+    assert page.members == {'total': 0}
+
+
+def test_streaming_object_truncated() -> None:
+    page = StreamingObject([b'{"issues": [{"key": "GOJI-1"}, {"key"'], 'issues')
+
+    with pytest.raises(json.JSONDecodeError):
+        list(page)
+
+
+def test_streaming_object_not_object() -> None:
+    with pytest.raises(json.JSONDecodeError):
+        list(StreamingObject([b'[1, 2]'], 'issues'))
@@ -0,0 +1,166 @@
+import json
+
+import pytest
+
+from goji import decoding
+from goji.client import JIRAClient
+from goji.models import InternPool, LazyIssue, SearchResults
+from goji.structs import supports_fields, typed_search_decoder
+from tests.server import OPEN_STATUS, JIRAServer
+
+msgspec = pytest.importorskip('msgspec')
+
+FIELDS = [
+    'key',
+    'summary',
+    'description',
+    'creator',
+    'assignee',
+    'status',
+    'resolution',
+    'labels',
+    'components',
+    'issuelinks',
+    'created',
+    'resolutiondate',
+    'updated',
+    'customfield_10000',
+    'customfield_10001',
+]
+
+USER = {
+    'name': 'kyle',
+    'displayName': 'Kyle Fuller',
+    'emailAddress': 'kyle@example.com',
+    'avatarUrls': {'48x48': 'https://example.com/avatar.png'},
+}
+
+PAGE = {
+    'expand': 'schema,names',
+    'startAt': 0,
+    'maxResults': 50,
+    'total': 2,
+    'issues': [
+        {
+            'id': '10001',
+            'key': 'GOJI-1',
+            'fields': {
+                'summary': 'First Issue ',
+                'description': 'Description',
+                'creator': USER,
+                'assignee': USER,
+                'status': OPEN_STATUS,
+                'resolution': {'id': '1', 'name': 'Done', 'description': 'Done'},
+                'labels': ['backend'],
+                'components': [{'id': '1', 'name': 'API'}],
+                'issuelinks': [
+                    {
+                        'id': '1',
+                        'type': {
+                            'name': 'Blocks',
+                            'inward': 'is blocked by',
+                            'outward': 'blocks',
+                        },
+                        'outwardIssue': {
+                            'key': 'GOJI-2',
+                            'fields': {'summary': 'Second', 'status': OPEN_STATUS},
+                        },
+                    }
+                ],
+                'created': '2025-04-10T10:00:00.000+0000',
+                'resolutiondate': '2025-04-11T10:00:00.000+0000',
+                'updated': '2025-04-12T10:00:00.000+0000',
+                'customfield_10000': {'value': 'Red', 'id': '1'},
+                'customfield_10001': None,
+            },
+        },
+        {
+            'id': '10002',
+            'key': 'GOJI-2',
+            'fields': {
+                'summary': 'Second',
+                'assignee': None,
+                'status': OPEN_STATUS,
+                'resolution': None,
+            },
+        },
+    ],
+}
+
+
+@pytest.fixture(autouse=True)
+def msgspec_backend(monkeypatch) -> None:
+    monkeypatch.setattr(decoding, 'backend', None)
+    monkeypatch.setattr(decoding, 'loads', None)
+    monkeypatch.setenv('GOJI_JSON_BACKEND', 'msgspec')
+
+
+def test_typed_decoding_matches_models() -> None:
+    decode = typed_search_decoder(FIELDS)
+
+    assert decode
+    results = decode(json.dumps(PAGE).encode('utf-8'), None)
+
+    assert results == SearchResults.from_json(PAGE)
+
+
+def test_typed_decoding_interns_objects() -> None:
+    decode = typed_search_decoder(FIELDS)
+
+    assert decode
+    results = decode(json.dumps(PAGE).encode('utf-8'), InternPool())
+
+    assert results.issues[0].status is results.issues[1].status
+    assert results.issues[0].creator is results.issues[0].assignee
+
+
+def test_typed_decoding_skips_unrequested_customfields() -> None:
+    decode = typed_search_decoder(['summary', 'customfield_10001'])
+
+    assert decode
+    results = decode(json.dumps(PAGE).encode('utf-8'), None)
+
+    assert results.issues[0].customfields == {'customfield_10001': None}
+    assert results.issues[1].customfields == {}
+
+
+def test_typed_decoding_falls_back_on_unexpected_types() -> None:
+    page = {
+        'startAt': 0,
+        'maxResults': 50,
+        'total': 1,
+        'issues': [{'key': 'GOJI-1', 'fields': {'summary': 'A', 'labels': 5}}],
+    }
+    decode = typed_search_decoder(['summary', 'labels'])
+
+    assert decode
+    results = decode(json.dumps(page).encode('utf-8'), None)
+
+    assert results.issues[0].labels == 5
+
+
+def test_typed_decoding_requires_msgspec_backend(monkeypatch) -> None:
+    monkeypatch.setenv('GOJI_JSON_BACKEND', 'json')
+
+    assert typed_search_decoder(FIELDS) is None
+
+
+def test_lazy_search_skips_typed_decoding(
+    monkeypatch, client: JIRAClient, server: JIRAServer
+) -> None:
+    monkeypatch.setenv('GOJI_JSON_BACKEND', 'msgspec')
+    server.set_search_response()
+
+    eager = client.search('PROJECT = GOJI', fields=['summary'])
+    lazy = client.search('PROJECT = GOJI', fields=['summary'], lazy=True)
+
+    assert not isinstance(eager.issues[0], LazyIssue)
+    assert isinstance(lazy.issues[0], LazyIssue)
+    assert lazy.issues[0].summary == eager.issues[0].summary
+
+
+def test_supports_fields() -> None:
+    assert supports_fields(['summary', 'customfield_10000'])
+    assert not supports_fields(None)
+    assert not supports_fields(['*all'])
+    assert not supports_fields(['*navigable', '-description'])
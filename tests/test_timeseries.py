@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+from goji.models import Issue
+from goji.timeseries import TimeSeries, percentiles, rolling_mean, week_start
+
+
+def date(day: int, hour: int = 0) -> datetime:
+    return datetime(2025, 4, day, hour, tzinfo=timezone.utc)
+
+
+def test_week_start():
+    assert week_start(date(10, 15).timestamp()) == date(7).timestamp()
+    assert week_start(date(7).timestamp()) == date(7).timestamp()
+
+
+def test_rolling_mean():
+    assert list(rolling_mean([2, 4, 6, 8], 2)) == [2, 3, 5, 7]
+
+
+def test_percentiles():
+    assert percentiles([4, 1, 3, 2], [0, 50, 100]) == [1, 2.5, 4]
+    assert percentiles([], [50]) == [None]
+
+
+def test_time_series_weekly():
+    series = TimeSeries()
+    series.add(Issue('GOJI-1', created=date(7), resolutiondate=date(15)))
+    series.add(Issue('GOJI-2', created=date(8)))
+    series.add(Issue('GOJI-3', created=date(22), resolutiondate=date(23)))
+
+    weekly = series.weekly()
+
+    assert weekly.weeks == [date(7), date(14), date(21)]
+    assert list(weekly.created) == [2, 0, 1]
+    assert list(weekly.resolved) == [0, 1, 1]
+
+
+def test_time_series_weekly_without_issues():
+    assert TimeSeries().weekly().weeks == []
+
+
+def test_time_series_lead_times():
+    series = TimeSeries()
+    series.add(Issue('GOJI-1', created=date(7), resolutiondate=date(9)))
+    series.add(Issue('GOJI-2', created=date(7), resolutiondate=date(11)))
+    series.add(Issue('GOJI-3', created=date(7)))
+
+    assert series.lead_time_percentiles([50, 100]) == [3, 4]
@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+from goji.utils import prefetch, prefetch_each
+
+
+def test_prefetch() -> None:
+    assert list(prefetch(range(5))) == [0, 1, 2, 3, 4]
+
+
+def test_prefetch_runs_ahead() -> None:
+    produced = threading.Event()
+
+    def produce():
+        yield 1
+        produced.set()
+        yield 2
+
+    items = prefetch(produce())
+
+    assert next(items) == 1
+    assert produced.wait(1)
+    assert list(items) == [2]
+
+
+def test_prefetch_error() -> None:
+    def produce():
+        yield 1
+        raise ValueError('failed')
+
+    items = prefetch(produce())
+
+    assert next(items) == 1
+    with pytest.raises(ValueError, match='failed'):
+        next(items)
+
+
+def test_prefetch_each() -> None:
+    items = prefetch_each([range(3), range(3, 5), [], range(5, 7)], concurrency=2)
+
+    assert list(items) == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_prefetch_each_runs_ahead() -> None:
+    started = threading.Event()
+
+    def produce():
+        started.set()
+        yield 2
+
+    items = prefetch_each([[1], produce()], concurrency=2)
+
+    assert next(items) == 1
+    assert started.wait(1)
+    assert list(items) == [2]